@@ -0,0 +1,223 @@
+import copy
+import collections
+
+"""
+LÍNEA DE TIEMPO DE ANIMACIONES (SIN BLOQUEAR EL BUCLE)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (TRABAJOS Y DURACIONES):
+-----------------------------------------------------------------------------------------
+CLASE / LÓGICA          | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. TRABAJOS             | Pausa(ms, log)        | Deja el texto en pantalla un rato
+   (Qué se anima)       |                       | (reemplaza a pygame.time.delay).
+                        | Proyectil(...)        | Viaje lineal de origen a destino.
+                        | Impacto(...)          | Cara de dolor + icono del efecto.
+                        | - DURACION_PROYECTIL  | - Milisegundos de cada animación.
+                        | - DURACION_IMPACTO    |
+-----------------------------------------------------------------------------------------
+2. COLA                 | LineaTiempo.agregar() | Los trabajos se reproducen en orden,
+   (Uno detrás de otro) |                       | uno a la vez.
+                        | avanzar(dt)           | - main() la avanza una vez por frame
+                        |                       |   con los ms que devolvió reloj.tick.
+                        | ocupada               | - Mientras haya trabajos, el juego no
+                        |                       |   acepta acciones del combate.
+-----------------------------------------------------------------------------------------
+3. VELOCIDAD            | velocidad             | Multiplica el tiempo de TODOS los
+   (Modo turbo)         | - config.VELOCIDAD_   | trabajos: 2.0 = el doble de rápido.
+                        |   ANIMACION           | - 0 = instantáneo: no se encola nada
+                        | ciclar_velocidad()    |   y el combate avanza sin esperar.
+                        |                       | - F2 en el juego pasa a la siguiente.
+-----------------------------------------------------------------------------------------
+4. DIBUJO               | dibujar(motor, ...)   | Cada trabajo sabe pintarse con el
+                        |                       | GestorGrafico (ver dibujar_proyectil
+                        |                       | y dibujar_impacto en graficos.py).
+-----------------------------------------------------------------------------------------
+5. FOTOS DE LA ESCENA   | observar(p1, p2, jefe)| Las reglas se resuelven al instante,
+   (HUD sin adelantos)  | agregar(t, foto=...)  | pero cada trabajo se dibuja con una
+                        |                       | copia de vida/estado/escudos tomada
+                        |                       | al ENCOLARLO. Así la barra de vida
+                        |                       | baja cuando llega el Impacto, no
+                        |                       | antes. 'foto' permite encolar con
+                        |                       | una foto previa (ver turno_jefe).
+-----------------------------------------------------------------------------------------
+"""
+
+DURACION_PROYECTIL = 400  # ms (antes: 20 pasos de 20 ms).
+DURACION_IMPACTO = 500    # ms
+
+
+class Animacion:
+    """
+    Trabajo de la línea de tiempo: dura 'duracion' ms y muestra 'log' en la caja
+    de texto (None = el log actual del juego).
+    """
+    def __init__(self, duracion, log=None):
+        self.duracion = duracion
+        self.log = log
+        self.transcurrido = 0
+        self.foto = None  # (p1, p2, jefe) copiados al encolar; None = dibujar los vivos.
+
+    @property
+    def progreso(self):
+        """Fracción completada, de 0.0 a 1.0."""
+        if self.duracion <= 0:
+            return 1.0
+        return min(1.0, self.transcurrido / self.duracion)
+
+    def tomar_foto(self, originales, copias):
+        self.foto = copias
+
+    def texto(self, log_actual):
+        return self.log if self.log is not None else log_actual
+
+    def dibujar(self, motor, p1, p2, boss, log_actual):
+        motor.dibujar_escena(p1, p2, boss, self.texto(log_actual))
+
+
+class Pausa(Animacion):
+    """Solo espera con la escena quieta, para que el jugador alcance a leer."""
+    def __init__(self, duracion, log=None, esperando_espacio=False):
+        super().__init__(duracion, log)
+        self.esperando_espacio = esperando_espacio
+
+    def dibujar(self, motor, p1, p2, boss, log_actual):
+        motor.dibujar_escena(p1, p2, boss, self.texto(log_actual), esperando_espacio=self.esperando_espacio)
+
+
+class Proyectil(Animacion):
+    def __init__(self, log, origen, destino, key_img, duracion=DURACION_PROYECTIL):
+        super().__init__(duracion, log)
+        self.origen = origen
+        self.destino = destino
+        self.key_img = key_img
+
+    def posicion(self):
+        t = self.progreso
+        return (self.origen[0] + (self.destino[0] - self.origen[0]) * t,
+                self.origen[1] + (self.destino[1] - self.origen[1]) * t)
+
+    def dibujar(self, motor, p1, p2, boss, log_actual):
+        motor.dibujar_proyectil(p1, p2, boss, self.texto(log_actual), self.posicion(), self.key_img)
+
+
+class Impacto(Animacion):
+    def __init__(self, log, objetivo, tipo_efecto, duracion=DURACION_IMPACTO):
+        super().__init__(duracion, log)
+        self.objetivo = objetivo
+        self.tipo_efecto = tipo_efecto
+
+    def tomar_foto(self, originales, copias):
+        super().tomar_foto(originales, copias)
+        # graficos.py reconoce al golpeado comparándolo con p1/p2/jefe: con la foto,
+        # el objetivo tiene que ser la copia correspondiente.
+        for original, copia in zip(originales, copias):
+            if self.objetivo is original:
+                self.objetivo = copia
+
+    def dibujar(self, motor, p1, p2, boss, log_actual):
+        motor.dibujar_impacto(p1, p2, boss, self.texto(log_actual), self.objetivo, self.tipo_efecto)
+
+
+class LineaTiempo:
+    """
+    Cola de animaciones que se reproduce sin detener el bucle principal.
+
+    Las reglas del combate se resuelven al instante y encolan lo que hay que mostrar;
+    main() avanza la cola una vez por frame y dibuja el trabajo en curso. Así la
+    ventana sigue atendiendo eventos y el CPU no se queda girando en un while.
+
+    Las reglas no dependen de la cola, así que cambiar la velocidad (o saltarse
+    las animaciones) no cambia el resultado del combate. Lo que SÍ se atrasa es lo
+    que se ve: cada trabajo se dibuja con la foto tomada al encolarlo.
+    """
+    def __init__(self, velocidad=1.0):
+        self.trabajos = collections.deque()
+        self.velocidad = velocidad
+        self.entidades = None  # (p1, p2, jefe) vivos; ver observar().
+
+    def observar(self, p1, p2, jefe):
+        """Entidades a fotografiar en cada agregar() (sin esto se dibujan las vivas)."""
+        self.entidades = (p1, p2, jefe)
+
+    def foto(self):
+        """
+        Copia de lo que dibuja la escena (vida, energía, estado, escudos...) tal como
+        está ahora. Devuelve (originales, copias) o None si no hay nada que observar.
+        """
+        if self.entidades is None or self.instantanea:
+            return None
+        copias = []
+        for entidad in self.entidades:
+            copia = copy.copy(entidad)
+            copia.pila_escudo = list(entidad.pila_escudo)
+            copias.append(copia)
+        return self.entidades, tuple(copias)
+
+    @property
+    def instantanea(self):
+        return self.velocidad <= 0
+
+    def agregar(self, trabajo, foto=None):
+        """
+        Encola 'trabajo' con la foto de la escena de este momento (o con 'foto', si
+        quien llama la tomó antes de resolver las reglas).
+        """
+        if not self.instantanea:
+            foto = foto if foto is not None else self.foto()
+            if foto is not None:
+                trabajo.tomar_foto(*foto)
+            self.trabajos.append(trabajo)
+        return trabajo
+
+    def cambiar_velocidad(self, velocidad):
+        self.velocidad = velocidad
+        if self.instantanea:
+            self.limpiar()  # Lo que estaba en cola se da por visto.
+
+    def ciclar_velocidad(self, velocidades):
+        """Pasa a la velocidad que sigue a la actual en 'velocidades' y la devuelve."""
+        try:
+            i = (velocidades.index(self.velocidad) + 1) % len(velocidades)
+        except ValueError:
+            i = 0
+        self.cambiar_velocidad(velocidades[i])
+        return self.velocidad
+
+    @property
+    def ocupada(self):
+        return bool(self.trabajos)
+
+    @property
+    def actual(self):
+        return self.trabajos[0] if self.trabajos else None
+
+    def avanzar(self, dt):
+        """
+        Suma 'dt' ms (escalados por la velocidad) al trabajo en curso. Lo que sobra
+        al terminar uno pasa al siguiente, así un frame lento no alarga la secuencia.
+        """
+        dt *= self.velocidad
+        while self.trabajos and dt > 0:
+            trabajo = self.trabajos[0]
+            restante = trabajo.duracion - trabajo.transcurrido
+            if dt < restante:
+                trabajo.transcurrido += dt
+                return
+            dt -= restante
+            self.trabajos.popleft()
+        # Trabajos de duración cero (o que ya no tienen tiempo pendiente) se descartan.
+        while self.trabajos and self.trabajos[0].transcurrido >= self.trabajos[0].duracion:
+            self.trabajos.popleft()
+
+    def dibujar(self, motor, p1, p2, boss, log_actual):
+        """Dibuja el trabajo en curso. Devuelve False si no había ninguno."""
+        trabajo = self.actual
+        if trabajo is None:
+            return False
+        if trabajo.foto is not None:
+            p1, p2, boss = trabajo.foto
+        trabajo.dibujar(motor, p1, p2, boss, log_actual)
+        return True
+
+    def limpiar(self):
+        self.trabajos.clear()
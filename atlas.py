@@ -0,0 +1,131 @@
+import os
+import sys
+import json
+
+# Se puede correr sin ventana (por ejemplo en un servidor de integración).
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import config
+
+"""
+ATLAS DE TEXTURAS (PASO DE CONSTRUCCIÓN)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (EMPAQUETADO):
+-----------------------------------------------------------------------------------------
+FUNCIÓN / SECCIÓN       | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. USO                  | python atlas.py       | Carga los sprites ya escalados (la
+                        |                       | misma lista de recursos.py) y los
+                        |                       | guarda en config.RUTA_ATLAS.
+                        |                       | - Volver a correrlo al cambiar una
+                        |                       |   imagen o su tamaño en recursos.py.
+-----------------------------------------------------------------------------------------
+2. QUÉ ENTRA            | LADO_MAX_PIEZA        | Solo piezas de hasta N px por lado:
+                        |                       | personajes, iconos y estados. Los
+                        |                       | fondos y pantallas finales van sueltos.
+-----------------------------------------------------------------------------------------
+3. EMPAQUETADO          | empaquetar()          | Estantes: de la más alta a la más
+                        | - ANCHO_PAGINA        | baja, en filas de izquierda a derecha.
+                        | - SEPARACION          | Si no cabe, se abre otra página.
+-----------------------------------------------------------------------------------------
+4. SALIDA               | atlas_N.png           | Una imagen por página.
+                        | atlas.json            | clave -> página, rectángulo y de qué
+                        |                       | archivo/tamaño salió (para detectar
+                        |                       | si quedó desactualizado).
+-----------------------------------------------------------------------------------------
+"""
+
+ANCHO_PAGINA = 2048    # Ancho (y alto máximo) de cada página del atlas.
+LADO_MAX_PIEZA = 512   # Lo que sea más grande no se empaqueta.
+SEPARACION = 2         # Píxeles libres entre piezas.
+ARCHIVO_INDICE = "atlas.json"
+
+
+def empaquetar(tamanos, ancho_pagina=ANCHO_PAGINA, separacion=SEPARACION):
+    """
+    Acomoda rectángulos en páginas con el método de estantes.
+
+    Args:
+        tamanos: Diccionario clave -> (ancho, alto).
+
+    Returns:
+        (posiciones, altos) donde posiciones es clave -> (página, x, y) y altos es
+        la lista con el alto usado de cada página (para no guardar espacio vacío).
+    """
+    posiciones = {}
+    altos = [0]
+    x = y = alto_estante = 0
+    # De la más alta a la más baja: así cada estante desperdicia poco.
+    for clave in sorted(tamanos, key=lambda c: (-tamanos[c][1], -tamanos[c][0], c)):
+        ancho, alto = tamanos[clave]
+        if x + ancho > ancho_pagina:
+            # Estante nuevo.
+            y += alto_estante + separacion
+            x = alto_estante = 0
+        if y + alto > ancho_pagina:
+            # Página nueva.
+            altos.append(0)
+            x = y = alto_estante = 0
+        posiciones[clave] = (len(altos) - 1, x, y)
+        x += ancho + separacion
+        alto_estante = max(alto_estante, alto)
+        altos[-1] = max(altos[-1], y + alto)
+    return posiciones, altos
+
+
+def construir(ruta=config.RUTA_ATLAS):
+    """Genera las páginas y el índice del atlas en 'ruta'. Devuelve el índice."""
+    from recursos import AlmacenRecursos
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # convert_alpha() necesita una ventana.
+    almacen = AlmacenRecursos(usar_atlas=False, perezosa=False)
+
+    tamanos = {}
+    for clave, (archivo, tamano) in almacen.origenes.items():
+        if clave in almacen.faltantes:
+            continue  # Un placeholder magenta no se empaqueta.
+        if max(tamano) <= LADO_MAX_PIEZA:
+            tamanos[clave] = tuple(tamano)
+
+    posiciones, altos = empaquetar(tamanos)
+    paginas = [pygame.Surface((ANCHO_PAGINA, alto), pygame.SRCALPHA) for alto in altos]
+    for pagina in paginas:
+        pagina.fill((0, 0, 0, 0))
+
+    piezas = {}
+    for clave, (n, x, y) in posiciones.items():
+        # BLEND_RGBA_MAX copia también el canal alpha (un blit normal lo mezclaría).
+        paginas[n].blit(almacen.assets[clave], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        archivo, tamano = almacen.origenes[clave]
+        piezas[clave] = {
+            "pagina": n,
+            "rect": [x, y, tamano[0], tamano[1]],
+            "archivo": archivo,
+            "tamano": list(tamano),
+            "bytes": os.path.getsize(os.path.join(almacen.ruta_img, archivo)),
+        }
+
+    os.makedirs(ruta, exist_ok=True)
+    nombres = []
+    for n, pagina in enumerate(paginas):
+        nombre = f"atlas_{n}.png"
+        pygame.image.save(pagina, os.path.join(ruta, nombre))
+        nombres.append(nombre)
+
+    # Tamaño de cada página: con él recursos.py puede leerlas de la caché en disco.
+    tamanos_paginas = [list(pagina.get_size()) for pagina in paginas]
+    indice = {"paginas": nombres, "tamanos_paginas": tamanos_paginas, "piezas": piezas}
+    with open(os.path.join(ruta, ARCHIVO_INDICE), "w", encoding="utf-8") as archivo:
+        json.dump(indice, archivo, indent=4, ensure_ascii=False)
+    return indice
+
+
+if __name__ == "__main__":
+    ruta = sys.argv[1] if len(sys.argv) > 1 else config.RUTA_ATLAS
+    indice = construir(ruta)
+    empaquetadas = len(indice["piezas"])
+    print(f"Atlas: {empaquetadas} imágenes en {len(indice['paginas'])} página(s) -> {ruta}")
+    pygame.quit()
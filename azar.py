@@ -0,0 +1,84 @@
+import hashlib
+import random
+
+"""
+SERVICIO DE AZAR (FLUJOS CON SEMILLA POR SUBSISTEMA)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (REPETIR UN COMBATE):
+-----------------------------------------------------------------------------------------
+CLASE / LÓGICA          | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. FLUJOS               | flujo("arbol")        | Cada subsistema tiene su propio
+   (Un dado por sistema)| FLUJO_ARBOL, ...      | random.Random. Así, si un sistema tira
+                        |                       | un dado de más, los demás no se
+                        |                       | desfasan.
+                        |                       | - Se puede pedir uno por entidad:
+                        |                       |   flujo("arbol.Soldado 1").
+-----------------------------------------------------------------------------------------
+2. SEMILLA              | sembrar(semilla)      | Misma semilla = mismo combate, dado
+   (Repetición exacta)  | - config.SEMILLA_AZAR | por dado. None = semilla nueva.
+                        |                       | - La semilla en uso queda en .semilla
+                        |                       |   para poder repetir la partida.
+-----------------------------------------------------------------------------------------
+3. INYECCIÓN            | ServicioAzar()        | El juego usa el servicio global
+                        |                       | (servicio); el simulador y los
+                        |                       | barridos crean uno propio.
+-----------------------------------------------------------------------------------------
+"""
+
+# Nombres de los flujos que usa el juego.
+FLUJO_ARBOL = "arbol"            # Tiradas del árbol de ataque.
+FLUJO_ESTRATEGIA = "estrategia"  # Siguiente nodo del grafo de estrategia del jefe.
+FLUJO_OBJETIVO = "objetivo"      # A qué soldado ataca el jefe.
+FLUJO_JUGADOR = "jugador"        # Decisiones de la política en el simulador.
+
+
+class ServicioAzar:
+    """
+    Fábrica de generadores random.Random, uno por nombre.
+
+    La semilla de cada flujo sale de un hash de (semilla, nombre), así los flujos son
+    independientes entre sí y no dependen del orden en que se pidieron.
+    """
+    def __init__(self, semilla=None):
+        self.flujos = {}
+        self.sembrar(semilla)
+
+    def sembrar(self, semilla=None):
+        """
+        Reinicia todos los flujos con una semilla nueva (None = una al azar).
+        Los generadores se re-siembran en el mismo objeto, así que quien ya guardó
+        una referencia con flujo() sigue usando el flujo correcto.
+        """
+        if semilla is None:
+            semilla = random.SystemRandom().randrange(2 ** 32)
+        self.semilla = semilla
+        for nombre, generador in self.flujos.items():
+            generador.seed(self._semilla_flujo(nombre))
+        return semilla
+
+    def _semilla_flujo(self, nombre):
+        resumen = hashlib.sha256(f"{self.semilla}:{nombre}".encode("utf-8")).digest()
+        return int.from_bytes(resumen[:8], "big")
+
+    def flujo(self, nombre):
+        """Devuelve el generador del subsistema o entidad 'nombre' (lo crea la primera vez)."""
+        generador = self.flujos.get(nombre)
+        if generador is None:
+            generador = random.Random(self._semilla_flujo(nombre))
+            self.flujos[nombre] = generador
+        return generador
+
+
+# Servicio global del juego. Los módulos piden aquí su flujo si nadie les inyecta uno.
+servicio = ServicioAzar()
+
+
+def flujo(nombre):
+    """Atajo para servicio.flujo(nombre)."""
+    return servicio.flujo(nombre)
+
+
+def sembrar(semilla=None):
+    """Atajo para servicio.sembrar(semilla). Devuelve la semilla usada."""
+    return servicio.sembrar(semilla)
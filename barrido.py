@@ -0,0 +1,214 @@
+import os
+import time
+import itertools
+import collections
+from concurrent.futures import ProcessPoolExecutor
+import config
+from azar import ServicioAzar
+from simulador import SimuladorCombate
+
+"""
+BARRIDO DE PARÁMETROS EN PARALELO (BALANCEO POR CUADRÍCULA)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (AJUSTES Y REPARTO):
+-----------------------------------------------------------------------------------------
+FUNCIÓN / SECCIÓN       | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. RUTAS DE AJUSTE      | "PROB_ACIERTO"        | Variable suelta de config.py.
+   (Qué se puede tocar) | "NIVELES.0.boss_vida" | Índice de lista y luego clave.
+                        | "HABILIDADES_P1.      | En listas de habilidades se puede
+                        |  h_molotov.dano"      | usar el 'id' o el 'nombre'.
+-----------------------------------------------------------------------------------------
+2. CUADRÍCULA           | cuadricula(**ejes)    | Producto cartesiano de valores:
+                        |                       | cuadricula(PROB_ACIERTO=[0.7, 0.8]).
+                        |                       | - También sirve una lista de dicts.
+-----------------------------------------------------------------------------------------
+3. REPARTO              | barrer()              | Cada punto se parte en bloques de
+                        | - combates            | 'bloque' combates y los bloques se
+                        | - procesos / bloque   | reparten entre todos los núcleos.
+                        | - semilla             | - Misma semilla (y mismo bloque) =
+                        | - BLOQUE_COMBATES     |   mismos resultados, con cualquier
+                        |                       |   cantidad de núcleos.
+-----------------------------------------------------------------------------------------
+4. RESULTADOS           | barrer() -> lista     | Por punto: tasa de victoria, turnos
+                        |                       | promedio e histogramas de turnos,
+                        |                       | daño causado y daño recibido.
+-----------------------------------------------------------------------------------------
+"""
+
+# Combates por bloque. Es fijo (no depende de los núcleos) porque la semilla de
+# cada bloque sale de su posición: cambiarlo cambia los resultados de una semilla.
+BLOQUE_COMBATES = 250
+
+# ==========================================
+# AJUSTES TEMPORALES SOBRE CONFIG
+# ==========================================
+def _resolver_ruta(ruta):
+    """
+    Convierte "HABILIDADES_P1.h_molotov.dano" en (contenedor, clave) listos para
+    leer o escribir contenedor[clave]. El primer tramo es siempre un atributo de config.
+    """
+    tramos = ruta.split(".")
+    if len(tramos) == 1:
+        return config, tramos[0]
+
+    actual = getattr(config, tramos[0])
+    for tramo in tramos[1:-1]:
+        if isinstance(actual, list):
+            if tramo.lstrip("-").isdigit():
+                actual = actual[int(tramo)]
+            else:
+                # Listas de habilidades: se buscan por 'id' o por 'nombre'.
+                encontrados = [d for d in actual if d.get("id") == tramo or d.get("nombre") == tramo]
+                if not encontrados:
+                    raise KeyError(f"No hay ningún elemento '{tramo}' en la ruta '{ruta}'.")
+                actual = encontrados[0]
+        else:
+            actual = actual[tramo]
+    return actual, tramos[-1]
+
+
+def aplicar_ajustes(ajustes):
+    """
+    Escribe cada {ruta: valor} en config y devuelve lo necesario para deshacerlo.
+    Los cambios se hacen en el mismo lugar (no se copian listas), así que cualquier
+    módulo que ya tenga una referencia a esos datos también ve el valor nuevo.
+    """
+    deshacer = []
+    try:
+        for ruta, valor in ajustes.items():
+            contenedor, clave = _resolver_ruta(ruta)
+            if contenedor is config:
+                deshacer.append((contenedor, clave, getattr(config, clave)))
+                setattr(config, clave, valor)
+            else:
+                if clave not in contenedor:
+                    raise KeyError(f"La ruta '{ruta}' no existe en config.")
+                deshacer.append((contenedor, clave, contenedor[clave]))
+                contenedor[clave] = valor
+    except Exception:
+        # Una ruta mala no deja a medias las que ya se escribieron.
+        restaurar_ajustes(deshacer)
+        raise
+    return deshacer
+
+
+def restaurar_ajustes(deshacer):
+    """Devuelve config a como estaba (en orden inverso, por si dos rutas coinciden)."""
+    for contenedor, clave, valor in reversed(deshacer):
+        if contenedor is config:
+            setattr(config, clave, valor)
+        else:
+            contenedor[clave] = valor
+
+
+def cuadricula(**ejes):
+    """
+    Producto cartesiano de los valores de cada eje.
+    Como las rutas llevan puntos, se pasan desempacando un diccionario:
+        cuadricula(**{"NIVELES.0.boss_vida": [80, 100], "PROB_CRITICO": [0.1, 0.2]})
+    """
+    rutas = list(ejes)
+    return [dict(zip(rutas, valores)) for valores in itertools.product(*(ejes[r] for r in rutas))]
+
+
+# ==========================================
+# TRABAJO DE CADA PROCESO
+# ==========================================
+def _correr_bloque(tarea):
+    """
+    Juega un bloque de combates con los ajustes dados. Corre dentro de un proceso
+    hijo, así que los cambios a config no afectan a los demás bloques.
+    """
+    indice, ajustes, combates, semilla, nivel = tarea
+    deshacer = aplicar_ajustes(ajustes)
+    try:
+        # Las habilidades se copian de config al crear el simulador: se crea después de ajustar.
+        simulador = SimuladorCombate(nivel, servicio_azar=ServicioAzar(semilla))
+
+        victorias = 0
+        turnos = collections.Counter()
+        dano_causado = collections.Counter()
+        dano_recibido = collections.Counter()
+        for _ in range(combates):
+            resultado = simulador.simular()
+            if resultado.gano: victorias += 1
+            turnos[resultado.turnos] += 1
+            dano_causado[resultado.dano_causado] += 1
+            dano_recibido[resultado.dano_recibido] += 1
+    finally:
+        restaurar_ajustes(deshacer)
+
+    return indice, combates, victorias, turnos, dano_causado, dano_recibido
+
+
+def barrer(puntos, combates=1000, procesos=None, bloque=None, semilla=0, nivel=0):
+    """
+    Juega 'combates' combates en cada punto de la lista y devuelve un resumen por punto.
+
+    Args:
+        puntos: Lista de diccionarios {ruta: valor} (por ejemplo, la salida de cuadricula()).
+        combates: Combates por punto.
+        procesos: Núcleos a usar (None = todos).
+        bloque: Combates por tarea (por defecto BLOQUE_COMBATES).
+        semilla: Semilla base; cada bloque deriva la suya de (semilla, punto, bloque),
+                 así el resultado no depende de 'procesos'.
+        nivel: Índice del nivel en config.NIVELES.
+
+    Returns:
+        Lista (en el mismo orden que 'puntos') de diccionarios con 'ajustes', 'combates',
+        'victorias', 'tasa_victoria', 'turnos_promedio', 'histograma_turnos',
+        'histograma_dano_causado' y 'histograma_dano_recibido'.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    bloque = bloque or BLOQUE_COMBATES
+
+    tareas = []
+    for indice, ajustes in enumerate(puntos):
+        for numero, inicio in enumerate(range(0, combates, bloque)):
+            tareas.append((indice, ajustes, min(bloque, combates - inicio), f"{semilla}:{indice}:{numero}", nivel))
+
+    acumulados = [[0, 0, collections.Counter(), collections.Counter(), collections.Counter()] for _ in puntos]
+    # Muchas tareas chicas por envío: así 10.000 puntos no son 10.000 viajes entre procesos.
+    envio = max(1, len(tareas) // (procesos * 4))
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        for indice, n, victorias, turnos, causado, recibido in ejecutor.map(_correr_bloque, tareas, chunksize=envio):
+            acumulado = acumulados[indice]
+            acumulado[0] += n
+            acumulado[1] += victorias
+            acumulado[2].update(turnos)
+            acumulado[3].update(causado)
+            acumulado[4].update(recibido)
+
+    resultados = []
+    for ajustes, (n, victorias, turnos, causado, recibido) in zip(puntos, acumulados):
+        resultados.append({
+            "ajustes": ajustes,
+            "combates": n,
+            "victorias": victorias,
+            "tasa_victoria": victorias / n if n else 0.0,
+            "turnos_promedio": sum(t * c for t, c in turnos.items()) / n if n else 0.0,
+            "histograma_turnos": dict(sorted(turnos.items())),
+            "histograma_dano_causado": dict(sorted(causado.items())),
+            "histograma_dano_recibido": dict(sorted(recibido.items())),
+        })
+    return resultados
+
+
+if __name__ == "__main__":
+    puntos = cuadricula(**{
+        "PROB_ACIERTO": [0.7, 0.8, 0.9],
+        "NIVELES.0.boss_vida": [80, 100, 120],
+        "HABILIDADES_P1.h_molotov.dano": [30, 40],
+    })
+    combates = 2000
+
+    inicio = time.perf_counter()
+    resultados = barrer(puntos, combates)
+    duracion = time.perf_counter() - inicio
+
+    for r in resultados:
+        ajustes = ", ".join(f"{ruta}={valor}" for ruta, valor in r["ajustes"].items())
+        print(f"{ajustes:<70} victoria {r['tasa_victoria'] * 100:5.1f}%  turnos {r['turnos_promedio']:5.1f}")
+    total = len(puntos) * combates
+    print(f"\n{len(puntos)} puntos x {combates} combates en {duracion:.1f} s ({total / duracion:,.0f} combates/s)")
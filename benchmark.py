@@ -0,0 +1,219 @@
+import os
+import io
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import statistics
+import tempfile
+import contextlib
+
+# El benchmark de dibujo corre sin ventana: SDL usa drivers "dummy" de video y audio.
+# Tiene que definirse ANTES de importar pygame.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import config
+import azar
+import fuentes
+from entidades import Personaje, Boss
+from estructuras import ArbolAtaque, GrafoEfectos, GrafoEstrategia
+from sistema_guardado import SistemaGuardado
+
+"""
+BENCHMARKS DE LOS CAMINOS CALIENTES (MEDIR ANTES DE OPTIMIZAR)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (CASOS Y COMPARACIÓN):
+-----------------------------------------------------------------------------------------
+FUNCIÓN / SECCIÓN       | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. CASOS                | preparar_casos()      | Diccionario nombre -> función sin
+                        |                       | argumentos que se mide con timeit.
+                        |                       | - Para medir algo nuevo, agregar
+                        |                       |   una entrada aquí.
+-----------------------------------------------------------------------------------------
+2. MEDICIÓN             | medir()               | timeit.autorange() elige cuántas
+                        | - REPETICIONES        | llamadas por ronda; se guarda la
+                        |                       | mejor ronda y la mediana (µs/llamada).
+-----------------------------------------------------------------------------------------
+3. RESULTADOS / BASE    | --salida, --base      | Se escriben en JSON. Con una base
+                        | --guardar-base        | guardada se compara cada caso.
+                        | --tolerancia          | - Más lento que base*(1+tol) = falla
+                        |                       |   (código de salida 1).
+-----------------------------------------------------------------------------------------
+4. USO                  | python benchmark.py   | Corre todo y compara con la base.
+                        | --solo arbol prim     | Solo los casos que contengan esos
+                        |                       | textos en su nombre.
+-----------------------------------------------------------------------------------------
+"""
+
+ARCHIVO_RESULTADOS = "benchmark_resultados.json"
+ARCHIVO_BASE = "benchmark_base.json"
+REPETICIONES = 5
+SEMILLA = 1234  # Misma semilla en cada corrida: mismas ramas, menos ruido.
+
+
+def preparar_casos():
+    """
+    Arma los objetos que usa cada caso y devuelve {nombre: función sin argumentos}.
+    Todo lo caro (cargar imágenes, crear grafos) se hace aquí, fuera de la medición.
+    """
+    azar.sembrar(SEMILLA)
+    casos = {}
+
+    # --- ÁRBOL DE ATAQUE ---
+    casos["arbol.ejecutar_ataque"] = lambda: ArbolAtaque.ejecutar_ataque(config.P1_ATAQUE)
+
+    # --- GRAFO DE ESTRATEGIA (PRIM) ---
+    estrategia = GrafoEstrategia()
+    jefe = Boss("Jefe", 100, 15, 100, [])
+    jefe.vida_actual = 60
+    casos["estrategia.aplicar_prim"] = lambda: estrategia.aplicar_prim("A", jefe)
+    casos["estrategia.seleccionar_siguiente_ataque"] = lambda: estrategia.seleccionar_siguiente_ataque(jefe)
+
+    # --- GRAFO DE EFECTOS ---
+    efectos = GrafoEfectos()
+    casos["efectos.transicion"] = lambda: efectos.transicion("Normal", "fuego")
+
+    # --- DAÑO (PILA DE ESCUDOS) ---
+    soldado = Personaje(config.P1_NOMBRE, config.P1_VIDA_MAX, config.P1_ATAQUE, config.P1_ENERGIA_MAX, config.HABILIDADES_P1)
+    def recibir_dano():
+        soldado.vida_actual = soldado.vida_max
+        soldado.recibir_dano(10)
+    casos["personaje.recibir_dano"] = recibir_dano
+
+    # --- GUARDADO (EN UN ARCHIVO TEMPORAL) ---
+    carpeta = tempfile.mkdtemp(prefix="benchmark_")
+    guardado = SistemaGuardado(os.path.join(carpeta, "partida.json"))
+    p2 = Personaje(config.P2_NOMBRE, config.P2_VIDA_MAX, config.P2_ATAQUE, config.P2_ENERGIA_MAX, config.HABILIDADES_P2)
+    with contextlib.redirect_stdout(io.StringIO()):
+        guardado.guardar_partida(soldado, p2, jefe, True, 0)  # Para que cargar_partida tenga qué leer.
+    casos["guardado.guardar_partida"] = lambda: guardado.guardar_partida(soldado, p2, jefe, True, 0)
+    casos["guardado.cargar_partida"] = guardado.cargar_partida
+
+    # --- DIBUJO (SUPERFICIE SIN VENTANA) ---
+    pygame.init()
+    pantalla = pygame.display.set_mode((config.ANCHO, config.ALTO))
+    from graficos import GestorGrafico
+    motor = GestorGrafico(pantalla)
+    log = "Turno: Soldado 1\n¡Golpe directo!\nDonald T. recibió 20 de daño."
+    casos["graficos.dibujar_interfaz"] = lambda: motor.dibujar_interfaz(soldado, p2, jefe, log)
+    # Frame en reposo del bucle principal: nada cambió, así que no debería dibujar nada.
+    motor.dibujar_escena(soldado, p2, jefe, log)
+    casos["graficos.dibujar_escena_sin_cambios"] = lambda: motor.dibujar_escena(soldado, p2, jefe, log)
+    casos["graficos.dibujar_menu"] = motor.dibujar_menu
+    casos["graficos.dibujar_menu_pausa"] = lambda: motor.dibujar_menu_pausa(1, False)
+    casos["graficos.dibujar_victoria"] = lambda: motor.dibujar_victoria(soldado, p2, jefe)
+    casos["graficos.dibujar_barras_vida"] = lambda: motor.dibujar_barras_vida(soldado, p2, jefe)
+    # Frame de animación: escena + proyectil, todo por el lote (Surface.blits).
+    casos["graficos.dibujar_proyectil"] = lambda: motor.dibujar_proyectil(soldado, p2, jefe, log, (600, 300), 'proy_disparo')
+
+    # --- ARRANQUE DEL ALMACÉN: perezoso (solo anota la lista) contra cargarlo todo ---
+    from recursos import AlmacenRecursos
+    casos["recursos.arranque_perezoso"] = lambda: AlmacenRecursos(perezosa=True)
+    casos["recursos.arranque_completo"] = lambda: AlmacenRecursos(perezosa=False)
+
+    # --- FUENTES: lo que costaba cada SysFont dentro del frame contra el registro ---
+    casos["fuentes.sysfont_directo"] = lambda: pygame.font.SysFont("Arial", 18, bold=True)
+    casos["fuentes.registro"] = lambda: fuentes.obtener("Arial", 18, negrita=True)
+
+    return casos
+
+
+def medir(funcion):
+    """
+    Mide una función con timeit. Devuelve µs por llamada (mejor ronda y mediana).
+    """
+    temporizador = timeit.Timer(funcion)
+    llamadas, _ = temporizador.autorange()
+    rondas = temporizador.repeat(repeat=REPETICIONES, number=llamadas)
+    por_llamada = [r / llamadas * 1e6 for r in rondas]
+    return {
+        "us_por_llamada": min(por_llamada),
+        "mediana_us": statistics.median(por_llamada),
+        "llamadas": llamadas,
+    }
+
+
+def correr(filtros=None):
+    """Corre los casos (todos o los que contengan algún filtro) y devuelve el JSON de resultados."""
+    casos = preparar_casos()
+    resultados = {}
+    # Los print del guardado ("Partida guardada...") no deben ensuciar ni medir la consola.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for nombre, funcion in casos.items():
+            if filtros and not any(f in nombre for f in filtros):
+                continue
+            resultados[nombre] = medir(funcion)
+
+    return {
+        "fecha": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "maquina": platform.machine(),
+        "casos": resultados,
+    }
+
+
+def comparar(actual, base, tolerancia):
+    """
+    Imprime la tabla de resultados contra la base.
+    Devuelve la lista de casos que quedaron más lentos que base * (1 + tolerancia).
+    """
+    regresiones = []
+    casos_base = base["casos"] if base else {}
+    print(f"{'CASO':<42} {'µs/llamada':>12} {'BASE':>12} {'CAMBIO':>9}")
+    for nombre, datos in actual["casos"].items():
+        valor = datos["us_por_llamada"]
+        anterior = casos_base.get(nombre)
+        if anterior is None:
+            print(f"{nombre:<42} {valor:>12.3f} {'-':>12} {'-':>9}")
+            continue
+
+        razon = valor / anterior["us_por_llamada"]
+        marca = ""
+        if razon > 1.0 + tolerancia:
+            marca = "  MÁS LENTO"
+            regresiones.append(nombre)
+        elif razon < 1.0 - tolerancia:
+            marca = "  más rápido"
+        print(f"{nombre:<42} {valor:>12.3f} {anterior['us_por_llamada']:>12.3f} {(razon - 1) * 100:>+8.1f}%{marca}")
+    return regresiones
+
+
+def escribir_json(ruta, datos):
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(datos, archivo, indent=4, ensure_ascii=False)
+
+
+def leer_json(ruta):
+    if not os.path.exists(ruta):
+        return None
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks de los caminos calientes del juego.")
+    parser.add_argument("--solo", nargs="*", help="Solo los casos cuyo nombre contenga alguno de estos textos.")
+    parser.add_argument("--salida", default=ARCHIVO_RESULTADOS, help="JSON donde se guardan los resultados.")
+    parser.add_argument("--base", default=ARCHIVO_BASE, help="JSON de referencia para comparar.")
+    parser.add_argument("--guardar-base", action="store_true", help="Guarda esta corrida como la nueva base.")
+    parser.add_argument("--tolerancia", type=float, default=0.15, help="Margen de ruido permitido (0.15 = 15%%).")
+    argumentos = parser.parse_args()
+
+    actual = correr(argumentos.solo)
+    escribir_json(argumentos.salida, actual)
+
+    regresiones = comparar(actual, leer_json(argumentos.base), argumentos.tolerancia)
+    if argumentos.guardar_base:
+        escribir_json(argumentos.base, actual)
+        print(f"\nBase guardada en {argumentos.base}")
+    pygame.quit()
+
+    if regresiones:
+        print(f"\n{len(regresiones)} caso(s) más lentos que la base: {', '.join(regresiones)}")
+        sys.exit(1)
@@ -0,0 +1,126 @@
+import atexit
+import collections
+import logging
+
+"""
+BITÁCORA DE DEPURACIÓN (LOGS POR SUBSISTEMA)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (NIVELES Y SALIDAS):
+-----------------------------------------------------------------------------------------
+FUNCIÓN / SECCIÓN       | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. SUBSISTEMAS          | SUBSISTEMAS           | Nombres de los canales de log:
+                        |                       | "arbol", "efectos", "ia", "estrategia".
+                        | obtener("arbol")      | - Devuelve el logger de ese canal.
+-----------------------------------------------------------------------------------------
+2. NIVELES              | configurar(niveles)   | {"arbol": "DEBUG", "ia": "INFO", ...}
+                        |                       | - WARNING (por defecto) = silencio.
+                        |                       | - Se ajusta desde config.NIVELES_LOG.
+-----------------------------------------------------------------------------------------
+3. BUFFER CIRCULAR      | BufferCircular        | Guarda los últimos N mensajes en RAM
+   (Post-mortem)        | volcar_buffer()       | para volcarlos a un archivo al salir
+                        |                       | o cuando algo falla.
+-----------------------------------------------------------------------------------------
+REGLA DE USO EN CÓDIGO CALIENTE:
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Dado obtenido: %.3f", roll)
+Con el canal apagado no se formatea ningún texto ni se arma ningún diccionario.
+-----------------------------------------------------------------------------------------
+"""
+
+RAIZ = "juego"
+SUBSISTEMAS = ("arbol", "efectos", "ia", "estrategia")
+
+# Todos los canales cuelgan de un logger raíz propio. Por defecto está en WARNING,
+# así que los mensajes de depuración no cuestan nada hasta que alguien los activa.
+_raiz = logging.getLogger(RAIZ)
+_raiz.setLevel(logging.WARNING)
+_raiz.propagate = False
+
+_consola = None
+_buffer = None
+# El volcado al salir se registra en atexit UNA sola vez; configurar() solo cambia
+# a qué archivo va (llamarla varias veces no apila volcados).
+_archivo_volcado = None
+_volcado_registrado = False
+
+
+class BufferCircular(logging.Handler):
+    """
+    Destino de logs en memoria con tamaño fijo (deque con maxlen).
+    Guardamos el registro crudo y solo lo formateamos al volcarlo.
+    """
+    def __init__(self, capacidad=500):
+        super().__init__()
+        self.registros = collections.deque(maxlen=capacidad)
+
+    def emit(self, registro):
+        self.registros.append(registro)
+
+    def lineas(self):
+        return [self.format(r) for r in self.registros]
+
+
+def obtener(subsistema):
+    """Logger del canal pedido (ej. obtener("arbol") -> 'juego.arbol')."""
+    return logging.getLogger(f"{RAIZ}.{subsistema}")
+
+
+def configurar(niveles=None, consola=True, capacidad_buffer=0, archivo_volcado=None):
+    """
+    Ajusta el nivel de cada canal y las salidas.
+
+    Args:
+        niveles: {subsistema: "DEBUG"/"INFO"/"WARNING"...}. Los que falten quedan en WARNING.
+        consola: Si es True, los mensajes activos se imprimen en la terminal.
+        capacidad_buffer: Si es > 0, además se guardan en un BufferCircular de ese tamaño.
+        archivo_volcado: Si hay buffer, se vuelca a este archivo al cerrar el programa.
+    """
+    global _consola, _buffer, _archivo_volcado, _volcado_registrado
+    niveles = niveles or {}
+
+    for nombre in SUBSISTEMAS:
+        nivel = niveles.get(nombre, "WARNING")
+        obtener(nombre).setLevel(getattr(logging, nivel) if isinstance(nivel, str) else nivel)
+
+    if _consola is not None:
+        _raiz.removeHandler(_consola)
+        _consola = None
+    if consola:
+        # Mismo aspecto que los print de antes: solo el mensaje.
+        _consola = logging.StreamHandler()
+        _consola.setFormatter(logging.Formatter("%(message)s"))
+        _raiz.addHandler(_consola)
+
+    if _buffer is not None:
+        _raiz.removeHandler(_buffer)
+        _buffer = None
+    _archivo_volcado = None
+    if capacidad_buffer > 0:
+        _buffer = BufferCircular(capacidad_buffer)
+        _buffer.setFormatter(logging.Formatter("%(relativeCreated)9.0f ms [%(name)s] %(message)s"))
+        _raiz.addHandler(_buffer)
+        _archivo_volcado = archivo_volcado
+        if archivo_volcado and not _volcado_registrado:
+            atexit.register(_volcar_al_salir)
+            _volcado_registrado = True
+
+
+def _volcar_al_salir():
+    """Lo llama atexit: vuelca el buffer al archivo de la última configuración."""
+    if _archivo_volcado:
+        volcar_buffer(_archivo_volcado)
+
+
+def volcar_buffer(ruta=None):
+    """
+    Devuelve las líneas guardadas en el buffer circular y, si se da una ruta,
+    las escribe en ese archivo.
+    """
+    if _buffer is None:
+        return []
+    lineas = _buffer.lineas()
+    if ruta:
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("\n".join(lineas) + "\n")
+    return lineas
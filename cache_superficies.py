@@ -0,0 +1,119 @@
+import os
+import hashlib
+import pygame
+
+"""
+CACHÉ EN DISCO DE IMÁGENES YA ESCALADAS
+
+GUÍA RÁPIDA DE MODIFICACIÓN (CACHÉ DE ARRANQUE):
+-----------------------------------------------------------------------------------------
+CLASE / LÓGICA          | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. QUÉ GUARDA           | guardar()             | Los píxeles crudos (RGBA) de la imagen
+                        |                       | ya escalada, con pygame.image.tobytes.
+                        |                       | - Leerlos es mucho más rápido que
+                        |                       |   decodificar el PNG y escalarlo.
+-----------------------------------------------------------------------------------------
+2. NOMBRE DEL ARCHIVO   | huella()              | Hash del CONTENIDO del PNG + tamaño
+                        | - VERSION_FORMATO     | pedido. Si cambia la imagen o el
+                        |                       | tamaño, el nombre es otro y se vuelve
+                        |                       | a generar solo.
+                        |                       | - Subir VERSION_FORMATO invalida todo.
+-----------------------------------------------------------------------------------------
+3. LECTURA              | cargar()              | pygame.image.frombuffer sobre los bytes
+                        |                       | leídos. None si no existe o está roto.
+                        | - leer() / convertir()| - Las dos mitades de cargar(): leer()
+                        |                       |   no usa pygame (sirve en el hilo de
+                        |                       |   precarga); convertir() va en el
+                        |                       |   hilo principal (convert_alpha).
+-----------------------------------------------------------------------------------------
+4. LIMPIEZA             | Borrar la carpeta     | config.RUTA_CACHE_SUPERFICIES; se
+                        |                       | vuelve a llenar en el próximo arranque.
+-----------------------------------------------------------------------------------------
+"""
+
+VERSION_FORMATO = 1
+FORMATO_PIXELES = "RGBA"
+EXTENSION = ".rgba"
+
+
+class CacheSuperficies:
+    """
+    Carpeta de superficies pre-escaladas, una por (contenido del PNG, tamaño).
+
+    El nombre de cada archivo sale del hash del PNG original, así que nunca hay
+    que invalidar a mano: una imagen nueva (o un tamaño distinto) simplemente no
+    encuentra su archivo y se genera otro. Los archivos viejos quedan sin usar.
+    """
+    def __init__(self, ruta):
+        self.ruta = ruta
+        self.aciertos = 0
+        self.fallos = 0
+
+    def huella(self, ruta_imagen, tamano):
+        """Nombre del archivo de caché para esa imagen a ese tamaño."""
+        h = hashlib.sha1()
+        with open(ruta_imagen, "rb") as archivo:
+            h.update(archivo.read())
+        h.update(f"|{tamano[0]}x{tamano[1]}|{FORMATO_PIXELES}|v{VERSION_FORMATO}".encode())
+        return h.hexdigest() + EXTENSION
+
+    def cargar(self, ruta_imagen, tamano):
+        """
+        Devuelve (superficie, huella). La superficie es None si no estaba en caché;
+        la huella sirve para guardarla después sin volver a leer el PNG.
+        """
+        datos, nombre = self.leer(ruta_imagen, tamano)
+        if nombre is None:
+            return None, None  # Sin el PNG no hay nada que comparar.
+        return self.convertir(datos, tamano), nombre
+
+    def leer(self, ruta_imagen, tamano):
+        """
+        Lee los píxeles guardados sin tocar pygame (se puede llamar desde otro hilo).
+        Devuelve (bytes o None, huella).
+        """
+        try:
+            nombre = self.huella(ruta_imagen, tamano)
+        except OSError:
+            return None, None
+        try:
+            with open(os.path.join(self.ruta, nombre), "rb") as archivo:
+                datos = archivo.read()
+        except OSError:
+            return None, nombre
+        if len(datos) != tamano[0] * tamano[1] * 4:
+            return None, nombre  # Archivo a medias o de otra versión.
+        return datos, nombre
+
+    def convertir(self, datos, tamano):
+        """
+        Superficie lista para dibujar a partir de lo que devolvió leer() (None = fallo).
+        Usa convert_alpha(): llamarla desde el hilo principal.
+        """
+        if datos is None:
+            self.fallos += 1
+            return None
+        try:
+            superficie = pygame.image.frombuffer(datos, tamano, FORMATO_PIXELES).convert_alpha()
+        except pygame.error:
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        return superficie
+
+    def guardar(self, nombre, superficie):
+        """Escribe los píxeles de 'superficie' con ese nombre. Si falla, solo avisa."""
+        try:
+            os.makedirs(self.ruta, exist_ok=True)
+            destino = os.path.join(self.ruta, nombre)
+            temporal = destino + ".tmp"
+            with open(temporal, "wb") as archivo:
+                archivo.write(pygame.image.tobytes(superficie, FORMATO_PIXELES))
+            # Se renombra al final para que un corte a la mitad no deje un archivo a medias.
+            os.replace(temporal, destino)
+        except OSError as e:
+            print(f"[ALERTA] No se pudo guardar la caché de imágenes: {e}")
+
+    def estadisticas(self):
+        return {"aciertos": self.aciertos, "fallos": self.fallos}
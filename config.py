@@ -1,5 +1,3 @@
-import pygame
-
 """
 ARCHIVO DE CONFIGURACIÓN (CONSTANTES)
 
@@ -21,6 +19,9 @@ SECCIÓN                 | VARIABLE(S) BUSCAR    | ACCIÓN / CÓMO MODIFICAR
                         | HABILIDADES_P2 (Lista)| - 'dano': Potencia (negativo cura).
                         |                       | - 'costo': Energía requerida.
                         |                       | - 'desc': Texto descriptivo.
+                        |                       | - 'arbol': (Opcional) árbol de suerte
+                        |                       |   propio, mismo formato que
+                        |                       |   estructuras.datos_arbol_ataque().
 -----------------------------------------------------------------------------------------
 6. MATEMÁTICAS (AZAR)   | PROB_ACIERTO          | Probabilidad base (0.0 a 1.0).
                         | PROB_CRITICO          | Probabilidad de golpe x1.5.
@@ -32,6 +33,27 @@ SECCIÓN                 | VARIABLE(S) BUSCAR    | ACCIÓN / CÓMO MODIFICAR
 8. TEXTOS (FLAVOR)      | FRASES_EXITO,         | Añadir/Editar frases aleatorias
                         | FRASES_FALLO, BOSS    | dentro de las comillas " ".
 -----------------------------------------------------------------------------------------
+9. DEPURACIÓN (LOGS)    | NIVELES_LOG           | "DEBUG" para ver las trazas de un
+                        |                       | subsistema, "WARNING" para callarlo.
+                        | CAPACIDAD_BUFFER_LOG  | > 0 guarda los últimos N mensajes y
+                        |                       | los vuelca a ARCHIVO_VOLCADO_LOG.
+                        | SEMILLA_AZAR          | Número fijo = repetir una partida.
+                        | MOSTRAR_PERFILADOR    | Overlay de tiempos por frame (F3) y
+                        | ARCHIVO_TRAZA_FRAMES  | traza CSV (F4), ver perfilador.py.
+-----------------------------------------------------------------------------------------
+10. ANIMACIONES         | VELOCIDAD_ANIMACION   | 1.0 normal, 2.0 turbo, 0 instantáneo
+    (Y MODO INACTIVO)   |                       | (F2 cambia en el juego).
+                        | MODO_INACTIVO         | Dormir mientras se espera una tecla.
+                        | ESPERA_INACTIVO_MAX   | Máximo de ms dormido sin eventos.
+-----------------------------------------------------------------------------------------
+11. CARGA DE IMÁGENES   | USAR_ATLAS            | Sprites desde el atlas (atlas.py).
+                        | USAR_CACHE_SUPERFICIES| Imágenes ya escaladas en disco
+                        |                       | (cache_superficies.py).
+                        | CARGA_PEREZOSA        | Imágenes al primer uso + precarga
+                        |                       | de fondo en el menú.
+                        | RUTA_MANIFIESTO       | Lista de imágenes (recursos.py).
+                        | PRESUPUESTO_MEMORIA_MB| Tope de memoria de imágenes.
+-----------------------------------------------------------------------------------------
 """
 
 # ==========================================
@@ -249,4 +271,69 @@ FRASES_BOSS = [
 
 # --- SONIDOS ---
 RUTA_MUSICA = "sonidos/batalla.mp3"
-RUTA_SFX_START = "sonidos/intro.wav"
\ No newline at end of file
+RUTA_SFX_START = "sonidos/intro.wav"
+
+# ==========================================
+# 9. DEPURACIÓN (LOGS POR SUBSISTEMA)
+# ==========================================
+# Cada subsistema de estructuras.py tiene su propio nivel (ver bitacora.py).
+# "WARNING" lo deja en silencio y sin costo; "INFO" muestra solo los cambios
+# de estado; "DEBUG" muestra todas las trazas (dados del árbol, Prim, etc).
+NIVELES_LOG = {
+    "arbol": "WARNING",
+    "efectos": "WARNING",
+    "ia": "WARNING",
+    "estrategia": "WARNING",
+}
+CAPACIDAD_BUFFER_LOG = 0            # 0 = sin buffer en memoria.
+ARCHIVO_VOLCADO_LOG = "bitacora_volcado.txt"
+
+# Semilla de los dados (ver azar.py). None = una distinta en cada partida;
+# poner la que se imprimió al arrancar para repetir exactamente ese combate.
+SEMILLA_AZAR = None
+
+# Perfilador de frames (ver perfilador.py). F3 muestra/oculta el overlay con los
+# percentiles; F4 guarda los últimos CAPACIDAD_PERFILADOR frames en un CSV.
+MOSTRAR_PERFILADOR = False
+CAPACIDAD_PERFILADOR = 600          # ~10 segundos a 60 FPS.
+ARCHIVO_TRAZA_FRAMES = "traza_frames.csv"
+
+# ==========================================
+# 10. ANIMACIONES Y MODO INACTIVO
+# ==========================================
+# Velocidad de las animaciones (ver animaciones.py). 1.0 = normal, 2.0 = el doble de
+# rápido y 0 = instantáneo (se saltan; útil para pruebas automáticas). El resultado
+# del combate es el mismo a cualquier velocidad. F2 recorre VELOCIDADES_ANIMACION.
+VELOCIDAD_ANIMACION = 1.0
+VELOCIDADES_ANIMACION = [1.0, 2.0, 4.0, 0]
+
+# Modo inactivo: mientras el juego solo espera una tecla (menú, pausa, fin de partida
+# o ">> ESPACIO"), el bucle duerme en pygame.event.wait en vez de redibujar a FPS.
+# Se despierta con cualquier evento, con el parpadeo del aviso o, como mucho,
+# cada ESPERA_INACTIVO_MAX ms.
+MODO_INACTIVO = True
+ESPERA_INACTIVO_MAX = 1000
+
+# ==========================================
+# 11. CARGA DE IMÁGENES (ATLAS, CACHÉ, MEMORIA)
+# ==========================================
+# Atlas de texturas (ver atlas.py): los sprites chicos empaquetados en pocas imágenes.
+# Se arma con 'python atlas.py'; si no existe, las imágenes se cargan sueltas.
+USAR_ATLAS = True
+RUTA_ATLAS = "sprites_finales/atlas/"
+
+# Caché en disco de imágenes ya escaladas (ver cache_superficies.py). Se llena sola
+# en el primer arranque; borrar la carpeta es seguro.
+USAR_CACHE_SUPERFICIES = True
+RUTA_CACHE_SUPERFICIES = "sprites_finales/cache/"
+
+# Carga perezosa (ver recursos.py): cada imagen se lee la primera vez que se usa y un
+# hilo precarga las de la batalla mientras se ve el menú. False = todo al arrancar.
+CARGA_PEREZOSA = True
+
+# Manifiesto de imágenes (archivo, tamaño, grupo y prioridad de cada una).
+RUTA_MANIFIESTO = "sprites_finales/manifiesto.json"
+# Tope de memoria para las imágenes cargadas y las capas que graficos.py arma con
+# ellas (0 = sin límite). Al pasarse, se desalojan las de grupos no fijos (pantallas
+# finales) empezando por la menos usada.
+PRESUPUESTO_MEMORIA_MB = 32
\ No newline at end of file
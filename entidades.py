@@ -29,6 +29,8 @@ CLASE / SECCIÓN         | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
 -----------------------------------------------------------------------------------------
 """
 
+from estructuras import ArbolCompilado
+
 class Habilidad:
     """
     Clase que encapsula la lógica de una acción de combate.
@@ -48,6 +50,10 @@ class Habilidad:
         self.tipo = datos_dict.get("tipo", "NORMAL")
         self.codigo_efecto = datos_dict["efecto_code"] # Clave para el motor de efectos.
 
+        # Árbol de suerte propio (opcional). Se compila una sola vez aquí;
+        # si no hay, el combate usa el árbol por defecto de estructuras.py.
+        self.arbol = ArbolCompilado(datos_dict["arbol"]) if "arbol" in datos_dict else None
+
 
 class Personaje:
     """
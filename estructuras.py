@@ -1,6 +1,10 @@
-import random
+import logging
 import config
 import heapq
+import bisect
+import numbers
+import bitacora
+import azar
 
 """
 LÓGICA MATEMÁTICA Y DE DECISIONES (CEREBRO DEL JUEGO)
@@ -9,15 +13,21 @@ GUÍA RÁPIDA DE MODIFICACIÓN (REGLAS Y COMPORTAMIENTO):
 -----------------------------------------------------------------------------------------
 CLASE / LÓGICA          | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
 -----------------------------------------------------------------------------------------
-1. ÁRBOL DE COMBATE     | ArbolAtaque ->        | Define la jerarquía de suerte.
-   (Suerte/RNG)         | construir_arbol()     | - Cambiar orden de 'probabilidad_limite'
+1. ÁRBOL DE COMBATE     | datos_arbol_ataque()  | Define la jerarquía de suerte (datos).
+   (Suerte/RNG)         |                       | - Cambiar orden de las preguntas 'prob'
                         |                       |   para priorizar Críticos o Fallos.
-                        |                       | - Editar 'resultado_base' para cambiar
+                        |                       | - Editar 'resultado' para cambiar
                         |                       |   mensajes o multiplicadores (x1.5).
+                        | ArbolCompilado        | - Lo aplana en una tabla de alias:
+                        |                       |   sorteo O(1) con cualquier nº de hojas.
+                        | ejecutar_ataque(rng=) | - Los dados salen de azar.py (flujo
+                        |                       |   "arbol") o del generador inyectado.
 -----------------------------------------------------------------------------------------
 2. REACCIONES ELEM.     | GrafoEfectos ->       | Define qué estado vence a cuál.
    (Máquina Estados)    | construir_grafo_juego | - agregar_arista("Origen", "Evento", "Destino")
                         |                       |   Ej: Que 'Agua' quite 'Fuego'.
+                        | compilar()            | - Tabla de enteros estado x evento
+                        |                       |   (TablaTransiciones.aplicar_lote).
 -----------------------------------------------------------------------------------------
 3. PERSONALIDAD BOSS    | GrafoEstados ->       | Define los bonus pasivos del jefe.
    (Estados Emocionales)| self.bonus_estados    | - Editar diccionarios:
@@ -35,15 +45,25 @@ CLASE / LÓGICA          | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
                         |                       |   (Peso BAJO = Alta prob. de combo).
                         |-----------------------|----------------------------------------
                         | seleccionar_...()     | Algoritmo de decisión (Prim).
-                        |                       | Modificar 'score' para hacer la IA
+                        | _calcular_decision()  | Modificar 'score' para hacer la IA
                         |                       | más o menos inteligente.
+                        |                       | (Se memoriza por nodo + elegibles).
+                        | GrafoEstrategia(rng)  | - Tirada con el flujo "estrategia".
 -----------------------------------------------------------------------------------------
 5. DEBUG / CONSOLA      | imprimir_debug_ia()   | Función global al final.
-                        |                       | Comenta los 'print' si quieres
-                        |                       | limpiar la consola de texto.
+                        | log_arbol, log_ia...  | Los niveles se cambian en
+                        |                       | config.NIVELES_LOG (ver bitacora.py).
 -----------------------------------------------------------------------------------------
 """
 
+# Canales de log de este módulo (ver bitacora.py). Apagados por defecto: cada traza
+# se protege con isEnabledFor, así que sin depuración no se formatea ningún texto.
+log_arbol = bitacora.obtener("arbol")
+log_efectos = bitacora.obtener("efectos")
+log_ia = bitacora.obtener("ia")
+log_estrategia = bitacora.obtener("estrategia")
+DEBUG = logging.DEBUG
+
 # ==========================================
 # PAQUETE DE DATOS AUXILIAR
 # ==========================================
@@ -82,6 +102,8 @@ class NodoDecision:
         # Enlaces a los siguientes nodos (las ramas del árbol).
         self.izquierda = None  # Camino afirmativo / éxito.
         self.derecha = None    # Camino negativo / fallo.
+        # Nodo de varias ramas: lista de (probabilidad, hijo) en lugar de SÍ/NO.
+        self.ramas = None
         
         # Si este nodo es una hoja (final del camino), aquí guardamos el resultado.
         self.resultado_base = resultado_base 
@@ -90,56 +112,170 @@ class NodoDecision:
         """
         Nos dice si hemos llegado al final de una rama y ya tenemos un resultado.
         """
-        return self.izquierda is None and self.derecha is None
+        return self.izquierda is None and self.derecha is None and not self.ramas
+
+def datos_arbol_ataque():
+    """
+    Árbol de ataque por defecto escrito como DATOS (diccionarios anidados).
+
+    Formato de cada nodo:
+      - Pregunta binaria: {"nombre", "prob", "si": nodo, "no": nodo}
+      - Varias ramas:     {"nombre", "ramas": [(peso, nodo), ...]}
+      - Hoja:             {"nombre", "resultado": (TIPO, mensaje, valor)}
+
+    Se lee config.py en cada llamada para respetar cambios de balance en caliente.
+    """
+    return {
+        "nombre": "Acierta?", "prob": config.PROB_ACIERTO,
+        # Rama del éxito: Si ya acertamos, verificamos si es un golpe crítico.
+        "si": {
+            "nombre": "Es Crítico?", "prob": config.PROB_CRITICO,
+            "si": {"nombre": "Crítico", "resultado": ("CRITICO", "¡GOLPE CRÍTICO!", config.MULT_CRITICO)},
+            "no": {"nombre": "Normal", "resultado": ("NORMAL", "Ataque Efectivo", 1.0)}, # 1.0 = 100% del daño base
+        },
+        # Rama del fallo: Si fallamos, verificamos si fue un error catastrófico (tropiezo).
+        "no": {
+            "nombre": "Es Tropiezo?", "prob": config.PROB_TROPIEZO,
+            "si": {"nombre": "Tropiezo", "resultado": ("TROPIEZO", "¡Te lastimaste!", config.DANO_TROPIEZO)},
+            "no": {"nombre": "Nada", "resultado": ("FALLO", "Fallaste.", 0)}, # 0 daño
+        },
+    }
+
+def peso_total_ramas(nodo):
+    """Suma de los pesos de un nodo de varias ramas (ValueError si no hay nada que repartir)."""
+    total = sum(peso for peso, _ in nodo["ramas"])
+    if total <= 0:
+        raise ValueError(f"El nodo '{nodo['nombre']}' no tiene ramas con peso positivo.")
+    return total
+
+
+class ArbolCompilado:
+    """
+    Versión 'aplanada' de un árbol de decisión declarado como datos.
+
+    Al compilar multiplicamos las probabilidades de cada camino para saber con qué
+    probabilidad se llega a cada hoja, y armamos una tabla de alias (método de Vose).
+    Así, sortear un resultado cuesta siempre lo mismo (una tirada y una comparación)
+    sin importar la profundidad ni la cantidad de hojas, y no se crea ningún objeto.
+    """
+    def __init__(self, datos):
+        self.nombres = []     # Nombre de cada hoja (para depurar).
+        self.hojas = []       # Tupla resultado_base de cada hoja.
+        self.probabilidades = []
+        self._aplanar(datos, 1.0)
+
+        total = sum(self.probabilidades)
+        if total <= 0:
+            raise ValueError("El árbol no tiene ninguna hoja alcanzable.")
+        self.probabilidades = [p / total for p in self.probabilidades]
+
+        self.n = len(self.hojas)
+        self.umbral, self.alias = self._tabla_alias(self.probabilidades)
+
+    def _aplanar(self, nodo, prob_camino):
+        """Recorre el árbol una sola vez acumulando la probabilidad de cada camino."""
+        if "resultado" in nodo:
+            self.nombres.append(nodo["nombre"])
+            self.hojas.append(nodo["resultado"])
+            self.probabilidades.append(prob_camino)
+        elif "ramas" in nodo:
+            total = peso_total_ramas(nodo)
+            for peso, hijo in nodo["ramas"]:
+                self._aplanar(hijo, prob_camino * peso / total)
+        else:
+            p = min(max(nodo["prob"], 0.0), 1.0)
+            self._aplanar(nodo["si"], prob_camino * p)
+            self._aplanar(nodo["no"], prob_camino * (1.0 - p))
+
+    @staticmethod
+    def _tabla_alias(probabilidades):
+        """Método de Vose: cada casilla guarda su umbral y la hoja 'alias' que la completa."""
+        n = len(probabilidades)
+        escaladas = [p * n for p in probabilidades]
+        umbral = [1.0] * n
+        alias = list(range(n))
+
+        pequenas = [i for i, p in enumerate(escaladas) if p < 1.0]
+        grandes = [i for i, p in enumerate(escaladas) if p >= 1.0]
+        while pequenas and grandes:
+            chica = pequenas.pop()
+            grande = grandes.pop()
+            umbral[chica] = escaladas[chica]
+            alias[chica] = grande
+            escaladas[grande] = (escaladas[grande] + escaladas[chica]) - 1.0
+            if escaladas[grande] < 1.0:
+                pequenas.append(grande)
+            else:
+                grandes.append(grande)
+        # Lo que queda (por redondeo) se queda con umbral 1.0: siempre elige su propia hoja.
+        return umbral, alias
+
+    def indice(self, dado=None):
+        """Devuelve el índice de la hoja sorteada. 'dado' es un número en [0, 1)."""
+        if dado is None:
+            dado = azar.flujo(azar.FLUJO_ARBOL).random()
+        u = dado * self.n
+        i = int(u)
+        if i >= self.n: i = self.n - 1
+        return i if (u - i) < self.umbral[i] else self.alias[i]
+
+    def muestrear(self, dado=None):
+        """Devuelve la tupla resultado_base de la hoja sorteada (la misma tupla, sin copias)."""
+        return self.hojas[self.indice(dado)]
+
+    def distribucion(self):
+        """{nombre_hoja: probabilidad}, útil para revisar el balance."""
+        return dict(zip(self.nombres, self.probabilidades))
 
 class ArbolAtaque:
     """
     Esta clase gestiona la lógica de 'suerte' del combate.
-    Construye y recorre un árbol binario donde cada nivel es una tirada de dados.
+    Construye y recorre un árbol (preguntas de SÍ/NO o de varias ramas) donde cada nivel es una tirada de dados.
     """
-    def __init__(self):
+    # Caché del árbol por defecto compilado. La clave son los valores de config.py
+    # que lo definen, así un cambio de balance en caliente lo recompila solo.
+    _compilado_base = None
+    _clave_base = None
+
+    def __init__(self, datos=None, rng=None):
         # Al instanciar la clase, armamos la estructura del árbol en memoria.
+        self.datos = datos if datos is not None else datos_arbol_ataque()
+        # Generador de los dados de recorrer() (por defecto, el flujo "arbol" de azar.py).
+        self.rng = rng if rng is not None else azar.flujo(azar.FLUJO_ARBOL)
         self.raiz = self.construir_arbol()
 
     def construir_arbol(self):
         """
-        Aquí definimos la topología del árbol. Es donde 'cableamos' las reglas del juego.
-        Conectamos nodos de decisión con nodos hoja (resultados finales).
+        Aquí convertimos los datos del árbol en nodos enlazados (NodoDecision).
+        Esta versión en nodos solo se usa para recorrerlo paso a paso y depurar;
+        para jugar se usa la versión compilada.
         """
-        # 1. Definición de los resultados posibles (Hojas del árbol)
-        # Estos son los puntos finales a los que queremos llegar.
-        
-        hoja_critico = NodoDecision("Crítico", 
-                                    resultado_base=("CRITICO", "¡GOLPE CRÍTICO!", config.MULT_CRITICO))
-        
-        hoja_normal = NodoDecision("Normal", 
-                                   resultado_base=("NORMAL", "Ataque Efectivo", 1.0)) # 1.0 = 100% del daño base
-        
-        hoja_tropiezo = NodoDecision("Tropiezo", 
-                                     resultado_base=("TROPIEZO", "¡Te lastimaste!", config.DANO_TROPIEZO))
-        
-        hoja_nada = NodoDecision("Nada", 
-                                 resultado_base=("FALLO", "Fallaste.", 0)) # 0 daño
-        
-        # 2. Construcción de las ramas intermedias (Nodos de decisión)
-        
-        # Rama del éxito: Si ya acertamos, verificamos si es un golpe crítico.
-        nodo_tipo_exito = NodoDecision("Es Crítico?", probabilidad_limite=config.PROB_CRITICO)
-        nodo_tipo_exito.izquierda = hoja_critico  
-        nodo_tipo_exito.derecha = hoja_normal     
-
-        # Rama del fallo: Si fallamos, verificamos si fue un error catastrófico (tropiezo).
-        nodo_tipo_fallo = NodoDecision("Es Tropiezo?", probabilidad_limite=config.PROB_TROPIEZO)
-        nodo_tipo_fallo.izquierda = hoja_tropiezo 
-        nodo_tipo_fallo.derecha = hoja_nada       
-
-        # 3. Nodo Raíz (El inicio de todo)
-        # La primera pregunta es simplemente: ¿Logramos conectar el golpe?
-        raiz = NodoDecision("Acierta?", probabilidad_limite=config.PROB_ACIERTO)
-        raiz.izquierda = nodo_tipo_exito # Si sí, vamos a evaluar si es crítico.
-        raiz.derecha = nodo_tipo_fallo   # Si no, vamos a evaluar si nos tropezamos.
-
-        return raiz
+        return self.construir_nodo(self.datos)
+
+    def construir_nodo(self, datos):
+        if "resultado" in datos:
+            return NodoDecision(datos["nombre"], resultado_base=datos["resultado"])
+        if "ramas" in datos:
+            # Igual que ArbolCompilado: los pesos se normalizan para que sumen 1.
+            total = peso_total_ramas(datos)
+            nodo = NodoDecision(datos["nombre"])
+            nodo.ramas = [(peso / total, self.construir_nodo(hijo)) for peso, hijo in datos["ramas"]]
+            return nodo
+
+        nodo = NodoDecision(datos["nombre"], probabilidad_limite=datos["prob"])
+        nodo.izquierda = self.construir_nodo(datos["si"])  # Camino afirmativo.
+        nodo.derecha = self.construir_nodo(datos["no"])    # Camino negativo.
+        return nodo
+
+    @classmethod
+    def compilado_base(cls):
+        """Devuelve el árbol por defecto ya compilado (solo se recompila si cambia config)."""
+        clave = (config.PROB_ACIERTO, config.PROB_CRITICO, config.PROB_TROPIEZO,
+                 config.MULT_CRITICO, config.DANO_TROPIEZO)
+        if clave != cls._clave_base:
+            cls._compilado_base = ArbolCompilado(datos_arbol_ataque())
+            cls._clave_base = clave
+        return cls._compilado_base
 
     def recorrer(self, nodo_actual):
         """
@@ -149,41 +285,72 @@ class ArbolAtaque:
         # Caso base: Si el nodo no tiene hijos, es una hoja. Devolvemos el resultado.
         if nodo_actual.es_hoja():
             res = nodo_actual.resultado_base
-            print(f"   └── [HOJA LLEGADA]: {nodo_actual.nombre} -> {res[0]} (Mult: {res[2]})")
-            print("-" * 40)
+            if log_arbol.isEnabledFor(DEBUG):
+                log_arbol.debug("   └── [HOJA LLEGADA]: %s -> %s (Mult: %s)", nodo_actual.nombre, res[0], res[2])
+                log_arbol.debug("-" * 40)
             return res
         
         # Generamos un número aleatorio entre 0.0 y 1.0 (nuestro 'dado').
-        roll = random.random()
+        roll = self.rng.random()
         
         # Imprimimos trazas para poder depurar la lógica en la consola.
-        print(f"[ÁRBOL] Pregunta: '{nodo_actual.nombre}'")
-        print(f"        Probabilidad necesaria: <= {nodo_actual.valor_probabilidad}")
-        print(f"        Dado obtenido: {roll:.3f}")
-        
+        depurando = log_arbol.isEnabledFor(DEBUG)
+        if depurando:
+            log_arbol.debug("[ÁRBOL] Pregunta: '%s'", nodo_actual.nombre)
+            log_arbol.debug("        Probabilidad necesaria: <= %s", nodo_actual.valor_probabilidad)
+            log_arbol.debug("        Dado obtenido: %.3f", roll)
+        
+        # Varias ramas: bajamos por la primera cuya probabilidad acumulada supere el dado.
+        if nodo_actual.ramas:
+            acumulado = 0.0
+            for prob, hijo in nodo_actual.ramas:
+                acumulado += prob
+                if roll < acumulado:
+                    break
+            if depurando: log_arbol.debug("        Respuesta: rama '%s'", hijo.nombre)
+            return self.recorrer(hijo)
+
         # Lógica de bifurcación: Comparamos el dado con la probabilidad del nodo.
         if roll <= nodo_actual.valor_probabilidad:
-            print("        Respuesta: SÍ -> Rama Izquierda")
+            if depurando: log_arbol.debug("        Respuesta: SÍ -> Rama Izquierda")
             return self.recorrer(nodo_actual.izquierda)
         else:
-            print("        Respuesta: NO -> Rama Derecha")
+            if depurando: log_arbol.debug("        Respuesta: NO -> Rama Derecha")
             return self.recorrer(nodo_actual.derecha)
 
     @staticmethod
-    def ejecutar_ataque(atacante_atk):
+    def ejecutar_ataque(atacante_atk, arbol=None, rng=None):
         """
         Método estático de fachada. Simplifica el uso del árbol para el resto del código.
-        Instancia el árbol, lo recorre y empaqueta el resultado final.
+        Sortea una hoja del árbol compilado (el de la habilidad o el de por defecto)
+        y empaqueta el resultado final. 'rng' es el generador del dado (por defecto,
+        el flujo "arbol" de azar.py).
+        """
+        compilado = arbol if arbol is not None else ArbolAtaque.compilado_base()
+        i = compilado.indice(rng.random() if rng is not None else None)
+
+        if log_arbol.isEnabledFor(DEBUG):
+            res = compilado.hojas[i]
+            log_arbol.debug("\n" + "="*40)
+            log_arbol.debug(" INICIANDO CÁLCULO DE ÁRBOL DE DECISIÓN")
+            log_arbol.debug("="*40)
+            log_arbol.debug("   └── [HOJA SORTEADA]: %s -> %s (Mult: %s)", compilado.nombres[i], res[0], res[2])
+            log_arbol.debug("-" * 40)
+
+        return ArbolAtaque.empaquetar(compilado.hojas[i], atacante_atk)
+
+    def resolver(self, atacante_atk):
+        """
+        Recorre este árbol de nodos paso a paso y empaqueta el resultado.
         """
-        print("\n" + "="*40)
-        print(" INICIANDO CÁLCULO DE ÁRBOL DE DECISIÓN")
-        print("="*40)
-        
-        arbol = ArbolAtaque()
-        
         # Iniciamos la recursión desde la raíz.
-        resultado_tupla = arbol.recorrer(arbol.raiz)
-        
+        return ArbolAtaque.empaquetar(self.recorrer(self.raiz), atacante_atk)
+
+    @staticmethod
+    def empaquetar(resultado_tupla, atacante_atk):
+        """
+        Convierte la tupla cruda de una hoja en un ResultadoAtaque con el daño final.
+        """
         # Desempaquetamos la tupla cruda que devuelve el nodo hoja.
         tipo = resultado_tupla[0]
         mensaje = resultado_tupla[1]
@@ -210,6 +377,73 @@ class ArbolAtaque:
 # ==========================================
 # MÁQUINA DE ESTADOS (GRAFO)
 # ==========================================
+class TablaTransiciones:
+    """
+    Versión 'compilada' de un grafo de estados: en vez de diccionarios anidados con
+    textos, una tabla densa de enteros (estado x evento -> estado).
+
+    Cada estado y cada evento recibe un número. La columna SIN_EVENTO (la 0) representa
+    cualquier evento sin arista: deja el estado como está. Así, una transición es una
+    sola lectura de lista y se pueden mover muchas entidades a la vez con aplicar_lote().
+    """
+    SIN_EVENTO = 0
+
+    def __init__(self, lista_adyacencia):
+        self.estados = list(lista_adyacencia)
+        self.id_estado = {nombre: i for i, nombre in enumerate(self.estados)}
+
+        self.eventos = [None]
+        for adyacentes in lista_adyacencia.values():
+            for evento in adyacentes:
+                if evento not in self.eventos:
+                    self.eventos.append(evento)
+        self.id_evento = {nombre: i for i, nombre in enumerate(self.eventos) if nombre is not None}
+
+        # Tabla aplanada por filas: tabla[estado * n_eventos + evento] = estado destino.
+        # Por defecto cada casilla apunta a su propio estado (no hay arista).
+        self.n_eventos = len(self.eventos)
+        self.tabla = [e for e in range(len(self.estados)) for _ in range(self.n_eventos)]
+        for origen, adyacentes in lista_adyacencia.items():
+            fila = self.id_estado[origen] * self.n_eventos
+            for evento, destino in adyacentes.items():
+                self.tabla[fila + self.id_evento[evento]] = self.id_estado[destino]
+
+        self._tabla_np = None
+
+    def codificar_evento(self, evento):
+        """Número del evento; los eventos desconocidos (ej. "fisico") caen en SIN_EVENTO."""
+        return self.id_evento.get(evento, self.SIN_EVENTO)
+
+    def transicion(self, estado_id, evento_id):
+        """Igual que GrafoEfectos.transicion, pero con números y sin imprimir nada."""
+        return self.tabla[estado_id * self.n_eventos + evento_id]
+
+    def aplicar_lote(self, estados, eventos):
+        """
+        Aplica eventos a muchas entidades de una vez.
+
+        Args:
+            estados: Secuencia de ids de estado (lista o arreglo de NumPy).
+            eventos: Un solo id de evento para todos (int o escalar de NumPy), o una
+                     secuencia del mismo largo.
+
+        Returns:
+            Los nuevos ids de estado, del mismo tipo que la entrada (lista o arreglo).
+        """
+        if hasattr(estados, "dtype"):
+            # Camino vectorizado: NumPy solo se importa si alguien nos pasa arreglos.
+            if self._tabla_np is None:
+                import numpy as np
+                self._tabla_np = np.array(self.tabla, dtype=np.int32).reshape(len(self.estados), self.n_eventos)
+            return self._tabla_np[estados, eventos]
+
+        tabla = self.tabla
+        n = self.n_eventos
+        # numbers.Integral también acepta escalares de NumPy (np.int64, etc.).
+        if isinstance(eventos, numbers.Integral):
+            return [tabla[e * n + eventos] for e in estados]
+        return [tabla[e * n + ev] for e, ev in zip(estados, eventos)]
+
 class GrafoEfectos:
     """
     Controla cómo los personajes cambian de estado (ej. de Normal a Quemado)
@@ -219,6 +453,7 @@ class GrafoEfectos:
         # Usamos un diccionario de adyacencia para representar el grafo.
         # Clave: Estado Origen -> Valor: {Evento -> Estado Destino}
         self.lista_adyacencia = {}
+        self._tabla = None # Versión compilada (ver compilar()).
         self.construir_grafo_juego()
 
     def agregar_vertice(self, estado):
@@ -231,6 +466,13 @@ class GrafoEfectos:
         self.agregar_vertice(origen)
         self.agregar_vertice(destino)
         self.lista_adyacencia[origen][evento] = destino
+        self._tabla = None # Cambió el grafo: hay que recompilar.
+
+    def compilar(self):
+        """Devuelve la TablaTransiciones de este grafo (se arma una sola vez)."""
+        if self._tabla is None:
+            self._tabla = TablaTransiciones(self.lista_adyacencia)
+        return self._tabla
 
     def construir_grafo_juego(self):
         """
@@ -270,9 +512,9 @@ class GrafoEfectos:
             if evento in adyacentes:
                 nuevo_estado = adyacentes[evento]
         if nuevo_estado != estado_actual:
-            print(f"[GRAFO] Transición: {estado_actual} + [{evento}] ---> {nuevo_estado}")
+            log_efectos.info("[GRAFO] Transición: %s + [%s] ---> %s", estado_actual, evento, nuevo_estado)
         else:
-            print(f"[GRAFO] Intento fallido: {estado_actual} + [{evento}] (No hay arista)")
+            log_efectos.debug("[GRAFO] Intento fallido: %s + [%s] (No hay arista)", estado_actual, evento)
             
         return nuevo_estado
 
@@ -286,6 +528,7 @@ class GrafoEstados:
     def __init__(self):
         # Se usa el mismo sistema de lista de adyacencia que GrafoEfectos
         self.lista_adyacencia = {}
+        self._tabla = None
         self.construir_grafo_comportamiento()
         self.estado_actual = "NORMAL" 
         self.bonus_estados = {
@@ -306,6 +549,13 @@ class GrafoEstados:
         self.agregar_vertice(origen)
         self.agregar_vertice(destino)
         self.lista_adyacencia[origen][evento] = destino
+        self._tabla = None
+
+    def compilar(self):
+        """Devuelve la TablaTransiciones del grafo de humor (se arma una sola vez)."""
+        if self._tabla is None:
+            self._tabla = TablaTransiciones(self.lista_adyacencia)
+        return self._tabla
 
     def construir_grafo_comportamiento(self):
         # 1. Transiciones desde NORMAL (Estado Base)
@@ -337,7 +587,7 @@ class GrafoEstados:
             if evento in adyacentes:
                 nuevo_estado = adyacentes[evento]
         if nuevo_estado != estado_actual:
-            print(f"[IA TRUMP] Cambio de Humor: {estado_actual} + [{evento}] ---> {nuevo_estado}")
+            log_ia.info("[IA TRUMP] Cambio de Humor: %s + [%s] ---> %s", estado_actual, evento, nuevo_estado)
         
         return nuevo_estado
 
@@ -370,7 +620,8 @@ class GrafoEstados:
         
         # Le paso todos los datos a la impresora 
         # (incluyendo la variable estado_anterior que acabamos de crear).
-        imprimir_debug_ia("ESTADO", (boss, evento, estado_anterior, nuevo))
+        if log_ia.isEnabledFor(DEBUG):
+            imprimir_debug_ia("ESTADO", (boss, evento, estado_anterior, nuevo))
     def obtener_bonificadores(self):
         return self.bonus_estados.get(self.estado_actual, {"ataque": 1.0, "defensa": 1.0})
 
@@ -390,9 +641,15 @@ class NodoEstrategia:
         self.conexiones = {} 
 
 class GrafoEstrategia:
-    def __init__(self):
+    def __init__(self, rng=None):
         self.nodos = {}
         self.nodo_actual = "A"
+        # Generador de la tirada ponderada (por defecto, el flujo "estrategia" de azar.py).
+        self.rng = rng if rng is not None else azar.flujo(azar.FLUJO_ESTRATEGIA)
+        # Memoria de decisiones: (nodo actual, máscara de elegibles) -> opciones ya evaluadas.
+        self._cache_decisiones = {}
+        self._bits_nodos = None
+        self._mascaras = {}  # (vida_actual, vida_max) del jefe -> máscara de elegibles
         self.construir_grafo()
 
     def construir_grafo(self):
@@ -430,6 +687,17 @@ class GrafoEstrategia:
     def conectar(self, origen, destinos_dict):
         for dest, peso in destinos_dict.items():
             self.nodos[origen].conexiones[dest] = peso
+        # Cambió el grafo: las decisiones memorizadas ya no valen.
+        self.invalidar_cache()
+
+    def invalidar_cache(self):
+        """
+        Borra las decisiones memorizadas. Se llama sola desde conectar(); si editas
+        self.nodos a mano después de construir el grafo, llámala tú.
+        """
+        self._cache_decisiones = {}
+        self._bits_nodos = None
+        self._mascaras = {}
 
     def nodo_es_elegible(self, codigo_nodo, boss):
         """
@@ -447,19 +715,45 @@ class GrafoEstrategia:
             
         return True
 
+    def mascara_elegibles(self, boss):
+        """
+        Resume en un entero qué nodos son elegibles ahora (un bit por nodo).
+        Es la 'firma' de la situación del jefe: con el mismo nodo actual y la misma
+        máscara, Prim y los scores dan exactamente lo mismo.
+
+        nodo_es_elegible solo mira la vida (costo_hp y vida llena), así que la máscara
+        se calcula una vez por (vida_actual, vida_max) y después es una búsqueda.
+        """
+        clave = (boss.vida_actual, boss.vida_max)
+        mascara = self._mascaras.get(clave)
+        if mascara is None:
+            if self._bits_nodos is None:
+                self._bits_nodos = [(codigo, 1 << i) for i, codigo in enumerate(self.nodos)]
+            mascara = 0
+            for codigo, bit in self._bits_nodos:
+                if self.nodo_es_elegible(codigo, boss):
+                    mascara |= bit
+            self._mascaras[clave] = mascara
+        return mascara
+
     def aplicar_prim(self, nodo_inicio, boss):
         """
         Algoritmo de Prim para evaluar el Recorrido Óptimo (MST).
         Retorna la lista de aristas que forman la estrategia de menor costo
         considerando solo nodos elegibles.
         """
+        elegibles = {codigo for codigo in self.nodos if self.nodo_es_elegible(codigo, boss)}
+        return self._prim(nodo_inicio, elegibles)
+
+    def _prim(self, nodo_inicio, elegibles):
+        """Prim sobre el conjunto de nodos elegibles ya calculado."""
         visitados = set([nodo_inicio])
         mst_aristas = []
         
         # Inicializamos con las conexiones del nodo actual
         edges = []
         for dest, peso in self.nodos[nodo_inicio].conexiones.items():
-            if self.nodo_es_elegible(dest, boss):
+            if dest in elegibles:
                 heapq.heappush(edges, (peso, nodo_inicio, dest))
         
         # Bucle principal de Prim
@@ -472,51 +766,74 @@ class GrafoEstrategia:
                 
                 # Expandir desde el nuevo nodo v
                 for vecino, peso_vecino in self.nodos[v].conexiones.items():
-                    if vecino not in visitados and self.nodo_es_elegible(vecino, boss):
+                    if vecino not in visitados and vecino in elegibles:
                         heapq.heappush(edges, (peso_vecino, v, vecino))
                         
         return mst_aristas
 
-    def seleccionar_siguiente_ataque(self, boss):
-        nodo_origen = self.nodo_actual
-        mst = self.aplicar_prim(self.nodo_actual, boss)
-        
-        opciones_validas = []
-        debug_opciones = [] # Lista temporal solo para el log
-        
-        vecinos = self.nodos[self.nodo_actual].conexiones
-        for dest, peso in vecinos.items():
-            if self.nodo_es_elegible(dest, boss):
-                es_optimo = any(u == self.nodo_actual and v == dest for u, v, w in mst)
+    def opciones_decision(self, boss):
+        """
+        Devuelve (destinos, pesos_acumulados, mst, debug_opciones) para el nodo actual.
+
+        El resultado solo depende de (nodo actual, máscara de elegibles), así que se
+        calcula una vez por combinación y luego es una simple búsqueda en el diccionario.
+        """
+        clave = (self.nodo_actual, self.mascara_elegibles(boss))
+        decision = self._cache_decisiones.get(clave)
+        if decision is None:
+            decision = self._calcular_decision(*clave)
+            self._cache_decisiones[clave] = decision
+        return decision
+
+    def _calcular_decision(self, nodo_origen, mascara):
+        elegibles = {codigo for codigo, bit in self._bits_nodos if mascara & bit}
+        mst = self._prim(nodo_origen, elegibles)
+        aristas_optimas = {(u, v) for u, v, w in mst}
+
+        destinos = []
+        pesos_acumulados = []
+        debug_opciones = []
+        acumulado = 0.0
+
+        for dest, peso in self.nodos[nodo_origen].conexiones.items():
+            if dest in elegibles:
+                es_optimo = (nodo_origen, dest) in aristas_optimas
                 score = 1.0 / (peso + 0.1)
                 if es_optimo: score *= 2.0
-                
-                opciones_validas.append((dest, score))
-                
-                # Guardamos datos para la impresora
+
+                acumulado += score
+                destinos.append(dest)
+                pesos_acumulados.append(acumulado)
                 debug_opciones.append({
                     "nodo": dest, 
                     "peso": peso, 
                     "score": score, 
                     "es_optimo": es_optimo
                 })
+
+        return destinos, pesos_acumulados, mst, debug_opciones
+
+    def seleccionar_siguiente_ataque(self, boss):
+        nodo_origen = self.nodo_actual
+        destinos, pesos_acumulados, mst, debug_opciones = self.opciones_decision(boss)
         
-        if not opciones_validas:
+        if not destinos:
             self.nodo_actual = "A"
             return self.nodos["A"]
 
-        # Selección
-        destinos = [x[0] for x in opciones_validas]
-        pesos = [x[1] for x in opciones_validas]
-        seleccion = random.choices(destinos, weights=pesos, k=1)[0]
+        # Selección: una sola tirada ponderada sobre los pesos ya acumulados
+        # (es lo mismo que hace random.choices, pero sin recalcular las sumas).
+        total = pesos_acumulados[-1]
+        seleccion = destinos[bisect.bisect(pesos_acumulados, self.rng.random() * total, 0, len(destinos) - 1)]
         
-        imprimir_debug_ia("ESTRATEGIA", (
-            nodo_origen, 
-            self.nodos[nodo_origen].nombre, 
-            mst, 
-            debug_opciones, 
-            seleccion
-        ))
+        if log_estrategia.isEnabledFor(DEBUG):
+            imprimir_debug_ia("ESTRATEGIA", (
+                nodo_origen, 
+                self.nodos[nodo_origen].nombre, 
+                mst, 
+                debug_opciones, 
+                seleccion
+            ))
         
         self.nodo_actual = seleccion
         return self.nodos[seleccion]
@@ -525,41 +842,42 @@ def imprimir_debug_ia(tipo, datos):
     """
     Función universal para imprimir logs de la IA sin ensuciar las clases.
     Uso: imprimir_debug_ia("ESTADO", {datos...}) o imprimir_debug_ia("ESTRATEGIA", {datos...})
+    Escribe en los canales "ia" y "estrategia"; quien la llama revisa antes que estén activos.
     """
     if tipo == "ESTADO":
         # Desempaquetamos los datos
         boss, evento, anterior, actual = datos
         porc = (boss.vida_actual / boss.vida_max) * 100
         
-        print("\n" + "="*40)
-        print(" INICIANDO IA DEL JEFE (DONALD T.)")
-        print("="*40)
-        print(f"[IA] Signos Vitales: HP {boss.vida_actual}/{boss.vida_max} ({porc:.1f}%) | Estrés {boss.st}/{boss.st_max}")
-        print(f"[IA] Evento Interpretado: '{evento}'")
+        log_ia.debug("\n" + "="*40)
+        log_ia.debug(" INICIANDO IA DEL JEFE (DONALD T.)")
+        log_ia.debug("="*40)
+        log_ia.debug(f"[IA] Signos Vitales: HP {boss.vida_actual}/{boss.vida_max} ({porc:.1f}%) | Estrés {boss.st}/{boss.st_max}")
+        log_ia.debug(f"[IA] Evento Interpretado: '{evento}'")
         
         if anterior != actual:
-            print(f"[IA] ¡CAMBIO DE HUMOR!: {anterior} -> {actual}")
+            log_ia.debug(f"[IA] ¡CAMBIO DE HUMOR!: {anterior} -> {actual}")
         else:
-            print(f"[IA] Mantiene humor: {actual}")
+            log_ia.debug(f"[IA] Mantiene humor: {actual}")
 
     elif tipo == "ESTRATEGIA":
         # Desempaquetamos
         origen, nombre_origen, mst, opciones, decision = datos
         
-        print("-" * 40)
-        print(f"[ESTRATEGIA] Nodo Mental Actual: '{origen}' ({nombre_origen})")
-        print("[ESTRATEGIA] Ejecutando Algoritmo de Prim (MST)...")
+        log_estrategia.debug("-" * 40)
+        log_estrategia.debug(f"[ESTRATEGIA] Nodo Mental Actual: '{origen}' ({nombre_origen})")
+        log_estrategia.debug("[ESTRATEGIA] Ejecutando Algoritmo de Prim (MST)...")
         
         if mst:
             for u, v, w in mst:
-                print(f"   └── Conexión Óptima sugerida: {u} -> {v} (Peso {w})")
+                log_estrategia.debug(f"   └── Conexión Óptima sugerida: {u} -> {v} (Peso {w})")
         else:
-            print("   └── (Sin expansión: usando solo adyacentes)")
+            log_estrategia.debug("   └── (Sin expansión: usando solo adyacentes)")
 
-        print("[ESTRATEGIA] Evaluando probabilidades:")
+        log_estrategia.debug("[ESTRATEGIA] Evaluando probabilidades:")
         for op in opciones:
             tag = " [BONUS PRIM x2]" if op['es_optimo'] else ""
-            print(f"   - Opción '{op['nodo']}': Peso {op['peso']} -> Score {op['score']:.3f}{tag}")
+            log_estrategia.debug(f"   - Opción '{op['nodo']}': Peso {op['peso']} -> Score {op['score']:.3f}{tag}")
             
-        print(f"[ESTRATEGIA] Decisión Final: '{decision}'")
-        print("-" * 40)
\ No newline at end of file
+        log_estrategia.debug(f"[ESTRATEGIA] Decisión Final: '{decision}'")
+        log_estrategia.debug("-" * 40)
\ No newline at end of file
@@ -0,0 +1,61 @@
+import pygame
+
+"""
+REGISTRO DE FUENTES (UNA SOLA CARGA POR TIPOGRAFÍA)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (TIPOGRAFÍAS):
+-----------------------------------------------------------------------------------------
+CLASE / LÓGICA          | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. PEDIR UNA FUENTE     | obtener(nombre,       | Devuelve siempre el MISMO objeto
+                        |   tamano, negrita)    | pygame.font.Font para esos datos.
+                        |                       | - Se carga la primera vez que se pide.
+                        |                       | - 'nombre' puede ser una tupla de
+                        |                       |   alternativas: ("Consolas", "Arial").
+-----------------------------------------------------------------------------------------
+2. COSTO                | cargas / pedidos      | SysFont busca en las fuentes del
+                        | estadisticas()        | sistema y lee el archivo: no debe
+                        |                       | llamarse dentro del bucle de dibujo.
+-----------------------------------------------------------------------------------------
+3. INYECCIÓN            | RegistroFuentes()     | El juego usa el registro global
+                        |                       | (registro); se puede crear uno propio.
+-----------------------------------------------------------------------------------------
+"""
+
+class RegistroFuentes:
+    """
+    Diccionario (nombre, tamaño, negrita) -> pygame.font.Font.
+
+    Crear una fuente con SysFont es lento (busca la tipografía en el sistema y la
+    carga desde disco). Aquí se crea una vez y todos los que dibujan la comparten.
+    """
+    def __init__(self):
+        self.fuentes = {}
+        self.cargas = 0    # Fuentes creadas con SysFont.
+        self.pedidos = 0   # Veces que se llamó a obtener().
+
+    def obtener(self, nombre, tamano, negrita=False):
+        """Devuelve la fuente pedida (la crea la primera vez)."""
+        self.pedidos += 1
+        if not isinstance(nombre, str):
+            nombre = tuple(nombre)  # Las listas no sirven de clave.
+        clave = (nombre, tamano, negrita)
+        fuente = self.fuentes.get(clave)
+        if fuente is None:
+            # SysFont acepta varios nombres y usa el primero que exista en el sistema.
+            fuente = pygame.font.SysFont(nombre, tamano, bold=negrita)
+            self.fuentes[clave] = fuente
+            self.cargas += 1
+        return fuente
+
+    def estadisticas(self):
+        return {"pedidos": self.pedidos, "cargas": self.cargas, "fuentes": len(self.fuentes)}
+
+
+# Registro global del juego.
+registro = RegistroFuentes()
+
+
+def obtener(nombre, tamano, negrita=False):
+    """Atajo para registro.obtener(nombre, tamano, negrita)."""
+    return registro.obtener(nombre, tamano, negrita)
@@ -1,6 +1,9 @@
 import pygame
+import collections
 import config
-from recursos import AlmacenRecursos 
+import fuentes
+from lote_dibujo import LoteDibujo, CAPA_FONDO, CAPA_ESTADOS, CAPA_TEXTO, CAPA_HUD, CAPA_EFECTOS
+from recursos import AlmacenRecursos, bytes_superficie
 
 """
 GESTOR DE GRÁFICOS (MOTOR VISUAL)
@@ -11,40 +14,105 @@ CLASE / SECCIÓN         | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
 -----------------------------------------------------------------------------------------
 1. ESTILO GENERAL       | __init__              | Configuración inicial.
    (Fuentes y Colores)  | - self.VERDE_TERMINAL | - Cambiar paleta de colores RGB.
-                        | - pygame.font...      | - Cambiar tipo o tamaño de letra (19, 20).
+                        | - fuentes.obtener(...)| - Cambiar tipo o tamaño de letra (19, 20).
+                        | - self.textos         | - CacheTexto: textos ya renderizados
+                        |                       |   (LRU por fuente, texto y color).
 -----------------------------------------------------------------------------------------
 2. ESCENA DE BATALLA    | dibujar_interfaz()    | Dibuja el frame principal.
-   (Posiciones)         | - self.pantalla.blit  | - Cambiar coordenadas (X, Y) para mover:
+   (Posiciones)         | - self.zonas          | - Cambiar coordenadas (X, Y) para mover:
                         |                       |   P1 (100,230), Boss (850,230), etc.
                         | - MAX_LINEAS = 5      | - Aumentar/disminuir historial de texto.
-                        | - dibujar_estado()    | - Ajustar posición de iconos (fuego/sangre).
+                        | - self.zonas["estado"]| - Ajustar posición de iconos (fuego/sangre).
+                        |-----------------------|----------------------------------------
+   (Capa estática)      | _capa_estatica()      | Fondo + sprites + caja compuestos una
+                        | - CAPAS_ESTATICAS_MAX | vez; se recompone si cambia un sprite.
+                        |-----------------------|----------------------------------------
+   (Regiones sucias)    | dibujar_escena()      | Igual, pero solo redibuja las zonas
+                        | presentar()           | que cambiaron y las manda a pantalla
+                        | invalidar()           | con display.update(rects).
+                        |                       | - Si dibujas algo nuevo en la escena,
+                        |                       |   agrégale zona y firma.
+                        |-----------------------|----------------------------------------
+   (Lote de dibujo)     | self.lote.agregar()   | La escena, el HUD y los efectos se
+                        | self.lote.enviar()    | anotan con su capa y se mandan juntos
+                        |                       | con Surface.blits (lote_dibujo.py).
 -----------------------------------------------------------------------------------------
 3. HUD (BARRAS VIDA)    | dibujar_barras_vida() | Controla las cajas de estadísticas.
                         | - MORADO_ESTRES       | - Color único para la barra del Boss.
                         |-----------------------|----------------------------------------
                         | dibujar_hud()         | Dibuja el rectángulo genérico.
                         | - pygame.draw.rect    | - Modificar grosor de bordes o rellenos.
+                        | _panel_hud()          | - Cada caja se guarda pintada y solo
+                        |                       |   se repinta si cambian sus valores.
 -----------------------------------------------------------------------------------------
 4. PANTALLAS MENU/FIN   | dibujar_victoria()    | Pantallas estáticas.
-                        | dibujar_derrota()     | - overlay.set_alpha(200): Opacidad fondo.
-                        | dibujar_menu_pausa()  | - Ajustar posición del menú y cursor.
+                        | dibujar_derrota()     | - PANTALLAS_FIN: imagen, velo (alpha
+                        | dibujar_menu_pausa()  |   200) y textos de cada final.
+                        | _capa_pantalla()      | - Cada pantalla se arma una sola vez
+                        | - self.pos_menu_pausa |   (las finales, con la escena de fondo
+                        |                       |   incluida); por frame es un blit y,
+                        |                       |   en la pausa, el cursor.
+                        | _bytes_capas()        | - Las capas cuentan para el presupuesto
+                        |                       |   de recursos.py.
 -----------------------------------------------------------------------------------------
-5. ANIMACIONES          | animar_proyectil()    | Movimiento lineal de objetos.
-   (Tiempos y Efectos)  | - range(20)           | - Cambiar '20' altera la velocidad
-                        |                       |   del disparo (Más bajo = Más rápido).
+5. ANIMACIONES          | dibujar_proyectil()   | Un frame del disparo en 'pos'.
+   (Tiempos y Efectos)  |                       | - Los tiempos están en animaciones.py
+                        |                       |   (DURACION_PROYECTIL / _IMPACTO).
                         |-----------------------|----------------------------------------
-                        | animar_impacto()      | Feedback visual de golpe.
+                        | dibujar_impacto()     | Feedback visual de golpe.
                         | - es_dano (lógica)    | - Decide si el personaje pone cara de dolor.
-                        | - pygame.time.delay   | - Duración del efecto en pantalla.
+                        | - OVERLAYS_IMPACTO    | - Icono que se pone según el efecto.
 -----------------------------------------------------------------------------------------
 """
 
+class CacheTexto:
+    """
+    Caché LRU de textos ya renderizados.
+
+    Renderizar texto (rasterizar los glifos) es de lo más caro de un frame, y el log
+    y las barras muestran casi siempre las mismas cadenas. La clave es
+    (fuente, texto, color): si ya se dibujó igual, se devuelve la misma superficie.
+    """
+    def __init__(self, capacidad=256):
+        self.capacidad = capacidad
+        self.superficies = collections.OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def render(self, fuente, texto, color):
+        """Igual que fuente.render(texto, True, color), pero sin repetir trabajo."""
+        clave = (fuente, texto, color)
+        superficie = self.superficies.get(clave)
+        if superficie is not None:
+            self.aciertos += 1
+            self.superficies.move_to_end(clave)
+            return superficie
+
+        self.fallos += 1
+        superficie = fuente.render(texto, True, color)
+        self.superficies[clave] = superficie
+        if len(self.superficies) > self.capacidad:
+            self.superficies.popitem(last=False)  # Sale la usada hace más tiempo.
+        return superficie
+
+    def estadisticas(self):
+        total = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.aciertos / total if total else 0.0,
+            "guardados": len(self.superficies),
+        }
+
+
 class GestorGrafico:
+    PARPADEO_MS = 500  # Medio ciclo del parpadeo del aviso ">> ESPACIO".
+
     def __init__(self, pantalla):
         self.pantalla = pantalla
         
         # Instanciamos el almacén de recursos.
-        # Esto carga todas las imágenes en memoria RAM una sola vez al iniciar.
+        # Cada imagen se carga en memoria RAM una sola vez, la primera vez que se usa.
         self.almacen = AlmacenRecursos()
         
         # Creamos un alias o acceso directo al diccionario de assets.
@@ -55,16 +123,22 @@ class GestorGrafico:
         # Acceso directo a los sonidos
         self.sonidos = self.almacen.sonidos
         
-        # Configuración de tipografías.
-        # Usamos un bloque try-except para que el juego no se rompa si el sistema
-        # operativo no tiene la fuente "Consolas". Si falla, usamos "Arial".
-        try:
-            self.fuente_log = pygame.font.SysFont("Consolas", 19, bold=True) 
-            self.fuente_aviso = pygame.font.SysFont("Consolas", 20, bold=True)
-        except:
-            self.fuente_log = pygame.font.SysFont("Arial", 19, bold=True)
-            self.fuente_aviso = pygame.font.SysFont("Arial", 20, bold=True)
-        self.fuente_ui = pygame.font.SysFont("Arial", 22, bold=True)
+        # Configuración de tipografías (salen del registro de fuentes.py, que carga
+        # cada una una sola vez). Si el sistema operativo no tiene "Consolas",
+        # se usa "Arial".
+        self.fuente_log = fuentes.obtener(("Consolas", "Arial"), 19, negrita=True)
+        self.fuente_aviso = fuentes.obtener(("Consolas", "Arial"), 20, negrita=True)
+        self.fuente_ui = fuentes.obtener("Arial", 22, negrita=True)
+        # Fuente de las cajas de estadísticas (la comparten las tres).
+        self.fuente_info = fuentes.obtener("Arial", 18, negrita=True)
+        self.fuente_titulo = fuentes.obtener("Arial", 40, negrita=True)
+
+        # Textos ya renderizados (log, barras, menús). Ver CacheTexto.
+        self.textos = CacheTexto()
+
+        # La escena, el HUD y los efectos no dibujan directo: anotan en el lote y se
+        # envían juntos con Surface.blits (ver lote_dibujo.py).
+        self.lote = LoteDibujo(pantalla)
         
         # Definición de paleta de colores para la interfaz (UI).
         self.VERDE_TERMINAL = (50, 255, 50)
@@ -72,6 +146,48 @@ class GestorGrafico:
         self.BLANCO = (255, 255, 255)
         self.NEGRO = (0, 0, 0)
 
+        # --- ZONAS DE LA ESCENA (RENDERIZADO POR REGIONES) ---
+        # Rectángulos fijos de cada elemento. dibujar_escena() compara la 'firma' de
+        # cada zona con la del frame anterior y solo redibuja las que cambiaron.
+        self.TEXTO_AVISO = ">> PRESS SPACE TO CONTINUE_ "
+        self.rect_pantalla = self.pantalla.get_rect()
+        self.pos_caja = ((config.ANCHO - 1100) // 2, config.ALTO - 210)
+        self.zonas = {
+            "p1": pygame.Rect(100, 230, 300, 300),
+            "p2": pygame.Rect(350, 230, 300, 300),
+            "boss": pygame.Rect(850, 230, 300, 300),
+            # Icono de estado (100x100) más el escudo 40 px arriba.
+            "estado_p1": pygame.Rect(200, 90, 100, 140),
+            "estado_p2": pygame.Rect(450, 90, 100, 140),
+            "estado_boss": pygame.Rect(950, 90, 100, 140),
+            # Franja inferior completa: caja de texto y líneas largas que se salgan de ella.
+            "log": pygame.Rect(0, self.pos_caja[1], config.ANCHO, config.ALTO - self.pos_caja[1]),
+            "aviso": pygame.Rect((self.pos_caja[0] + 750, self.pos_caja[1] + 150), self.fuente_aviso.size(self.TEXTO_AVISO)),
+            "hud_p1": pygame.Rect(100, 30, 250, 60),
+            "hud_p2": pygame.Rect(100, 100, 250, 60),
+            "hud_boss": pygame.Rect(config.ANCHO - 350, 30, 250, 60),
+        }
+        self._firmas = {}
+        self._zonas_extra = []
+
+        # Capas estáticas ya compuestas (fondo + sprites + caja), de la más vieja a la más nueva.
+        self.CAPAS_ESTATICAS_MAX = 4
+        self._capas_estaticas = collections.OrderedDict()
+        # Cajas del HUD ya pintadas: posición -> (lo que muestran, superficie).
+        self._paneles = {}
+        # Velos y capas fijas de menú, pausa, victoria y derrota (ver _capa_pantalla).
+        self._capas_pantalla = {}
+        self._firmas_pantalla = {}  # Clave -> escena con la que se armó (solo las finales).
+        self.pos_menu_pausa = (config.ANCHO // 2 - 200, config.ALTO // 2 - 225)
+        self.rects_sucios = []
+        self._invalidado = True
+        self._pantalla_completa = True
+        # Esas capas son copias de pantalla completa: cuentan para el presupuesto de memoria
+        # y, si no alcanza con desalojar imágenes, se sueltan las que no están en uso.
+        self._pantallas_en_uso = set()  # Claves de _capas_pantalla de este frame y el anterior.
+        self._pantallas_frame = set()
+        self.assets.registrar_derivadas("capas", self._bytes_capas, self._encoger_capas)
+
     # ==========================================
     # DIBUJADO DE LA BATALLA
     # ==========================================
@@ -83,253 +199,489 @@ class GestorGrafico:
         Normalmente dibujamos al personaje en su estado base. Pero si la función de 
         animación nos pasa una imagen específica (ej. cara de dolor), la usamos 
         temporalmente en este cuadro en lugar de la imagen normal.
+
+        Como pinta la pantalla entera por fuera del registro de zonas, el siguiente
+        dibujar_escena() tiene que redibujar todo (por eso invalidamos).
         """
-        
-        # 1. Capa de Fondo
-        # Siempre dibujamos esto primero para limpiar el frame anterior.
-        self.pantalla.blit(self.assets['fondo'], (0, 0))
-        
-        # 2. Capa de Personajes
+        self.invalidar()
+        sprites = self._sprites_escena(p1, p2, boss, sprite_p1_override, sprite_p2_override, sprite_boss_override)
+        self._dibujar_escenario(self.rect_pantalla, p1, p2, boss, sprites,
+                                self._lineas_log(frase_log), self._aviso_visible(esperando_espacio))
+        self.lote.enviar()
+
+    def dibujar_escena(self, p1, p2, boss, frase_log, esperando_espacio=False, sprite_boss_override=None, sprite_p1_override=None, sprite_p2_override=None):
+        """
+        Versión por regiones de dibujar_interfaz() + dibujar_barras_vida() para el
+        bucle principal: solo redibuja las zonas cuya 'firma' cambió desde el frame
+        anterior (texto, barras, aviso intermitente, cambio de sprite...).
+        Las zonas quedan en self.rects_sucios hasta que se llama a presentar().
+        """
+        sprites = self._sprites_escena(p1, p2, boss, sprite_p1_override, sprite_p2_override, sprite_boss_override)
+        lineas = self._lineas_log(frase_log)
+        aviso = self._aviso_visible(esperando_espacio)
+
+        # La firma de cada zona resume todo lo que se ve en ella.
+        firmas = {
+            "p1": sprites[0], "p2": sprites[1], "boss": sprites[2],
+            "estado_p1": self._firma_estado(p1),
+            "estado_p2": self._firma_estado(p2),
+            "estado_boss": self._firma_estado(boss),
+            "log": lineas,
+            "aviso": aviso,
+            "hud_p1": (p1.nombre, p1.vida_actual, p1.vida_max, p1.energia_actual, p1.energia_max),
+            "hud_p2": (p2.nombre, p2.vida_actual, p2.vida_max, p2.energia_actual, p2.energia_max),
+            "hud_boss": (boss.nombre, boss.vida_actual, boss.vida_max, boss.st, boss.st_max),
+        }
+
+        if self._invalidado:
+            sucias = [self.rect_pantalla]
+            self._pantalla_completa = True
+            self._invalidado = False
+        else:
+            sucias = [self.zonas[nombre] for nombre, firma in firmas.items() if self._firmas.get(nombre) != firma]
+            sucias.extend(self._zonas_extra)
+        self._firmas = firmas
+        self._zonas_extra = []
+
+        # Cada zona sucia se recompone entera (fondo + capas) en un solo envío recortado.
+        for recorte in sucias:
+            self._dibujar_escenario(recorte, p1, p2, boss, sprites, lineas, aviso)
+            self._dibujar_huds(recorte, p1, p2, boss)
+            self.lote.enviar(recorte)
+        self.rects_sucios.extend(sucias)
+        return sucias
+
+    def invalidar(self):
+        """La pantalla ya no coincide con las firmas guardadas: el próximo frame va completo."""
+        self._invalidado = True
+        self._pantalla_completa = True
+
+    def ensuciar(self, rect):
+        """
+        Avisa que alguien dibujó encima de la escena (ej. el overlay del perfilador):
+        esa zona se presenta en este frame y se recompone en el siguiente.
+        """
+        rect = pygame.Rect(rect)
+        self.rects_sucios.append(rect)
+        self._zonas_extra.append(rect)
+
+    def presentar(self):
+        """
+        Reemplaza a pygame.display.flip() en el bucle principal.
+        Si se pintó la pantalla entera hace flip; si no, actualiza solo las zonas sucias
+        (y si nada cambió, no toca la pantalla).
+        """
+        if self._pantalla_completa:
+            pygame.display.flip()
+        elif self.rects_sucios:
+            pygame.display.update(self.rects_sucios)
+        self.rects_sucios = []
+        self._pantalla_completa = False
+        self._pantallas_en_uso, self._pantallas_frame = self._pantallas_frame, set()
+        self.lote.cerrar_frame()
+
+    def _sprites_escena(self, p1, p2, boss, sprite_p1_override=None, sprite_p2_override=None, sprite_boss_override=None):
         # Aquí decido qué imagen mostrar basándome en la prioridad:
         # Prioridad A: ¿Hay una animación forzada (override)? -> Úsala.
         # Prioridad B: ¿Está muerto (vida <= 0)? -> Usa el sprite de derrota.
         # Prioridad C: Estado normal -> Usa el sprite estándar.
-        
-        # --- JUGADOR 1 ---
-        if sprite_p1_override:
-            spr_p1 = sprite_p1_override 
-        elif p1.vida_actual <= 0:
-            spr_p1 = self.assets['jugador1_dano'] 
-        else:
-            spr_p1 = self.assets['jugador1'] 
-        self.pantalla.blit(spr_p1, (100, 230)) 
-        
-        # --- JUGADOR 2 ---
-        if sprite_p2_override:
-            spr_p2 = sprite_p2_override
-        elif p2.vida_actual <= 0:
-            spr_p2 = self.assets['jugador2_dano']
-        else:
-            spr_p2 = self.assets['jugador2']
-        self.pantalla.blit(spr_p2, (350, 230)) 
-        
-        # --- BOSS ---
-        if sprite_boss_override:
-            spr_boss = sprite_boss_override
-        elif boss.vida_actual <= 0:
-            spr_boss = self.assets['boss_dano'] 
-        else:
-            spr_boss = self.assets['boss_idle']
-        self.pantalla.blit(spr_boss, (850, 230)) 
+        def elegir(override, personaje, clave_muerto, clave_normal):
+            if override:
+                return override
+            if personaje.vida_actual <= 0:
+                return self.assets[clave_muerto]
+            return self.assets[clave_normal]
+
+        return (elegir(sprite_p1_override, p1, 'jugador1_dano', 'jugador1'),
+                elegir(sprite_p2_override, p2, 'jugador2_dano', 'jugador2'),
+                elegir(sprite_boss_override, boss, 'boss_dano', 'boss_idle'))
+
+    @staticmethod
+    def _firma_estado(personaje):
+        if personaje.vida_actual <= 0:
+            return None  # Muerto: no se dibuja ningún icono.
+        return (personaje.estado_actual, len(personaje.pila_escudo) > 0)
+
+    @staticmethod
+    def _lineas_log(frase_log):
+        # Limitamos el texto a las últimas 5 líneas para que no se salga de la caja.
+        MAX_LINEAS = 5 
+        return tuple(frase_log.split('\n')[-MAX_LINEAS:])
+
+    @classmethod
+    def _aviso_visible(cls, esperando_espacio):
+        # Usamos el reloj del sistema para crear un parpadeo (on/off) cada 500ms.
+        return esperando_espacio and (pygame.time.get_ticks() // cls.PARPADEO_MS) % 2 == 0
+
+    @classmethod
+    def ms_hasta_parpadeo(cls):
+        """Milisegundos hasta que el aviso ">> ESPACIO" cambie de encendido a apagado (o al revés)."""
+        return cls.PARPADEO_MS - pygame.time.get_ticks() % cls.PARPADEO_MS
+
+    def _dibujar_escenario(self, recorte, p1, p2, boss, sprites, lineas, aviso_visible):
+        """
+        Anota en el lote fondo, personajes, estados y caja de texto para 'recorte'.
+        No dibuja: el que llama hace self.lote.enviar(recorte), que descarta lo que
+        no toca el recorte y recorta el resto.
+        """
+        lote = self.lote
+
+        # 1-2-3. Capa Estática (Fondo + Personajes + Caja de Texto)
+        # Ya viene compuesta: un solo blit limpia la zona y deja todo lo que no cambia.
+        lote.agregar(self._capa_estatica(sprites), recorte.topleft, CAPA_FONDO, recorte)
         
         # --- ESTADOS VISUALES ---
-        # Función auxiliar interna para dibujar iconos sobre las cabezas (fuego, aturdimiento).
-        # Ayuda a no repetir el mismo código tres veces.
-        def dibujar_estado(personaje, x_centro):
-            if personaje.vida_actual <= 0:
-                return # Si está muerto, limpiamos la interfaz visual sobre él.
+        # Iconos sobre las cabezas (fuego, aturdimiento, escudo).
+        for nombre, personaje in (("estado_p1", p1), ("estado_p2", p2), ("estado_boss", boss)):
+            zona = self.zonas[nombre]
+            if personaje.vida_actual <= 0 or not recorte.colliderect(zona):
+                continue # Si está muerto, limpiamos la interfaz visual sobre él.
 
-            y_icono = 130
+            x_centro, y_icono = zona.x, zona.y + 40
             # Verificamos la cadena de texto del estado actual del objeto Personaje
             if personaje.estado_actual == "Quemado":
-                self.pantalla.blit(self.assets['est_quemado'], (x_centro, y_icono))
+                lote.agregar(self.assets['est_quemado'], (x_centro, y_icono), CAPA_ESTADOS)
             elif personaje.estado_actual == "Sangrado":
-                self.pantalla.blit(self.assets['est_sangrado'], (x_centro, y_icono))
+                lote.agregar(self.assets['est_sangrado'], (x_centro, y_icono), CAPA_ESTADOS)
             elif personaje.estado_actual == "Aturdido":
-                self.pantalla.blit(self.assets['est_aturdido'], (x_centro, y_icono))
+                lote.agregar(self.assets['est_aturdido'], (x_centro, y_icono), CAPA_ESTADOS)
             
             # El escudo es independiente del estado, se dibuja si la pila tiene elementos.
             if len(personaje.pila_escudo) > 0:
-                self.pantalla.blit(self.assets['icono_escudo'], (x_centro, y_icono - 40))
+                lote.agregar(self.assets['icono_escudo'], (x_centro, y_icono - 40), CAPA_ESTADOS)
 
-        dibujar_estado(p1, 200)
-        dibujar_estado(p2, 450)
-        dibujar_estado(boss, 950)
+        # 4. Renderizado del Log de Batalla (la caja ya está en la capa estática)
+        pos_caja_x, pos_caja_y = self.pos_caja
+        if recorte.colliderect(self.zonas["log"]):
+            margen_interno_x = 120
+            margen_interno_y = 40
+            for i, linea in enumerate(lineas):
+                espaciado = 25
+                x = pos_caja_x + margen_interno_x
+                y = pos_caja_y + margen_interno_y + (i * espaciado)
+                # Solo renderizo las líneas que caen en el recorte (size() no crea superficies).
+                ancho, alto = self.fuente_log.size(linea)
+                if not recorte.colliderect((x, y, ancho + 1, alto + 1)):
+                    continue
+                # Efecto de sombra: dibujamos el texto oscuro un píxel desplazado
+                # para darle legibilidad sobre el fondo.
+                txt_glow = self.textos.render(self.fuente_log, linea, self.VERDE_OSCURO)
+                lote.agregar(txt_glow, (x + 1, y + 1), CAPA_TEXTO)
+                
+                # Texto principal brillante.
+                txt = self.textos.render(self.fuente_log, linea, self.VERDE_TERMINAL)
+                lote.agregar(txt, (x, y), CAPA_TEXTO)
 
-        # 3. Interfaz de Usuario (UI) - Caja de Texto
-        pos_caja_x = (config.ANCHO - 1100) // 2
-        pos_caja_y = config.ALTO - 210
-        self.pantalla.blit(self.assets['caja_texto'], (pos_caja_x, pos_caja_y))
-        
-        # 4. Renderizado del Log de Batalla
-        margen_interno_x = 120
-        margen_interno_y = 40
-        lineas = frase_log.split('\n')
+            # 5. Aviso Intermitente "Press Space"
+            if aviso_visible and recorte.colliderect(self.zonas["aviso"]):
+                aviso = self.textos.render(self.fuente_aviso, self.TEXTO_AVISO, self.VERDE_TERMINAL)
+                lote.agregar(aviso, self.zonas["aviso"].topleft, CAPA_TEXTO)
 
-        # Limitamos el texto a las últimas 5 líneas para que no se salga de la caja.
-        MAX_LINEAS = 5 
-        if len(lineas) > MAX_LINEAS:
-            lineas = lineas[-MAX_LINEAS:] 
-            
-        for i, linea in enumerate(lineas):
-            espaciado = 25
-            # Efecto de sombra: dibujamos el texto oscuro un píxel desplazado
-            # para darle legibilidad sobre el fondo.
-            txt_glow = self.fuente_log.render(linea, True, self.VERDE_OSCURO)
-            self.pantalla.blit(txt_glow, (pos_caja_x + margen_interno_x + 1, pos_caja_y + margen_interno_y + 1 + (i * espaciado)))
-            
-            # Texto principal brillante.
-            txt = self.fuente_log.render(linea, True, self.VERDE_TERMINAL)
-            self.pantalla.blit(txt, (pos_caja_x + margen_interno_x, pos_caja_y + margen_interno_y + (i * espaciado)))
+    def _capa_estatica(self, sprites):
+        """
+        Devuelve el fondo con los tres personajes y la caja de texto ya compuestos.
+
+        La clave son las superficies que la forman (fondo, caja y el sprite de cada
+        personaje), así que solo se recompone cuando alguna cambia: un sprite de derrota,
+        una cara de dolor de una animación o el fondo de otro nivel. Se guardan las
+        últimas CAPAS_ESTATICAS_MAX para que ir y volver de una animación no recomponga.
+        """
+        fondo = self.assets['fondo']
+        caja = self.assets['caja_texto']
+        clave = (fondo, caja) + tuple(sprites)
+        capa = self._capas_estaticas.get(clave)
+        if capa is not None:
+            self._capas_estaticas.move_to_end(clave)
+            return capa
+
+        # Superficie opaca en el formato de la pantalla: es el blit más barato posible.
+        capa = pygame.Surface(self.rect_pantalla.size).convert()
+        capa.blit(fondo, (0, 0))
+        for nombre, sprite in zip(("p1", "p2", "boss"), sprites):
+            capa.blit(sprite, self.zonas[nombre].topleft)
+        capa.blit(caja, self.pos_caja)
+
+        self._capas_estaticas[clave] = capa
+        if len(self._capas_estaticas) > self.CAPAS_ESTATICAS_MAX:
+            self._capas_estaticas.popitem(last=False)
+        self.assets.ajustar()
+        return capa
+
+    def _encoger_capas(self):
+        """
+        Lo llama recursos.py cuando el presupuesto no alcanza: deja solo la capa
+        estática más reciente y suelta velos y pantallas que no se usaron en este
+        frame ni en el anterior. Lo soltado se vuelve a armar si se pide.
+        """
+        while len(self._capas_estaticas) > 1:
+            self._capas_estaticas.popitem(last=False)
+        for clave in list(self._capas_pantalla):
+            if clave not in self._pantallas_en_uso and clave not in self._pantallas_frame:
+                del self._capas_pantalla[clave]
+                self._firmas_pantalla.pop(clave, None)
 
-        # 5. Aviso Intermitente "Press Space"
-        if esperando_espacio:
-            # Usamos el reloj del sistema para crear un parpadeo (on/off) cada 500ms.
-            if (pygame.time.get_ticks() // 500) % 2 == 0: 
-                aviso = self.fuente_aviso.render(">> PRESS SPACE TO CONTINUE_ ", True, self.VERDE_TERMINAL)
-                self.pantalla.blit(aviso, (pos_caja_x + 750, pos_caja_y + 150))
+    def _bytes_capas(self):
+        """Memoria de las capas ya compuestas (estáticas, velos, pantallas y HUD)."""
+        total = sum(bytes_superficie(capa) for capa in self._capas_estaticas.values())
+        for capa in self._capas_pantalla.values():
+            total += bytes_superficie(capa if isinstance(capa, pygame.Surface) else capa[0])
+        total += sum(bytes_superficie(panel) for _, panel in self._paneles.values())
+        return total
 
     def dibujar_barras_vida(self, p1, p2, boss):
-        """Fachada para llamar al dibujado individual de cada barra."""
-        
+        """Fachada para llamar al dibujado individual de cada barra (pantalla completa)."""
+        self.invalidar()
+        self._dibujar_huds(self.rect_pantalla, p1, p2, boss)
+        self.lote.enviar()
+
+    def _dibujar_huds(self, recorte, p1, p2, boss):
+        """Anota en el lote las cajas de estadísticas que tocan 'recorte'."""
+
         # 1. Dibujamos a los jugadores usando el método estándar (Caja con borde verde)
-        self.dibujar_hud(100, 30, 250, 60, p1, self.VERDE_TERMINAL)
-        self.dibujar_hud(100, 100, 250, 60, p2, self.VERDE_TERMINAL)
+        for nombre, personaje in (("hud_p1", p1), ("hud_p2", p2)):
+            zona = self.zonas[nombre]
+            if recorte.colliderect(zona):
+                self.dibujar_hud(zona.x, zona.y, zona.width, zona.height, personaje, self.VERDE_TERMINAL)
         
         # 2. Dibujamos al JEFE manualmente para cambiar el texto de "Energía" por "Estrés".
+        if recorte.colliderect(self.zonas["hud_boss"]):
+            self._dibujar_hud_jefe(boss)
+
+    def _dibujar_hud_jefe(self, boss):
         # Usamos las mismas coordenadas y estilo de caja para mantener la coherencia visual.
-        x = config.ANCHO - 350
-        y = 30
-        ancho = 250
-        alto = 60
+        x, y, ancho, alto = self.zonas["hud_boss"]
         
         ROJO_TERMINAL = (255, 50, 50)
         MORADO_ESTRES = (150, 0, 200) # Usamos morado para diferenciarlo de la energía azul.
         
-        # A. Fondo Negro y Borde Rojo
-        bg = pygame.Surface((ancho, alto))
-        bg.fill(self.NEGRO)
-        pygame.draw.rect(bg, ROJO_TERMINAL, (0, 0, ancho, alto), 2)
-        self.pantalla.blit(bg, (x, y))
-        
-        # B. Textos (Usamos Arial 18 Bold igual que en dibujar_hud para que se vea idéntico)
-        fuente_info = pygame.font.SysFont("Arial", 18, bold=True)
-        
+        # Fondo Negro y Borde Rojo, con los textos en Arial 18 Bold igual que en dibujar_hud.
         # Línea Superior: Nombre y Vida (En Rojo)
-        txt_vida = fuente_info.render(f"{boss.nombre}: {boss.vida_actual}/{boss.vida_max} HP", True, ROJO_TERMINAL)
-        self.pantalla.blit(txt_vida, (x + 10, y + 8))
-        
         # Línea Inferior: Estrés (En Morado) -> AQUÍ ESTÁ EL CAMBIO CLAVE
-        txt_estres = fuente_info.render(f"Estrés: {boss.st}/{boss.st_max} ST", True, MORADO_ESTRES)
-        self.pantalla.blit(txt_estres, (x + 10, y + 32))
+        panel = self._panel_hud((x, y), ancho, alto, ROJO_TERMINAL, (
+            (f"{boss.nombre}: {boss.vida_actual}/{boss.vida_max} HP", ROJO_TERMINAL),
+            (f"Estrés: {boss.st}/{boss.st_max} ST", MORADO_ESTRES),
+        ))
+        self.lote.agregar(panel, (x, y), CAPA_HUD)
+
     def dibujar_hud(self, x, y, ancho, alto, personaje, color_texto, color_borde=None):
         """
-        Dibuja el rectángulo de estadísticas (Heads Up Display).
+        Anota en el lote el rectángulo de estadísticas (Heads Up Display);
+        se dibuja con el siguiente self.lote.enviar().
         En lugar de usar imágenes, creamos superficies rectangulares por código
         para que sea más fácil ajustar tamaños dinámicamente.
         """
         if color_borde is None: color_borde = self.VERDE_TERMINAL
         
-        bg = pygame.Surface((ancho, alto))
-        bg.fill(self.NEGRO)
-        # Dibujamos solo el borde (width=2)
-        pygame.draw.rect(bg, color_borde, (0, 0, ancho, alto), 2)
-        
-        self.pantalla.blit(bg, (x, y))
-        
-        fuente_info = pygame.font.SysFont("Arial", 18, bold=True)
-        # Renderizamos texto de vida.
-        self.pantalla.blit(fuente_info.render(f"{personaje.nombre}: {personaje.vida_actual}/{personaje.vida_max} HP", True, color_texto), (x + 10, y + 8))
-        
         AZUL_ENERGIA = (0, 200, 255)
-        # Renderizamos texto de energía.
-        self.pantalla.blit(fuente_info.render(f"Energía: {personaje.energia_actual}/{personaje.energia_max} EP", True, AZUL_ENERGIA), (x + 10, y + 32))
+        # Texto de vida arriba y de energía abajo.
+        panel = self._panel_hud((x, y), ancho, alto, color_borde, (
+            (f"{personaje.nombre}: {personaje.vida_actual}/{personaje.vida_max} HP", color_texto),
+            (f"Energía: {personaje.energia_actual}/{personaje.energia_max} EP", AZUL_ENERGIA),
+        ))
+        self.lote.agregar(panel, (x, y), CAPA_HUD)
+
+    def _panel_hud(self, clave, ancho, alto, color_borde, lineas):
+        """
+        Devuelve la superficie de la caja en 'clave' (su posición) ya pintada.
+        Solo se repinta si cambió lo que muestra (textos, colores o tamaño), y lo
+        hace sobre la misma superficie: mientras nada cambie no se crea ninguna.
+        """
+        firma = (ancho, alto, color_borde, lineas)
+        guardado = self._paneles.get(clave)
+        if guardado is not None and guardado[0] == firma:
+            return guardado[1]
+
+        if guardado is not None and guardado[1].get_size() == (ancho, alto):
+            panel = guardado[1]
+        else:
+            panel = pygame.Surface((ancho, alto)).convert()
+        panel.fill(self.NEGRO)
+        # Dibujamos solo el borde (width=2)
+        pygame.draw.rect(panel, color_borde, (0, 0, ancho, alto), 2)
+        for i, (texto, color) in enumerate(lineas):
+            panel.blit(self.textos.render(self.fuente_info, texto, color), (10, 8 + i * 24))
+        self._paneles[clave] = (firma, panel)
+        return panel
 
     # ==========================================
     # PANTALLAS Y ANIMACIONES
     # ==========================================
-    def dibujar_victoria(self):
-        # Creamos una capa semitransparente (alpha 200) para oscurecer el fondo.
-        overlay = pygame.Surface((config.ANCHO, config.ALTO)); overlay.set_alpha(200); overlay.fill((0, 50, 0))
-        self.pantalla.blit(overlay, (0, 0))
-        
-        # Imagen Centrada y Grande
-        if 'victoria_final' in self.assets:
-            img = self.assets['victoria_final']
-            # Esta línea mágica calcula el centro exacto de la pantalla
-            rect_img = img.get_rect(center=(config.ANCHO//2, config.ALTO//2))
-            self.pantalla.blit(img, rect_img)
-            
-        # Texto de Salida
-        s = self.fuente_ui.render("Presiona ENTER para Salir", True, self.BLANCO)
-        self.pantalla.blit(s, s.get_rect(center=(config.ANCHO//2, config.ALTO - 100)))
+    # Pantallas finales: (frase del log, imagen grande, color del velo, texto de salida).
+    PANTALLAS_FIN = {
+        "victoria": ("¡VICTORIA!", 'victoria_final', (0, 50, 0), "Presiona ENTER para Salir"),
+        "derrota": ("¡DERROTA!", 'game_over', (50, 0, 0), "ENTER para Salir"),
+    }
 
-    def dibujar_derrota(self):
-        overlay = pygame.Surface((config.ANCHO, config.ALTO)); overlay.set_alpha(200); overlay.fill((50, 0, 0))
-        self.pantalla.blit(overlay, (0, 0))
-        
-        # Verificamos si la imagen cargó bien antes de dibujarla
-        if 'game_over' in self.assets:
-            img = self.assets['game_over']
-            # Calculamos el centro exacto de la pantalla
-            rect_img = img.get_rect(center=(config.ANCHO//2, config.ALTO//2))
-            self.pantalla.blit(img, rect_img)
-            
-        # 3. Texto de Salida (Abajo)
-        s = self.fuente_ui.render("ENTER para Salir", True, self.BLANCO)
-        self.pantalla.blit(s, s.get_rect(center=(config.ANCHO//2, config.ALTO - 100)))
+    def dibujar_victoria(self, p1, p2, boss):
+        self._dibujar_fin("victoria", p1, p2, boss)
 
-    def dibujar_menu(self):
-        self.pantalla.blit(self.assets["fondo_menu"], (0, 0))
-        
-        # Franja negra inferior para que el texto se lea bien sobre cualquier fondo.
-        sombra = pygame.Surface((config.ANCHO, 100)); sombra.set_alpha(150); sombra.fill((0,0,0))
-        self.pantalla.blit(sombra, (0, config.ALTO - 150))
-        
-        t = pygame.font.SysFont("Arial", 40, bold=True).render("PRESIONA ENTER PARA EMPEZAR", True, self.BLANCO)
-        self.pantalla.blit(t, t.get_rect(center=(config.ANCHO//2, config.ALTO - 100)))
+    def dibujar_derrota(self, p1, p2, boss):
+        self._dibujar_fin("derrota", p1, p2, boss)
+
+    def _dibujar_fin(self, clave, p1, p2, boss):
+        """
+        Escena final + velo + imagen + texto, ya compuestos en una sola capa opaca
+        (ver _capa_pantalla): por frame es un blit de pantalla completa y nada más.
+        """
+        self.invalidar()  # Pantalla completa fuera del registro de zonas.
+        self.pantalla.blit(*self._capa_pantalla(clave, (p1, p2, boss)))
+
+    def dibujar_menu(self, progreso=None):
+        """'progreso' (0.0 a 1.0) = avance de la precarga; con 1.0 o None no hay barra."""
+        self.invalidar()  # Pantalla completa fuera del registro de zonas.
+        self.pantalla.blit(*self._capa_pantalla("menu"))
+        if progreso is not None and progreso < 1:
+            self._dibujar_barra_carga(progreso)
+
+    def _dibujar_barra_carga(self, progreso):
+        """Barra fina debajo del título del menú (dentro de la franja oscura)."""
+        marco = pygame.Rect(0, 0, 400, 8)
+        marco.center = (config.ANCHO // 2, config.ALTO - 64)
+        relleno = marco.inflate(-2, -2)
+        relleno.width = int(relleno.width * progreso)
+        pygame.draw.rect(self.pantalla, self.VERDE_OSCURO, marco, 1)
+        pygame.draw.rect(self.pantalla, self.VERDE_TERMINAL, relleno)
+        texto = self.textos.render(self.fuente_info, f"{int(progreso * 100)}%", self.VERDE_TERMINAL)
+        self.pantalla.blit(texto, texto.get_rect(midleft=(marco.right + 10, marco.centery)))
 
     def dibujar_menu_pausa(self, indice, guardar_on):
+        self.invalidar()  # Pantalla completa fuera del registro de zonas.
         # Oscurecimiento de pantalla.
-        sombra = pygame.Surface((config.ANCHO, config.ALTO)); sombra.set_alpha(128); sombra.fill((0, 0, 0))
-        self.pantalla.blit(sombra, (0, 0))
+        self.pantalla.blit(self._velo((0, 0, 0), 128), (0, 0))
         
-        px = config.ANCHO // 2 - 200; py = config.ALTO // 2 - 225
-        self.pantalla.blit(self.assets['menu_pausa'], (px, py))
-        
-        # Ciclo para dibujar las opciones del menú.
+        # El marco ya trae escritas las opciones; por frame solo van el cursor y el aviso.
+        self.pantalla.blit(*self._capa_pantalla("pausa"))
+        px, py = self.pos_menu_pausa
         start_y = py + 150
-        for i, opcion in enumerate(config.OPCIONES_PAUSA):
-            pos = (px + 120, start_y + i * 80)
-            self.pantalla.blit(self.fuente_ui.render(opcion, True, self.BLANCO), pos)
-            
-            # Si esta opción es la seleccionada, dibujamos el cursor al lado.
-            if i == indice: self.pantalla.blit(self.assets['cursor'], (pos[0]-40, pos[1]))
+        self.pantalla.blit(self.assets['cursor'], (px + 120 - 40, start_y + indice * 80))
             
         if guardar_on:
-             aviso = self.fuente_ui.render("¡PARTIDA GUARDADA!", True, self.VERDE_TERMINAL)
+             aviso = self.textos.render(self.fuente_ui, "¡PARTIDA GUARDADA!", self.VERDE_TERMINAL)
              self.pantalla.blit(aviso, aviso.get_rect(center=(config.ANCHO//2, py + 400)))
 
-    def animar_proyectil(self, p1, p2, boss, log, origen, destino, key_img):
+    @staticmethod
+    def _crear_velo(color, alpha):
+        """Velo de pantalla completa (color con transparencia) para oscurecer lo de atrás."""
+        velo = pygame.Surface((config.ANCHO, config.ALTO)).convert()
+        velo.set_alpha(alpha)
+        velo.fill(color)
+        return velo
+
+    def _velo(self, color, alpha):
         """
-        Esta función bloquea momentáneamente el juego para reproducir una animación.
-        Calculamos una ruta lineal entre origen y destino y movemos la imagen paso a paso.
+        Velo guardado por (color, alpha); antes se creaba y rellenaba en cada frame.
+        """
+        self._pantallas_frame.add((color, alpha))
+        velo = self._capas_pantalla.get((color, alpha))
+        if velo is None:
+            velo = self._crear_velo(color, alpha)
+            self._capas_pantalla[(color, alpha)] = velo
+            self.assets.ajustar()
+        return velo
+
+    def _capa_pantalla(self, clave, escena=None):
+        """
+        Devuelve la parte fija de una pantalla ("menu", "pausa", "victoria" o "derrota"),
+        con sus imágenes y textos ya compuestos, como (superficie, posición): se arma
+        la primera vez y después es un solo blit.
+
+        Las finales llevan además la escena de fondo ('escena' = p1, p2, jefe): se
+        vuelven a armar solo si esa escena se ve distinta. La capa no guarda la
+        imagen grande, así que desalojarla del almacén no la afecta.
         """
-        x, y = origen
-        # Dividimos la distancia en 20 pasos para crear el movimiento.
-        dx = (destino[0] - origen[0]) / 20; dy = (destino[1] - origen[1]) / 20
+        self._pantallas_frame.add(clave)
+        firma = self._firma_fin(clave, escena) if escena is not None else None
+        capa = self._capas_pantalla.get(clave)
+        if capa is None or self._firmas_pantalla.get(clave) != firma:
+            if clave == "menu":
+                capa = self._armar_capa_menu()
+            elif clave == "pausa":
+                capa = self._armar_capa_pausa()
+            else:
+                capa = self._armar_capa_fin(clave, *escena)
+            self._capas_pantalla[clave] = capa
+            self._firmas_pantalla[clave] = firma
+            self.assets.ajustar()
+        return capa
+
+    def _firma_fin(self, clave, escena):
+        """Lo que se ve de la escena detrás de una pantalla final (sprites y estados)."""
+        return (tuple(self._sprites_escena(*escena)),
+                tuple(self._firma_estado(personaje) for personaje in escena))
+
+    def _armar_capa_fin(self, clave, p1, p2, boss):
+        frase, clave_img, color_velo, texto = self.PANTALLAS_FIN[clave]
+        # Fondo base: la escena tal como quedó, sobre una superficie aparte.
+        capa = pygame.Surface(self.rect_pantalla.size).convert()
+        self.lote.destino = capa
+        try:
+            sprites = self._sprites_escena(p1, p2, boss)
+            self._dibujar_escenario(self.rect_pantalla, p1, p2, boss, sprites, self._lineas_log(frase), False)
+            self.lote.enviar()
+        finally:
+            self.lote.destino = self.pantalla
+
+        # Capa semitransparente (alpha 200) para oscurecer el fondo + imagen y texto.
+        capa.blit(self._crear_velo(color_velo, 200), (0, 0))
+
+        # Imagen Centrada y Grande (si cargó bien)
+        if clave_img in self.assets:
+            img = self.assets[clave_img]
+            # Esta línea mágica calcula el centro exacto de la pantalla
+            capa.blit(img, img.get_rect(center=(config.ANCHO//2, config.ALTO//2)))
+
+        # Texto de Salida (Abajo)
+        s = self.fuente_ui.render(texto, True, self.BLANCO)
+        capa.blit(s, s.get_rect(center=(config.ANCHO//2, config.ALTO - 100)))
+        return capa, (0, 0)
+
+    def _armar_capa_menu(self):
+        capa = self.assets["fondo_menu"].copy()
         
-        img = self.assets.get(key_img, self.assets['proy_disparo'])
+        # Franja negra inferior para que el texto se lea bien sobre cualquier fondo.
+        sombra = pygame.Surface((config.ANCHO, 100)); sombra.set_alpha(150); sombra.fill((0,0,0))
+        capa.blit(sombra, (0, config.ALTO - 150))
         
-        for _ in range(20):
-            # Es vital redibujar toda la interfaz en cada paso, si no,
-            # el proyectil dejaría un rastro o borraría el fondo.
-            self.dibujar_interfaz(p1, p2, boss, log)
-            self.dibujar_barras_vida(p1, p2, boss)
-            
-            x += dx; y += dy
-            self.pantalla.blit(img, (x,y))
-            
-            pygame.display.flip(); pygame.time.delay(20)
+        t = self.fuente_titulo.render("PRESIONA ENTER PARA EMPEZAR", True, self.BLANCO)
+        capa.blit(t, t.get_rect(center=(config.ANCHO//2, config.ALTO - 100)))
+        return capa, (0, 0)
+
+    def _armar_capa_pausa(self):
+        # Marco del menú con las opciones escritas encima (coordenadas relativas al marco).
+        capa = self.assets['menu_pausa'].copy()
+        for i, opcion in enumerate(config.OPCIONES_PAUSA):
+            capa.blit(self.fuente_ui.render(opcion, True, self.BLANCO), (120, 150 + i * 80))
+        return capa, self.pos_menu_pausa
+
+    # Iconos que se ponen sobre el objetivo según el tipo de impacto.
+    OVERLAYS_IMPACTO = {
+        "CRITICO": 'est_aturdido',
+        "FUEGO": 'est_quemado',
+        "SANGRE": 'est_sangrado',
+        "CURACION": 'icono_curar',
+        "ESCUDO": 'icono_escudo',
+        "MOTIVACION": 'proy_grito',
+    }
 
-    def animar_impacto(self, p1, p2, boss, log, objetivo_real, tipo_efecto):
+    def dibujar_proyectil(self, p1, p2, boss, log, pos, key_img):
         """
-        Animación de golpe recibido.
+        Un frame de la animación de disparo (la mueve animaciones.Proyectil).
+        La escena va por zonas; el proyectil se dibuja encima y su rectángulo se
+        marca como sucio para borrarlo en el frame siguiente.
+        """
+        self.dibujar_escena(p1, p2, boss, log)
+        img = self.assets.get(key_img, self.assets['proy_disparo'])
+        self.lote.agregar(img, pos, CAPA_EFECTOS)
+        self.lote.enviar()
+        self.ensuciar(img.get_rect(topleft=pos).clip(self.rect_pantalla))
+
+    def dibujar_impacto(self, p1, p2, boss, log, objetivo_real, tipo_efecto):
+        """
+        Un frame de la animación de golpe recibido (la cronometra animaciones.Impacto).
         1. Identificamos quién recibe el golpe.
         2. Cambiamos su sprite a uno de 'dolor' (override).
         3. Mostramos un overlay (fuego, sangre, etc) encima.
         """
-        start = pygame.time.get_ticks()
         pos_efecto = (0, 0); sprite_boss = None; sprite_p1 = None; sprite_p2 = None
 
         # Definimos qué efectos cuentan como "daño" para cambiar la cara del personaje.
@@ -347,37 +699,13 @@ class GestorGrafico:
             pos_efecto = (450, 130)
             if es_dano: sprite_p2 = self.assets['jugador2_dano']
 
-        # Primera fase de la animación (con cara de dolor).
-        while pygame.time.get_ticks() - start < 500:
-            # Aquí pasamos los sprites temporales (override) a dibujar_interfaz.
-            self.dibujar_interfaz(p1, p2, boss, log, sprite_boss_override=sprite_boss, sprite_p1_override=sprite_p1, sprite_p2_override=sprite_p2)
-            self.dibujar_barras_vida(p1, p2, boss)
-            
-            # Seleccionamos el icono del efecto visual.
-            overlay = None
-            if tipo_efecto == "CRITICO": overlay = self.assets['est_aturdido']
-            elif tipo_efecto == "FUEGO": overlay = self.assets['est_quemado']
-            elif tipo_efecto == "SANGRE": overlay = self.assets['est_sangrado']
-            elif tipo_efecto == "CURACION": overlay = self.assets['icono_curar']
-            elif tipo_efecto == "ESCUDO": overlay = self.assets['icono_escudo']
-            elif tipo_efecto == "MOTIVACION": overlay = self.assets['proy_grito']
-            
-            if overlay: self.pantalla.blit(overlay, pos_efecto)
-            pygame.display.flip()
+        # Aquí pasamos los sprites temporales (override) a la escena.
+        self.dibujar_escena(p1, p2, boss, log, sprite_boss_override=sprite_boss,
+                            sprite_p1_override=sprite_p1, sprite_p2_override=sprite_p2)
 
-        # Segunda fase (opcional): Podríamos repetir el bucle para efectos más largos,
-        # pero aquí simplemente mantenemos el efecto visual un poco más.
-        while pygame.time.get_ticks() - start < 500:
-            self.dibujar_interfaz(p1, p2, boss, log, sprite_boss_override=sprite_boss, sprite_p1_override=sprite_p1, sprite_p2_override=sprite_p2)
-            self.dibujar_barras_vida(p1, p2, boss)
-            overlay = None
-            # ... (repite lógica de selección de overlay) ...
-            if tipo_efecto == "CRITICO": overlay = self.assets['est_aturdido']
-            elif tipo_efecto == "FUEGO": overlay = self.assets['est_quemado']
-            elif tipo_efecto == "SANGRE": overlay = self.assets['est_sangrado']
-            elif tipo_efecto == "CURACION": overlay = self.assets['icono_curar']
-            elif tipo_efecto == "ESCUDO": overlay = self.assets['icono_escudo']
-            elif tipo_efecto == "MOTIVACION": overlay = self.assets['proy_grito']
-            
-            if overlay: self.pantalla.blit(overlay, pos_efecto)
-            pygame.display.flip()
\ No newline at end of file
+        clave_overlay = self.OVERLAYS_IMPACTO.get(tipo_efecto)
+        if clave_overlay:
+            overlay = self.assets[clave_overlay]
+            self.lote.agregar(overlay, pos_efecto, CAPA_EFECTOS)
+            self.lote.enviar()
+            self.ensuciar(overlay.get_rect(topleft=pos_efecto).clip(self.rect_pantalla))
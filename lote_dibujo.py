@@ -0,0 +1,93 @@
+import operator
+import pygame
+
+"""
+LOTE DE DIBUJO (UN SOLO Surface.blits POR ENVÍO)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (CAPAS Y CONTADORES):
+-----------------------------------------------------------------------------------------
+CLASE / LÓGICA          | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. CAPAS                | CAPA_FONDO ...        | Orden de pintado: primero la capa
+   (Qué va encima)      | CAPA_EFECTOS          | más baja. Dentro de una capa se
+                        |                       | respeta el orden en que se agregó.
+-----------------------------------------------------------------------------------------
+2. COMANDOS             | agregar(sup, pos,     | Anota un blit; no dibuja nada todavía.
+                        |   capa, area)         | - 'area' = recorte de la superficie
+                        |                       |   de origen (como en Surface.blit).
+-----------------------------------------------------------------------------------------
+3. ENVÍO                | enviar(recorte)       | Ordena por capa, descarta lo que no
+                        |                       | toca 'recorte' y lo manda todo en una
+                        |                       | llamada a Surface.blits.
+                        | - descartar=False     | - Sin descarte (si ya se sabe que todo
+                        |                       |   es visible).
+-----------------------------------------------------------------------------------------
+4. CONTADORES           | cerrar_frame()        | Envíos, blits y descartes del frame;
+                        | ultimo_frame          | quedan en ultimo_frame (perfilador).
+-----------------------------------------------------------------------------------------
+"""
+
+# Capas de la escena de batalla, de atrás hacia adelante.
+CAPA_FONDO = 0     # Capa estática: fondo, personajes y caja de texto.
+CAPA_ESTADOS = 1   # Iconos de estado y escudo sobre las cabezas.
+CAPA_TEXTO = 2     # Log de batalla y aviso ">> ESPACIO".
+CAPA_HUD = 3       # Cajas de vida/energía/estrés.
+CAPA_EFECTOS = 4   # Proyectiles e iconos de impacto de las animaciones.
+
+_POR_CAPA = operator.itemgetter(0)
+
+
+class LoteDibujo:
+    """
+    Lista de comandos de dibujo de un frame.
+
+    Cada pantalla.blit() hecho desde Python paga la llamada del intérprete y la de
+    SDL; aquí se juntan y se mandan de una vez con Surface.blits, que recorre la
+    lista en C.
+    """
+    def __init__(self, destino):
+        self.destino = destino
+        self.comandos = []  # (capa, superficie, posición, área o None)
+        self._frame = {"envios": 0, "dibujos": 0, "descartados": 0}
+        self.ultimo_frame = dict(self._frame)
+
+    def agregar(self, superficie, pos, capa=CAPA_FONDO, area=None):
+        self.comandos.append((capa, superficie, pos, area))
+
+    def enviar(self, recorte=None, descartar=True):
+        """
+        Dibuja todos los comandos pendientes (solo dentro de 'recorte', si se da)
+        y vacía la lista. Devuelve cuántos blits se hicieron.
+        """
+        comandos = self.comandos
+        if not comandos:
+            return 0
+        self.comandos = []
+        comandos.sort(key=_POR_CAPA)  # sort es estable: dentro de la capa no cambia el orden.
+
+        limite = pygame.Rect(recorte) if recorte is not None else self.destino.get_rect()
+        secuencia = []
+        for _, superficie, pos, area in comandos:
+            if descartar:
+                ancho, alto = area.size if area is not None else superficie.get_size()
+                if not limite.colliderect((pos[0], pos[1], ancho, alto)):
+                    continue
+            secuencia.append((superficie, pos, area) if area is not None else (superficie, pos))
+
+        self._frame["descartados"] += len(comandos) - len(secuencia)
+        if not secuencia:
+            return 0
+        if recorte is not None:
+            self.destino.set_clip(limite)
+        self.destino.blits(secuencia, doreturn=False)
+        if recorte is not None:
+            self.destino.set_clip(None)
+        self._frame["envios"] += 1
+        self._frame["dibujos"] += len(secuencia)
+        return len(secuencia)
+
+    def cerrar_frame(self):
+        """Guarda los contadores del frame en ultimo_frame y los reinicia."""
+        self.ultimo_frame = self._frame
+        self._frame = {"envios": 0, "dibujos": 0, "descartados": 0}
+        return self.ultimo_frame
@@ -1,13 +1,16 @@
 import pygame
 import sys
-import random
 import config
 from graficos import GestorGrafico
 from entidades import Personaje, Habilidad, Boss
 from estructuras import GrafoEfectos, GrafoEstrategia, GrafoEstados
 from sistema_combate import ControladorCombate
-from recursos import AlmacenRecursos 
+from recursos import AlmacenRecursos, Precargador
 from sistema_guardado import SistemaGuardado
+import bitacora
+import azar
+from perfilador import PerfiladorFrames
+from animaciones import LineaTiempo, Pausa
 
 """
 PUNTO DE ENTRADA PRINCIPAL (ORQUESTADOR DEL BUCLE)
@@ -34,25 +37,46 @@ SECCIÓN / LÓGICA        | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
                         | - K_p / K_UP / K_DOWN | - Control del Menú de Pausa.
                         | - K_1, K_2... K_q     | - Vincular teclas a habilidades.
                         |                       |   (Aquí añades cheats si quieres).
+                        | - K_F3 / K_F4         | - Perfilador: overlay / traza CSV.
+                        | - K_F2                | - Velocidad de animaciones (turbo).
 -----------------------------------------------------------------------------------------
 5. TURNO DEL JUGADOR    | if turno_jugador...   | Lógica de disparo.
    (Acción)             | - gastar_energia()    | - Verifica si tienes maná.
                         | - ejecutar_habilidad()| - Llama al árbitro (sistema_combate).
 -----------------------------------------------------------------------------------------
 6. TURNO DEL JEFE (IA)  | if not turno_jugador  | Lógica del enemigo.
-   (Cerebro)            | - actualizar_estado() | - Define si está Furioso/Defensivo.
-                        | - seleccionar_...()   | - Ejecuta Algoritmo de Prim (Estrategia).
-                        | - animar_proyectil()  | - **IMPORTANTE**: Aquí se eligen los
-                        |                       |   gráficos de los ataques del jefe.
+   (Cerebro)            | - combate.turno_jefe()| - Humor (Furioso/Defensivo) y Prim
+                        |                       |   (Estrategia) en reglas.turno_jefe.
+                        |                       | - **IMPORTANTE**: Los gráficos de los
+                        |                       |   ataques del jefe (Proyectil/Impacto)
+                        |                       |   se eligen en sistema_combate.py.
 -----------------------------------------------------------------------------------------
 7. FINAL DEL TURNO      | if estado == "JUEGO"  | Gestión de Estados Pasivos.
    (Sangrado/Fuego)     | - procesar_efectos... | - Aplica daño por quemadura al inicio
                         |                       |   del turno (antes de atacar).
 -----------------------------------------------------------------------------------------
 8. RENDERIZADO          | Bloque final if/elif  | Dibuja la escena según estado.
-   (Draw Loop)          | - dibujar_interfaz    | - Mantiene actualizada la pantalla.
+   (Draw Loop)          | - dibujar_escena      | - Solo las zonas que cambiaron.
+                        | - motor.presentar()   | - display.update de esas zonas.
                         | - dibujar_menu_pausa  | - Dibuja la capa superior (Overlay).
 -----------------------------------------------------------------------------------------
+9. PERFILADOR DE FRAMES | perfil.marcar("fase") | Cada sección del bucle cierra su
+                        |                       | tramo con una marca (ver perfilador.py).
+                        |                       | - Si agregas una sección, márcala.
+-----------------------------------------------------------------------------------------
+10. MODO INACTIVO       | inactivo              | Si solo se espera una tecla, el
+                        | - pygame.event.wait   | bucle duerme hasta un evento o el
+                        |                       | próximo parpadeo del aviso.
+                        |                       | - Si agregas algo que se mueva solo,
+                        |                       |   exclúyelo de 'esperando_tecla'.
+-----------------------------------------------------------------------------------------
+11. PRECARGA            | precarga              | Hilo que decodifica las imágenes de
+                        | - Precargador         | la batalla mientras se ve el MENÚ; la
+                        | - barra_carga         | barra de progreso va en dibujar_menu.
+                        | - assets.entregar()   | - Cada cuadro, el hilo principal
+                        |                       |   termina (convert_alpha) lo que el
+                        |                       |   hilo dejó listo.
+-----------------------------------------------------------------------------------------
 """
 
 def obtener_texto_habilidades(personaje):
@@ -88,6 +112,16 @@ def obtener_texto_habilidades(personaje):
     return txt
 
 def main():
+    # Niveles de log de cada subsistema (por defecto en silencio, ver config.py).
+    bitacora.configurar(config.NIVELES_LOG,
+                        capacidad_buffer=config.CAPACIDAD_BUFFER_LOG,
+                        archivo_volcado=config.ARCHIVO_VOLCADO_LOG)
+
+    # Semilla de todos los dados de la partida. Con la misma semilla (y las mismas
+    # teclas) el combate se repite igual; por eso la muestro al arrancar.
+    semilla = azar.sembrar(config.SEMILLA_AZAR)
+    print(f"Semilla de la partida: {semilla}")
+
     # Iniciamos el motor de Pygame y la ventana.
     pygame.init()
 
@@ -113,7 +147,15 @@ def main():
     # GestorGrafico se encarga de pintar y ControladorCombate de las reglas.
     motor = GestorGrafico(pantalla)
     grafo_estados = GrafoEfectos()
-    combate = ControladorCombate(grafo_estados, motor)
+    # Cola de animaciones: el combate y la IA encolan, el bucle las reproduce sin bloquear.
+    linea = LineaTiempo(config.VELOCIDAD_ANIMACION)
+    combate = ControladorCombate(grafo_estados, motor, linea=linea)
+
+    # Las imágenes de la batalla se cargan de fondo mientras se ve el menú; si el
+    # juego pide una antes de tiempo, se carga en ese momento (ver recursos.py).
+    precarga = Precargador(motor.assets, motor.almacen.claves_precarga())
+    precarga.start()
+    barra_carga = False  # ¿El último frame dibujó la barra de progreso del menú?
 
     # Instancias de la IA del Jefe
     cerebro_comportamiento = GrafoEstados() 
@@ -137,6 +179,9 @@ def main():
 
     # Lista para alternar turnos entre los dos soldados.
     equipo = [p1, p2]
+    # Las animaciones se dibujan con una foto de los tres tomada al encolarlas (el HUD
+    # no adelanta el resultado de las reglas, que se resuelven al instante).
+    linea.observar(p1, p2, jefe)
     indice_turno = 0
     turno_jugador = True # Por defecto empieza el jugador
 
@@ -190,15 +235,50 @@ def main():
         # Si no hay datos, iniciamos normal
         atacante_actual = equipo[indice_turno]
         mensaje_log = f"¡Misión Iniciada!\nTurno: {atacante_actual.nombre}\n{obtener_texto_habilidades(atacante_actual)}"
+
+    # Cronómetro por fases del bucle (F3 muestra el overlay, F4 vuelca la traza CSV).
+    perfil = PerfiladorFrames(config.CAPACIDAD_PERFILADOR, config.MOSTRAR_PERFILADOR)
+    dt = 0  # Milisegundos que duró el frame anterior (los devuelve reloj.tick).
+    dt_maximo = 1000 // config.FPS * 2  # Tope de avance por frame (ver A2).
+    inactivo = False  # ¿El frame anterior quedó esperando solo una tecla?
     
     while True:
+        # --- 0. MODO INACTIVO ---
+        # Si no hay nada que animar y el juego solo espera al jugador, no tiene sentido
+        # redibujar lo mismo a 60 FPS: dormimos hasta el próximo evento o parpadeo.
+        eventos = []
+        if inactivo:
+            espera = config.ESPERA_INACTIVO_MAX
+            if estado == "JUEGO" and not pausado and esperando_continuar:
+                espera = min(espera, motor.ms_hasta_parpadeo() + 1)
+            evento = pygame.event.wait(espera)
+            if evento.type != pygame.NOEVENT:
+                eventos.append(evento)
+            # El tiempo dormido no es tiempo de animación: se descarta para que el
+            # próximo tick() no lo cuente (si no, la tecla que despierta el bucle
+            # encolaría un ataque y el primer avanzar() se lo saltaría entero).
+            reloj.tick()
+        perfil.marcar("espera")
+
         # --- A. CONTROL DE EVENTOS (TECLADO/RATÓN) ---
         # Aquí capturo todo lo que hace el usuario.
-        for evento in pygame.event.get():
+        eventos.extend(pygame.event.get())
+        for evento in eventos:
             if evento.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             
             if evento.type == pygame.KEYDOWN:
+                # Teclas de velocidad y del perfilador (funcionan en cualquier pantalla).
+                if evento.key == pygame.K_F3:
+                    perfil.alternar()
+                    motor.invalidar()  # Para borrar el overlay al ocultarlo.
+                elif evento.key == pygame.K_F2:
+                    velocidad = linea.ciclar_velocidad(config.VELOCIDADES_ANIMACION)
+                    print(f"Velocidad de animaciones: {'instantánea' if linea.instantanea else f'x{velocidad:g}'}")
+                elif evento.key == pygame.K_F4:
+                    frames = perfil.volcar_csv(config.ARCHIVO_TRAZA_FRAMES)
+                    print(f"Traza de {frames} frames guardada en {config.ARCHIVO_TRAZA_FRAMES}")
+
                 #  Lógica del Menú Principal
                 if estado == "MENU":
                     if evento.key == pygame.K_RETURN:
@@ -236,7 +316,8 @@ def main():
                                 if exito:
                                     mostrar_guardado_timer = 90
                     
-                    else:
+                    elif not linea.ocupada:
+                        # Mientras se reproduce una animación no se aceptan acciones.
                         # AVANCE DE TEXTO (Barra Espaciadora)
                         # Esta es la parte más importante del ritmo del juego.
                         if esperando_continuar:
@@ -314,12 +395,22 @@ def main():
                                     else:
                                         # Feedback visual si no hay maná
                                         mensaje_err = f"¡Sin energía! Requiere {habilidad.costo} EP"
-                                        motor.dibujar_interfaz(p1, p2, jefe, mensaje_err)
-                                        pygame.display.flip(); pygame.time.delay(1000)
+                                        linea.agregar(Pausa(1000, mensaje_err))
+
+        perfil.marcar("eventos")
+
+        # --- A2. ANIMACIONES ---
+        # La cola avanza con el tiempo real del frame anterior (se congela en pausa).
+        # Un frame trabado (ventana arrastrada, disco lento) avanza como mucho dos
+        # frames, para que no se salte animaciones enteras.
+        if estado == "JUEGO" and not pausado:
+            linea.avanzar(min(dt, dt_maximo))
+        perfil.marcar("animaciones")
 
         # --- B. VERIFICACIÓN DE ESTADO DEL JUEGO ---
-        # Compruebo en cada frame si alguien ganó para cambiar de pantalla.
-        if estado == "JUEGO":
+        # Compruebo en cada frame si alguien ganó para cambiar de pantalla
+        # (después de que termine de verse el golpe final).
+        if estado == "JUEGO" and not linea.ocupada:
             if jefe.vida_actual <= 0:
                 estado = "VICTORIA"
                 sistema.borrar_partida() 
@@ -328,10 +419,12 @@ def main():
                 estado = "DERROTA"
                 sistema.borrar_partida()
 
+        perfil.marcar("verificacion")
+
         # --- C. PROCESAMIENTO DE EFECTOS PASIVOS ---
         # Esto ocurre justo al iniciar el turno, antes de que nadie mueva un dedo.
         # Gestiona quemaduras, sangrados y checkea si alguien está aturdido.
-        if estado == "JUEGO" and not pausado and not esperando_continuar and not efectos_ya_procesados:
+        if estado == "JUEGO" and not pausado and not esperando_continuar and not efectos_ya_procesados and not linea.ocupada:
             
             personaje_a_evaluar = equipo[indice_turno] if turno_jugador else jefe
             
@@ -353,142 +446,82 @@ def main():
                 # Si hubo algún efecto (daño o curación), lo mostramos y pausamos.
                 if msg_efectos:
                     mensaje_log = msg_efectos
-                    motor.dibujar_interfaz(p1, p2, jefe, mensaje_log, esperando_espacio=True)
-                    pygame.display.flip(); pygame.time.delay(500)
+                    linea.agregar(Pausa(500, mensaje_log, esperando_espacio=True))
                     esperando_continuar = True 
                     if pierde_turno: mensaje_log += "\n(Aturdido: Pierde turno)"
 
+        perfil.marcar("efectos")
+
         # --- D. INTELIGENCIA ARTIFICIAL (BOSS) ---
-        if estado == "JUEGO" and not turno_jugador and not pausado and not esperando_continuar and not ataque_realizado:
+        if estado == "JUEGO" and not turno_jugador and not pausado and not esperando_continuar and not ataque_realizado and not linea.ocupada:
             
             if boss_perdio_turno:
                 pass 
             else:
-                pygame.time.delay(500)
-                
-                # ACTUALIZAR ESTADO DE ÁNIMO 
-                # Primero reviso las variables vitales del jefe para ver si entra en Furia o se pone a la defensiva.
-                cerebro_comportamiento.actualizar_estado(jefe)
-                estado_boss = cerebro_comportamiento.estado_actual
-                bonus = cerebro_comportamiento.obtener_bonificadores()
-                
-                # Aquí verifico si el jefe viene "cebado" de un turno anterior.
-                # Si activó un boost de ataque recientemente, aplico el multiplicador extra y descuento un turno del contador.
-                mult_extra_ataque = 1.0
-                if jefe.turnos_buff_ataque > 0:
-                    mult_extra_ataque = 1.3 
-                    jefe.turnos_buff_ataque -= 1 
-
-                # Armo el mensaje de cabecera, avisando si hay buffs activos para que el jugador sepa por qué le pegan tan duro.
-                mensaje_log = f"Turno: {jefe.nombre} [{estado_boss}]"
-                if jefe.turnos_buff_ataque > 0: mensaje_log += " (ATK UP)"
-                if jefe.turnos_buff_defensa > 0: mensaje_log += " (DEF UP)"
-                
-                #  SELECCIONAR ESTRATEGIA ÓPTIMA (ALGORITMO DE PRIM)
-                # Le pregunto al grafo cuál es el siguiente movimiento más eficiente según los costos.
-                nodo_ataque = cerebro_estrategia.seleccionar_siguiente_ataque(jefe)
-                
-                # EJECUTAR LA ACCIÓN DEL NODO
-                # Calculo el daño base combinando su estadística natural, el estado de ánimo (Furia/Normal) y el buff temporal si lo tuviera.
-                dmg_base = jefe.ataque_base * bonus["ataque"] * mult_extra_ataque
-                
-                # Elijo una víctima al azar entre los que sigan vivos.
-                candidatos = [p for p in equipo if p.esta_vivo()]
-                objetivo = random.choice(candidatos) if candidatos else p1
+                # Pequeña pausa antes de que el jefe actúe (con el texto anterior en pantalla).
+                linea.agregar(Pausa(500, mensaje_log))
                 
-                # Extraigo los datos del nodo elegido para saber qué hacer.
-                efecto = nodo_ataque.efecto_tipo
-                valor = nodo_ataque.valor_efecto 
-                
-                msg_accion = ""
-                dano_final = 0
-                
-                if "dano" in efecto:
-                    # Calculo el daño final sumando el porcentaje de potencia de la habilidad (ej. Molotov pega más que Bala).
-                    factor_dano = 1.0 + valor 
-                    dano_final = int(dmg_base * factor_dano)
-                    
-                    # Aplico el daño y capturo el mensaje por si el jugador tenía un escudo activo.
-                    msg_escudo = objetivo.recibir_dano(dano_final)
-                    msg_accion = f"¡{nodo_ataque.nombre}!\nDaño: {dano_final}"
-                    if isinstance(msg_escudo, str) and "bloqueó" in msg_escudo:
-                         msg_accion += "\n(Bloqueado)"
-
-                    # Aquí está la clave: reviso si este ataque trae un efecto secundario (como fuego o cuchillo)
-                    # para aplicárselo al jugador y actualizar su estado.
-                    codigo_evento = nodo_ataque.efecto_estado
-                    
-                    if codigo_evento:
-                        # El grafo de efectos me dice en qué se convierte el jugador (ej. Normal + Fuego -> Quemado).
-                        nuevo_estado = grafo_estados.transicion(objetivo.estado_actual, codigo_evento)
-                        
-                        if nuevo_estado != objetivo.estado_actual:
-                            objetivo.estado_actual = nuevo_estado
-                            msg_accion += f"\n¡{objetivo.nombre} está {nuevo_estado}!"
-                            
-                            # Si logré quemarlo, inicio el contador para que sufra daño en los siguientes turnos.
-                            if nuevo_estado == "Quemado":
-                                objetivo.turnos_quemado = config.DURACION_QUEMADO 
-                    
-                    # Elijo la animación correcta dependiendo de si lo quemé, lo corté o fue un golpe seco.
-                    nombre_ataque = nodo_ataque.nombre
-                    sprite_proyectil = 'proy_molotov' # Imagen por defecto
-                    
-                    if "Bala" in nombre_ataque:
-                        sprite_proyectil = 'proy_disparo'
-                    elif "Cuchillo" in nombre_ataque:
-                        sprite_proyectil = 'proy_cuchillo'
-                    
-                    #  SELECCIÓN DE EFECTO DE IMPACTO (Fuego, Sangre o Normal)
-                    tipo_anim = "FUEGO" if nodo_ataque.efecto_estado == "fuego" else "SANGRE" if nodo_ataque.efecto_estado == "cuchillo" else "NORMAL"
-                    
-                    # EJECUCIÓN CON LA VARIABLE DINÁMICA
-                    # Usamos 'sprite_proyectil' en lugar del texto fijo
-                    motor.animar_proyectil(p1, p2, jefe, msg_accion, (950, 200), (300, 380), sprite_proyectil)
-                    motor.animar_impacto(p1, p2, jefe, msg_accion, objetivo, tipo_anim)
-
-                if "cura" in efecto:
-                    cura = int(jefe.vida_max * valor)
-                    jefe.curar(cura)
-                    msg_accion += f"\nSe cura {cura} HP."
-                    motor.animar_impacto(p1, p2, jefe, msg_accion, jefe, "CURACION")
-
-                # Por último, si la habilidad que usó era de soporte (como Táctica), activo los contadores
-                # para que el jefe quede potenciado durante los próximos 3 turnos.
-                if nodo_ataque.boost == "ataque":
-                    jefe.turnos_buff_ataque = 3 
-                    msg_accion += "\n¡Sube su ATAQUE!"
-                    
-                if nodo_ataque.boost == "defensa":
-                    jefe.turnos_buff_defensa = 3 
-                    msg_accion += "\n¡Sube su DEFENSA!"
-                    motor.animar_impacto(p1, p2, jefe, msg_accion, jefe, "ESCUDO")
-
-                # Actualizar log y pasar turno
-                mensaje_log = f"{mensaje_log}\n{msg_accion}"
+                # Humor, estrategia (Prim), víctima, daño y efectos: la regla está en reglas.turno_jefe
+                # (la misma que usa el simulador); el controlador encola las animaciones y arma el texto.
+                mensaje_log = combate.turno_jefe(jefe, equipo, cerebro_comportamiento, cerebro_estrategia)
                 ataque_realizado = True 
                 esperando_continuar = True
+        perfil.marcar("ia")
+
         # --- E. RENDERIZADO (DIBUJADO) ---
         # Dependiendo del estado global, le pido al motor que dibuje una cosa u otra.
+        barra_carga = False
+        # Lo que el precargador decodificó se termina aquí, en el hilo que dibuja.
+        motor.assets.entregar()
         if estado == "MENU": 
-            motor.dibujar_menu()
+            progreso = precarga.progreso
+            barra_carga = progreso < 1
+            motor.dibujar_menu(progreso)
         elif estado == "VICTORIA":
-            motor.dibujar_interfaz(p1, p2, jefe, "¡VICTORIA!") # Fondo base
-            motor.dibujar_victoria() # Capa superior
+            # Escena final, velo, imagen y texto van en una sola capa ya compuesta.
+            motor.dibujar_victoria(p1, p2, jefe)
         elif estado == "DERROTA":
-            motor.dibujar_interfaz(p1, p2, jefe, "¡DERROTA!") 
-            motor.dibujar_derrota()  
+            motor.dibujar_derrota(p1, p2, jefe)
         elif estado == "JUEGO":
-            motor.dibujar_interfaz(p1, p2, jefe, mensaje_log, esperando_espacio=esperando_continuar)
-            motor.dibujar_barras_vida(p1, p2, jefe)
-            
-            # Si estamos en pausa, dibujamos el menú flotante encima de todo.
-            if pausado: 
+            perfil.marcar("pantallas")
+            if pausado:
+                # Si estamos en pausa, dibujamos el menú flotante encima de todo
+                # (la escena va completa porque el menú la oscurece entera).
+                motor.dibujar_interfaz(p1, p2, jefe, mensaje_log, esperando_espacio=esperando_continuar)
+                motor.dibujar_barras_vida(p1, p2, jefe)
                 motor.dibujar_menu_pausa(indice_pausa, mostrar_guardado_timer > 0)
+            elif linea.ocupada:
+                # Frame de la animación en curso (proyectil, impacto o pausa de lectura).
+                linea.dibujar(motor, p1, p2, jefe, mensaje_log)
+            else:
+                # Solo se redibujan las zonas que cambiaron (log, barras, aviso, sprites).
+                motor.dibujar_escena(p1, p2, jefe, mensaje_log, esperando_espacio=esperando_continuar)
+            perfil.marcar("interfaz")
+
+        perfil.marcar("pantallas")
+        rect_overlay = perfil.dibujar(pantalla)
+        if rect_overlay:
+            motor.ensuciar(rect_overlay)
+        perfil.marcar("perfilador")
+
+        # Mandamos a la pantalla real solo lo que cambió y mantenemos los FPS estables.
+        motor.presentar()
+        perfil.marcar("flip")
+        dt = reloj.tick(config.FPS)
+        perfil.marcar("espera")
+        perfil.terminar_frame()
 
-        # Actualizamos la pantalla real y mantenemos los FPS estables.
-        pygame.display.flip()
-        reloj.tick(config.FPS)
+        # ¿Queda el juego esperando solo una tecla? (Con el perfilador visible se sigue
+        # a FPS completos para que sus números signifiquen algo.)
+        esperando_tecla = (
+            estado in ("MENU", "VICTORIA", "DERROTA")
+            or pausado
+            or esperando_continuar
+            or (turno_jugador and efectos_ya_procesados and not ataque_realizado and not jugador_perdio_turno)
+        )
+        # La barra de carga del menú se mueve sola: mientras se vea, no se duerme.
+        inactivo = (config.MODO_INACTIVO and esperando_tecla and not linea.ocupada
+                    and not perfil.visible and not barra_carga)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,124 @@
+import time
+import numpy as np
+import config
+from estructuras import ArbolAtaque
+
+"""
+MONTE CARLO VECTORIZADO (MUCHAS TIRADAS DEL ÁRBOL A LA VEZ)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (MUESTREO EN LOTE):
+-----------------------------------------------------------------------------------------
+FUNCIÓN / SECCIÓN       | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. CÓDIGOS DE RESULTADO | CODIGO_CRITICO, ...   | Enteros que reemplazan los textos
+                        | TIPOS_RESULTADO       | "CRITICO", "NORMAL"... en los arreglos.
+-----------------------------------------------------------------------------------------
+2. MUESTREO             | muestrear_ataques()   | Mismo sorteo que ArbolAtaque (tabla
+                        | - arbol               | de alias del ArbolCompilado), pero con
+                        |                       | NumPy: N tiradas en una llamada.
+                        |                       | - Sin 'arbol' usa el de por defecto
+                        |                       |   (PROB_* de config.py); sirve
+                        |                       |   cualquier árbol, también n-ario.
+-----------------------------------------------------------------------------------------
+3. DISTRIBUCIÓN         | distribucion_dano()   | Histograma del daño final para un
+                        |                       | valor de ataque (balanceo).
+-----------------------------------------------------------------------------------------
+"""
+
+# Códigos enteros de cada hoja del árbol (el índice coincide con TIPOS_RESULTADO).
+CODIGO_CRITICO = 0
+CODIGO_NORMAL = 1
+CODIGO_TROPIEZO = 2
+CODIGO_FALLO = 3
+TIPOS_RESULTADO = ("CRITICO", "NORMAL", "TROPIEZO", "FALLO")
+
+
+def tablas_arbol(arbol):
+    """
+    Pasa un ArbolCompilado a arreglos de NumPy, una posición por hoja.
+
+    Returns:
+        (umbral, alias, codigos, multiplicadores, fijos). Los tres últimos siguen la
+        regla de ArbolAtaque.empaquetar: TROPIEZO es daño fijo, FALLO es 0 y el resto
+        multiplica el ataque.
+    """
+    codigos = []
+    multiplicadores = []
+    fijos = []
+    for tipo, _, valor in arbol.hojas:
+        if tipo not in TIPOS_RESULTADO:
+            raise ValueError(f"Tipo de hoja desconocido para el muestreo en lote: {tipo}")
+        codigos.append(TIPOS_RESULTADO.index(tipo))
+        multiplicadores.append(0.0 if tipo in ("TROPIEZO", "FALLO") else valor)
+        fijos.append(valor if tipo == "TROPIEZO" else 0)
+    return (np.array(arbol.umbral), np.array(arbol.alias, dtype=np.intp),
+            np.array(codigos, dtype=np.int8), np.array(multiplicadores),
+            np.array(fijos, dtype=np.int64))
+
+
+def muestrear_ataques(ataques, cantidad=None, generador=None, arbol=None):
+    """
+    Versión vectorizada de ArbolAtaque.ejecutar_ataque.
+
+    Args:
+        ataques: Arreglo (o lista) con el daño base de cada tirada, o un solo número
+                 si se indica 'cantidad'.
+        cantidad: Número de tiradas cuando 'ataques' es un escalar.
+        generador: np.random.Generator opcional (para repetir resultados con semilla).
+        arbol: ArbolCompilado a sortear (por defecto, ArbolAtaque.compilado_base()).
+
+    Returns:
+        (codigos, danos): dos arreglos del mismo largo. 'codigos' usa CODIGO_*,
+        'danos' es el daño final con la misma regla que el árbol
+        (TROPIEZO devuelve el daño autoinfligido, FALLO devuelve 0).
+    """
+    ataques = np.asarray(ataques)
+    if ataques.ndim == 0:
+        ataques = np.full(cantidad if cantidad is not None else 1, ataques)
+
+    if generador is None:
+        generador = np.random.default_rng()
+    if arbol is None:
+        arbol = ArbolAtaque.compilado_base()
+    umbral, alias, codigos_hoja, multiplicadores, fijos = tablas_arbol(arbol)
+
+    # Un dado por tirada, igual que ArbolCompilado.indice(): la parte entera elige la
+    # casilla y la fraccionaria decide entre la hoja de la casilla y su alias.
+    u = generador.random(ataques.shape[0]) * arbol.n
+    casilla = np.minimum(u.astype(np.intp), arbol.n - 1)
+    hojas = np.where(u - casilla < umbral[casilla], casilla, alias[casilla])
+
+    # int() de Python trunca hacia cero; np.trunc reproduce exactamente ese redondeo.
+    danos = np.trunc(ataques * multiplicadores[hojas]).astype(np.int64) + fijos[hojas]
+
+    return codigos_hoja[hojas], danos
+
+
+def distribucion_dano(ataque, cantidad, generador=None):
+    """
+    Devuelve {daño: probabilidad} para los golpes que sí llegan al objetivo
+    (CRITICO y NORMAL), más la frecuencia de cada tipo de resultado.
+    """
+    codigos, danos = muestrear_ataques(ataque, cantidad, generador)
+
+    frecuencias = np.bincount(codigos, minlength=len(TIPOS_RESULTADO)) / cantidad
+    por_tipo = {TIPOS_RESULTADO[i]: float(frecuencias[i]) for i in range(len(TIPOS_RESULTADO))}
+
+    # bincount es mucho más rápido que ordenar (np.unique) porque los daños son enteros chicos.
+    conteos = np.bincount(danos[codigos <= CODIGO_NORMAL])
+    por_dano = {int(v): conteos[v] / cantidad for v in np.flatnonzero(conteos)}
+
+    return por_tipo, por_dano
+
+
+if __name__ == "__main__":
+    cantidad = 1_000_000
+    inicio = time.perf_counter()
+    por_tipo, por_dano = distribucion_dano(config.P1_ATAQUE, cantidad)
+    duracion = time.perf_counter() - inicio
+
+    print(f"{cantidad:,} tiradas en {duracion * 1000:.1f} ms")
+    for tipo, prob in por_tipo.items():
+        print(f"   {tipo:<9} {prob * 100:6.2f}%")
+    for dano, prob in por_dano.items():
+        print(f"   Daño {dano:<4} {prob * 100:6.2f}%")
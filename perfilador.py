@@ -0,0 +1,153 @@
+import csv
+import time
+import collections
+import pygame
+import fuentes
+
+"""
+PERFILADOR DE FRAMES (¿EN QUÉ SE VAN LOS 16 MS?)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (FASES Y SALIDAS):
+-----------------------------------------------------------------------------------------
+CLASE / LÓGICA          | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. FASES                | FASES                 | Nombres de los tramos del bucle de
+                        |                       | main.py, en el orden en que ocurren.
+                        | marcar("fase")        | - Suma el tiempo desde la marca
+                        |                       |   anterior a esa fase (cronómetro
+                        |                       |   de vueltas: no hay que reindentar).
+-----------------------------------------------------------------------------------------
+2. HISTORIAL            | capacidad             | Últimos N frames en un deque.
+                        | terminar_frame()      | - Cierra el frame y empieza otro.
+-----------------------------------------------------------------------------------------
+3. OVERLAY (F3)         | dibujar()             | p50/p95/p99 del frame completo y el
+                        | - CADA_N_FRAMES       | p95 de cada fase. El texto solo se
+                        |                       | recalcula cada N frames.
+-----------------------------------------------------------------------------------------
+4. TRAZA CSV (F4)       | volcar_csv(ruta)      | Una fila por frame y una columna por
+                        |                       | fase (en milisegundos).
+-----------------------------------------------------------------------------------------
+"""
+
+# Tramos del bucle principal. "animaciones" es avanzar la línea de tiempo,
+# "interfaz" es la escena con sus barras (o el frame de la animación en curso),
+# "pantallas" agrupa menú, victoria y derrota, y "flip" es la presentación
+# (display.update de las zonas sucias).
+FASES = ("eventos", "animaciones", "verificacion", "efectos", "ia", "interfaz",
+         "pantallas", "perfilador", "flip", "espera")
+
+CADA_N_FRAMES = 15  # Cada cuántos frames se recalculan los percentiles del overlay.
+
+
+def percentil(ordenados, p):
+    """Percentil p (0-100) de una lista YA ordenada (vecino más cercano)."""
+    if not ordenados:
+        return 0.0
+    i = min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))
+    return ordenados[i]
+
+
+class PerfiladorFrames:
+    """
+    Cronómetro por fases del bucle principal.
+
+    Cada frame es una lista con los segundos gastados en cada fase de FASES.
+    Medir cuesta una llamada a perf_counter por marca, así que puede quedar siempre
+    encendido: el overlay solo se dibuja cuando está visible.
+    """
+    def __init__(self, capacidad=600, visible=False):
+        self.visible = visible
+        self.indices = {nombre: i for i, nombre in enumerate(FASES)}
+        self.historial = collections.deque(maxlen=capacidad)  # (nº frame, [segundos por fase])
+        self.numero_frame = 0
+        self.frame = [0.0] * len(FASES)
+        self.ultimo = time.perf_counter()
+
+        self._superficie = None
+
+    def marcar(self, fase):
+        """Suma a 'fase' el tiempo transcurrido desde la marca anterior."""
+        ahora = time.perf_counter()
+        self.frame[self.indices[fase]] += ahora - self.ultimo
+        self.ultimo = ahora
+
+    def terminar_frame(self):
+        """Guarda el frame actual en el historial y arranca uno nuevo."""
+        self.historial.append((self.numero_frame, self.frame))
+        self.numero_frame += 1
+        self.frame = [0.0] * len(FASES)
+        self.ultimo = time.perf_counter()
+        if self.visible and self.numero_frame % CADA_N_FRAMES == 0:
+            self._superficie = None  # Toca recalcular el texto del overlay.
+
+    def alternar(self):
+        self.visible = not self.visible
+        self._superficie = None
+
+    # ==========================================
+    # ESTADÍSTICAS
+    # ==========================================
+    def resumen(self):
+        """
+        Devuelve {"frame": (p50, p95, p99), "trabajo": (...), fase: p95...} en ms.
+        'trabajo' es el frame sin la espera de reloj.tick (lo que de verdad costó).
+        """
+        if not self.historial:
+            return {}
+        i_espera = self.indices["espera"]
+        totales = sorted(sum(f) * 1000 for _, f in self.historial)
+        trabajo = sorted((sum(f) - f[i_espera]) * 1000 for _, f in self.historial)
+
+        datos = {
+            "frame": tuple(percentil(totales, p) for p in (50, 95, 99)),
+            "trabajo": tuple(percentil(trabajo, p) for p in (50, 95, 99)),
+        }
+        for nombre, i in self.indices.items():
+            datos[nombre] = percentil(sorted(f[i] * 1000 for _, f in self.historial), 95)
+        return datos
+
+    # ==========================================
+    # SALIDAS
+    # ==========================================
+    def dibujar(self, pantalla):
+        """
+        Dibuja el overlay en la esquina superior central (si está visible).
+        Devuelve el rectángulo que ocupó (o None) para que el motor lo presente.
+        """
+        if not self.visible:
+            return None
+        if self._superficie is None:
+            self._superficie = self._armar_overlay()
+        return pantalla.blit(self._superficie, ((pantalla.get_width() - self._superficie.get_width()) // 2, 10))
+
+    def _armar_overlay(self):
+        fuente = fuentes.obtener("Consolas", 14)
+        datos = self.resumen()
+        if not datos:
+            lineas = ["Perfilador: sin datos todavía"]
+        else:
+            lineas = [
+                "FRAME    p50 {:6.2f}  p95 {:6.2f}  p99 {:6.2f} ms".format(*datos["frame"]),
+                "TRABAJO  p50 {:6.2f}  p95 {:6.2f}  p99 {:6.2f} ms".format(*datos["trabajo"]),
+            ]
+            for nombre in FASES:
+                lineas.append(f"  {nombre:<13} p95 {datos[nombre]:6.2f} ms")
+
+        renders = [fuente.render(linea, True, (50, 255, 50)) for linea in lineas]
+        alto_linea = fuente.get_linesize()
+        ancho = max(r.get_width() for r in renders) + 16
+        superficie = pygame.Surface((ancho, alto_linea * len(renders) + 12))
+        superficie.set_alpha(210)
+        superficie.fill((0, 0, 0))
+        for i, render in enumerate(renders):
+            superficie.blit(render, (8, 6 + i * alto_linea))
+        return superficie
+
+    def volcar_csv(self, ruta):
+        """Escribe el historial como CSV: frame, total_ms y una columna por fase (ms)."""
+        with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(["frame", "total_ms"] + [f"{nombre}_ms" for nombre in FASES])
+            for numero, frame in self.historial:
+                escritor.writerow([numero, f"{sum(frame) * 1000:.4f}"] + [f"{t * 1000:.4f}" for t in frame])
+        return len(self.historial)
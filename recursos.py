@@ -1,6 +1,10 @@
 import pygame
 import config
 import os
+import json
+import threading
+import collections
+from cache_superficies import CacheSuperficies
 
 """
 GESTOR DE RECURSOS (IMÁGENES Y AUDIO)
@@ -13,15 +17,16 @@ CLASE / SECCIÓN         | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
    (Rutas y Audio)      | - self.ruta_img       | - Cambiar carpeta de imágenes ("img/").
                         | - pygame.mixer.init() | - Inicializa el motor de audio.
 -----------------------------------------------------------------------------------------
-2. LISTA DE IMÁGENES    | cargar_todos()        | **AQUÍ AGREGAS/CAMBIAS SPRITES**
-   (El Inventario)      | - self.cargar(...)    | Formato: ('clave', "archivo.png", (W, H))
-                        |                       |
-                        |   A. FONDOS/UI        | - Cambiar tamaño (ancho, alto) de cajas.
-                        |   B. PERSONAJES       | - Cambiar "soldado1.png" por tu archivo.
-                        |   C. PANTALLAS FINAL  | - "victoria_final" y "game_over".
-                        |   D. ICONOS/ESTADOS   | - Proyectiles y efectos (fuego/sangre).
+2. LISTA DE IMÁGENES    | manifiesto.json       | **AQUÍ AGREGAS/CAMBIAS SPRITES**
+   (El Inventario)      | (config.RUTA_         | Una entrada por imagen: clave,
+                        |  MANIFIESTO)          | archivo, tamano ([W, H] o "pantalla"),
+                        |                       | grupo y prioridad (menor = antes).
+                        | - "grupos"            | - "fijo": false = se puede desalojar
+                        |                       |   (ej. "finales": victoria/game over).
+                        | - "alias"             | - Clave que reutiliza otra imagen.
+                        | cargar_todos()        | - Lee el manifiesto y llama a cargar().
 -----------------------------------------------------------------------------------------
-3. AUDIO                | cargar_todos()        | Carga de SFX (Efectos cortos).
+3. AUDIO                | cargar_sonidos()      | Carga de SFX (Efectos cortos).
                         | - cargar_sonido(...)  | - Vincula una clave con la ruta de config.
                         |-----------------------|----------------------------------------
                         | cargar_sonido()       | Ajustes del archivo de audio.
@@ -31,20 +36,266 @@ CLASE / SECCIÓN         | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
    (Seguridad)          | - try / except        | - Si falla, crea un cuadro MAGENTA.
                         | - surf.fill(...)      | - Cambiar color del placeholder error.
 -----------------------------------------------------------------------------------------
+5. ATLAS DE TEXTURAS    | abrir_atlas()         | Si existe config.RUTA_ATLAS (se arma
+   (Opcional)           | - config.USAR_ATLAS   | con 'python atlas.py'), los sprites
+                        |                       | chicos salen de ahí como subsuperficies.
+                        |                       | - Si una imagen cambió de archivo o
+                        |                       |   tamaño, se carga suelta como antes.
+-----------------------------------------------------------------------------------------
+6. CACHÉ EN DISCO       | self.cache            | Lo que no vino del atlas se guarda ya
+   (Arranque rápido)    | - config.USAR_CACHE_  | escalado en RUTA_CACHE_SUPERFICIES;
+                        |   SUPERFICIES         | el próximo arranque lo lee sin
+                        |                       | decodificar (ver cache_superficies.py).
+-----------------------------------------------------------------------------------------
+7. CARGA PEREZOSA       | RecursosPerezosos     | cargar() solo anota la imagen; se lee
+   (Bajo demanda)       | - config.CARGA_       | la primera vez que alguien hace
+                        |   PEREZOSA            | assets['clave'].
+                        | Precargador           | - Hilo que las va DECODIFICANDO de
+                        | - claves_precarga()   |   fondo mientras se ve el MENÚ (con
+                        |                       |   barra de progreso en dibujar_menu).
+                        | - _decodificar()      | - Regla de hilos: el hilo solo lee
+                        | - _terminar()         |   archivos y decodifica en superficies
+                        | - assets.entregar()   |   nuevas; convert_alpha, el atlas y la
+                        |                       |   caché se hacen en el hilo principal
+                        |                       |   (main llama a entregar() cada cuadro).
+-----------------------------------------------------------------------------------------
+8. MEMORIA              | reporte_memoria()     | Bytes por imagen, por grupo y atlas
+   (Presupuesto)        | python recursos.py    | (lo imprime 'python recursos.py').
+                        | - registrar_derivadas | - Capas armadas a partir de las
+                        |                       |   imágenes (graficos.py) también
+                        |                       |   cuentan para el presupuesto; si
+                        |                       |   desalojar no alcanza, se les pide
+                        |                       |   que se encojan (su 'encoger').
+                        | - config.PRESUPUESTO_ | - Si se pasa del límite, se desalojan
+                        |   MEMORIA_MB          |   las de grupos no fijos, la usada
+                        |                       |   hace más tiempo primero; se vuelven
+                        |                       |   a cargar solas si se piden.
+-----------------------------------------------------------------------------------------
 """
 
+
+def bytes_superficie(superficie):
+    """
+    Memoria de los píxeles de una superficie. Una subsuperficie (pieza del atlas)
+    cuenta 0: sus píxeles son los de la página, que se cuenta aparte.
+    """
+    if superficie.get_parent() is not None:
+        return 0
+    return superficie.get_pitch() * superficie.get_height()
+
+
+class RecursosPerezosos(dict):
+    """
+    Diccionario de assets que carga cada imagen la primera vez que se pide.
+
+    Las claves ya cargadas de grupos fijos son entradas normales del diccionario,
+    así que leerlas cuesta lo mismo que antes; las demás pasan por __missing__,
+    que las carga (o las marca como recién usadas) y cuida el presupuesto de
+    memoria. Un candado protege el diccionario: el hilo de precarga solo deja
+    'crudos' (preparar) y el hilo principal los termina (entregar o al pedirlos).
+    """
+    def __init__(self, presupuesto=0):
+        super().__init__()
+        self.cargadores = {}   # clave -> función(crudo=None) que devuelve la imagen (hilo principal)
+        self.decodificadores = {}  # clave -> función sin argumentos que devuelve el crudo (cualquier hilo)
+        self.crudos = {}       # clave -> crudo ya decodificado por el precargador, sin terminar
+        self.fijas = set()     # Claves que nunca se desalojan.
+        self.alias = {}        # clave -> otra clave con la misma imagen
+        # Cargadas que sí se pueden desalojar, de la usada hace más tiempo a la más reciente.
+        self.desalojables = collections.OrderedDict()
+        self.bytes = {}        # clave cargada -> bytes que ocupa
+        self.bytes_base = 0    # Memoria fija fuera del diccionario (páginas del atlas).
+        self.derivadas = {}    # nombre -> función que dice cuántos bytes ocupan esas capas
+        self.encogedores = {}  # nombre -> función que suelta las capas que no se están usando
+        self.presupuesto = presupuesto  # Bytes; 0 = sin límite.
+        self.desalojos = 0
+        self._candado = threading.RLock()
+
+    def diferir(self, clave, cargador, fija=True, decodificador=None):
+        """
+        Anota cómo cargar 'clave' sin cargarla todavía. 'decodificador', si se da, es
+        la parte de la carga que puede correr en otro hilo (ver preparar()).
+        """
+        with self._candado:
+            self._soltar(clave)
+            self.crudos.pop(clave, None)
+            self.cargadores[clave] = cargador
+            if decodificador is not None:
+                self.decodificadores[clave] = decodificador
+            if fija:
+                self.fijas.add(clave)
+            else:
+                self.fijas.discard(clave)
+
+    def __missing__(self, clave):
+        with self._candado:
+            if dict.__contains__(self, clave):
+                return dict.__getitem__(self, clave)  # La cargó otro hilo mientras esperábamos.
+            if clave in self.alias:
+                return self[self.alias[clave]]
+            valor = self.desalojables.get(clave)
+            if valor is not None:
+                self.desalojables.move_to_end(clave)
+                return valor
+            cargador = self.cargadores[clave]  # KeyError si la clave no existe, como un dict.
+            valor = cargador(self.crudos.pop(clave, None))
+            if clave in self.fijas:
+                dict.__setitem__(self, clave, valor)
+            else:
+                self.desalojables[clave] = valor
+            self.bytes[clave] = bytes_superficie(valor)
+            self._respetar_presupuesto(clave)
+            return valor
+
+    def preparar(self, clave):
+        """
+        Decodifica 'clave' sin tocar la pantalla; es lo único que hace el hilo de
+        precarga. El resultado queda en 'crudos' hasta que el hilo principal lo
+        termina (entregar() o al pedir la imagen).
+        """
+        clave = self.alias.get(clave, clave)
+        with self._candado:
+            if self.cargada(clave) or clave in self.crudos:
+                return
+            decodificador = self.decodificadores.get(clave)
+        if decodificador is None:
+            return
+        # Fuera del candado: el juego puede seguir pidiendo imágenes mientras tanto.
+        crudo = decodificador()
+        with self._candado:
+            if not self.cargada(clave):
+                self.crudos[clave] = crudo
+
+    def entregar(self):
+        """
+        Termina en ESTE hilo (el principal) lo que el precargador dejó decodificado.
+        Devuelve cuántas imágenes quedaron listas.
+        """
+        with self._candado:
+            claves = list(self.crudos)
+        for clave in claves:
+            self[clave]
+        return len(claves)
+
+    def registrar_derivadas(self, nombre, medidor, encoger=None):
+        """
+        Suma al presupuesto superficies armadas fuera de este diccionario (capas,
+        velos, copias). 'medidor' devuelve sus bytes; se consulta en cada cuenta.
+        'encoger', si se da, suelta las que no hagan falta ahora: se llama cuando ya
+        no queda ninguna imagen desalojable y el total sigue pasado.
+        """
+        with self._candado:
+            self.derivadas[nombre] = medidor
+            if encoger is not None:
+                self.encogedores[nombre] = encoger
+
+    def ajustar(self):
+        """Desaloja lo que haga falta tras crecer algo que no pasa por __missing__."""
+        with self._candado:
+            self._respetar_presupuesto(None)
+
+    def _respetar_presupuesto(self, recien_cargada):
+        """
+        Desaloja las menos usadas (nunca las fijas ni la recién cargada) si se pasó.
+        Si con eso no alcanza, encoge una vez las capas derivadas.
+        """
+        encogidas = False
+        while self.presupuesto and self.bytes_totales() > self.presupuesto:
+            clave = next((c for c in self.desalojables if c != recien_cargada), None)
+            if clave is not None:
+                self._soltar(clave)
+                self.desalojos += 1
+            elif not encogidas and self.encogedores:
+                for encoger in self.encogedores.values():
+                    encoger()
+                encogidas = True
+            else:
+                return  # Solo queda lo imprescindible: el presupuesto es más chico que eso.
+
+    def _soltar(self, clave):
+        """Olvida la imagen cargada; su cargador queda para volver a leerla."""
+        dict.pop(self, clave, None)
+        self.desalojables.pop(clave, None)
+        self.bytes.pop(clave, None)
+
+    def __contains__(self, clave):
+        return dict.__contains__(self, clave) or clave in self.cargadores or clave in self.alias
+
+    def get(self, clave, defecto=None):
+        return self[clave] if clave in self else defecto
+
+    def cargada(self, clave):
+        """True si la imagen ya está en memoria (no dispara la carga)."""
+        clave = self.alias.get(clave, clave)
+        return dict.__contains__(self, clave) or clave in self.desalojables
+
+    @property
+    def pendientes(self):
+        """Claves anotadas que todavía no están en memoria."""
+        return [clave for clave in self.cargadores if not self.cargada(clave)]
+
+    def bytes_derivados(self):
+        return {nombre: medidor() for nombre, medidor in self.derivadas.items()}
+
+    def bytes_totales(self):
+        return self.bytes_base + sum(self.bytes.values()) + sum(self.bytes_derivados().values())
+
+
+class Precargador(threading.Thread):
+    """
+    Hilo que decodifica de fondo una lista de claves (por ejemplo, mientras se ve el
+    menú). No llama a convert_alpha ni toca superficies que el juego esté dibujando:
+    deja los crudos en assets y el hilo principal los termina con assets.entregar().
+    'progreso' va de 0.0 a 1.0; el juego puede pedir cualquier imagen antes de
+    tiempo y simplemente se carga en ese momento.
+    """
+    def __init__(self, assets, claves):
+        super().__init__(name="precargador", daemon=True)
+        self.assets = assets
+        self.claves = list(claves)
+        self.hechas = 0
+        self._candado = threading.Lock()  # 'hechas' se escribe aquí y se lee desde main.
+
+    def run(self):
+        for clave in self.claves:
+            self.assets.preparar(clave)
+            with self._candado:
+                self.hechas += 1
+
+    @property
+    def progreso(self):
+        with self._candado:
+            hechas = self.hechas
+        return hechas / len(self.claves) if self.claves else 1.0
+
+    @property
+    def terminado(self):
+        with self._candado:
+            return self.hechas >= len(self.claves)
+
+
 class AlmacenRecursos:
     """
     Contenedor centralizado de imágenes y sonidos.
     
     Cargar imágenes es una operación lenta porque implica leer el disco duro.
-    Por eso lo hacemos todo aquí una sola vez al arrancar el juego, guardamos
-    el resultado en un diccionario (`self.assets`) y luego solo consultamos
-    ese diccionario en memoria, que es muchísimo más rápido.
+    Por eso al arrancar solo se lee el manifiesto: cada imagen se carga la primera
+    vez que se pide (o antes, si el Precargador llega a ella mientras se ve el menú)
+    y queda en un diccionario (`self.assets`) en memoria, que es muchísimo más
+    rápido de consultar. Con perezosa=False se carga todo al arrancar, como antes.
     """
-    def __init__(self):
+    def __init__(self, usar_atlas=None, usar_cache=None, perezosa=None, manifiesto=None):
         # Diccionario clave-valor. Ejemplo: "jugador1" -> <Objeto Imagen Pygame>
-        self.assets = {}
+        # Cada imagen se lee al pedirla por primera vez (ver RecursosPerezosos).
+        self.assets = RecursosPerezosos(int(config.PRESUPUESTO_MEMORIA_MB * 1024 * 1024))
+        # De dónde salió cada imagen: clave -> (archivo, tamaño). Lo usa atlas.py.
+        self.origenes = {}
+        # Datos del manifiesto por clave: grupo y prioridad de precarga.
+        self.grupos = {}
+        self.prioridades = {}
+        self.procedencia = {}  # clave -> "atlas", "cache", "png" o "faltante" (último origen)
+        self.ruta_manifiesto = manifiesto or config.RUTA_MANIFIESTO
+        self.faltantes = set()  # Claves que quedaron con el placeholder magenta.
         
         # --- NUEVO: Diccionario para efectos de sonido ---
         self.sonidos = {} 
@@ -61,74 +312,228 @@ class AlmacenRecursos:
         except Exception as e:
             print(f"Advertencia: No se pudo iniciar el audio: {e}")
         
-        # Arrancamos la carga automática.
+        # Píxeles ya escalados de arranques anteriores (None = decodificar siempre).
+        self.cache = None
+        if config.USAR_CACHE_SUPERFICIES if usar_cache is None else usar_cache:
+            self.cache = CacheSuperficies(config.RUTA_CACHE_SUPERFICIES)
+
+        # Páginas del atlas ya armado (si lo hay) e índice clave -> rectángulo.
+        self.paginas_atlas = []
+        self.indice_atlas = {}
+        if config.USAR_ATLAS if usar_atlas is None else usar_atlas:
+            self.abrir_atlas(config.RUTA_ATLAS)
+        self.assets.bytes_base = sum(bytes_superficie(pagina) for pagina in self.paginas_atlas)
+        
+        # Arrancamos la carga automática (con carga perezosa, solo se anota la lista).
         self.cargar_todos()
+        self.cargar_sonidos()
+        if not (config.CARGA_PEREZOSA if perezosa is None else perezosa):
+            self.cargar_pendientes()
+
+    def cargar_pendientes(self, claves=None):
+        """Carga ya las imágenes indicadas (o todas las que falten)."""
+        for clave in list(self.assets.pendientes if claves is None else claves):
+            self.assets[clave]
+
+    def claves_precarga(self):
+        """Imágenes de los grupos fijos (menú y batalla), de menor a mayor prioridad."""
+        fijas = [clave for clave in self.origenes if clave in self.assets.fijas]
+        return sorted(fijas, key=lambda clave: self.prioridades[clave])
+
+    def reporte_memoria(self):
+        """
+        Cuánta memoria ocupan las imágenes cargadas. Devuelve un diccionario con
+        el detalle por clave, el total por grupo, las páginas del atlas, las capas
+        derivadas (registrar_derivadas) y el total.
+        """
+        with self.assets._candado:
+            detalle = [(clave, self.grupos.get(clave, "?"), self.procedencia.get(clave, "?"), tamano)
+                       for clave, tamano in self.assets.bytes.items()]
+            por_grupo = {}
+            for _, grupo, _, tamano in detalle:
+                por_grupo[grupo] = por_grupo.get(grupo, 0) + tamano
+            return {
+                "detalle": sorted(detalle, key=lambda fila: -fila[3]),
+                "por_grupo": por_grupo,
+                "atlas": self.assets.bytes_base,
+                "derivadas": self.assets.bytes_derivados(),
+                "total": self.assets.bytes_totales(),
+                "presupuesto": self.assets.presupuesto,
+                "desalojos": self.assets.desalojos,
+            }
+
+    def imprimir_reporte_memoria(self):
+        reporte = self.reporte_memoria()
+        mb = lambda n: f"{n / (1024 * 1024):7.2f} MB"
+        print(f"{'CLAVE':<18}{'GRUPO':<10}{'ORIGEN':<10}{'MEMORIA':>10}")
+        for clave, grupo, origen, tamano in reporte["detalle"]:
+            print(f"{clave:<18}{grupo:<10}{origen:<10}{mb(tamano):>10}")
+        for grupo, tamano in sorted(reporte["por_grupo"].items()):
+            print(f"Grupo {grupo:<22}{mb(tamano):>20}")
+        print(f"Páginas del atlas{mb(reporte['atlas']):>31}")
+        for nombre, tamano in sorted(reporte["derivadas"].items()):
+            print(f"Derivadas {nombre:<18}{mb(tamano):>20}")
+        limite = mb(reporte["presupuesto"]).strip() if reporte["presupuesto"] else "sin límite"
+        print(f"TOTAL {mb(reporte['total'])} (presupuesto: {limite}, desalojos: {reporte['desalojos']})")
+
+    def abrir_atlas(self, ruta):
+        """
+        Carga las páginas del atlas y su índice. Si no existe o está roto, no pasa
+        nada: cada imagen se carga suelta desde su archivo.
+        """
+        indice = os.path.join(ruta, "atlas.json")
+        if not os.path.exists(indice):
+            return
+        try:
+            with open(indice, "r", encoding="utf-8") as archivo:
+                datos = json.load(archivo)
+            tamanos = datos.get("tamanos_paginas") or [None] * len(datos["paginas"])
+            self.paginas_atlas = [self._cargar_pagina(os.path.join(ruta, nombre), tamano)
+                                  for nombre, tamano in zip(datos["paginas"], tamanos)]
+            self.indice_atlas = datos["piezas"]
+        except Exception as e:
+            print(f"[ALERTA] No se pudo abrir el atlas '{ruta}': {e}")
+            self.paginas_atlas = []
+            self.indice_atlas = {}
+
+    def _cargar_pagina(self, ruta_pagina, tamano):
+        """Lee una página del atlas, desde la caché en disco si se conoce su tamaño."""
+        huella = None
+        if self.cache is not None and tamano is not None:
+            pagina, huella = self.cache.cargar(ruta_pagina, tuple(tamano))
+            if pagina is not None:
+                return pagina
+        pagina = pygame.image.load(ruta_pagina).convert_alpha()
+        if huella is not None:
+            self.cache.guardar(huella, pagina)
+        return pagina
+
+    def _pieza_atlas(self, nombre_clave, nombre_archivo, tamano):
+        """
+        Devuelve la entrada del índice del atlas para esa clave, o None si no está o
+        si el atlas quedó viejo (otro archivo, otro tamaño u otra imagen en disco).
+        """
+        pieza = self.indice_atlas.get(nombre_clave)
+        if pieza is None:
+            return None
+        if pieza["archivo"] != nombre_archivo or tuple(pieza["tamano"]) != tuple(tamano):
+            return None
+        try:
+            if os.path.getsize(os.path.join(self.ruta_img, nombre_archivo)) != pieza["bytes"]:
+                return None
+        except OSError:
+            pass  # Sin el archivo original, la copia del atlas sigue sirviendo.
+        return pieza
 
     def cargar_todos(self):
         """
-        Aquí definimos la lista de compras: qué archivos necesitamos para jugar.
-        Organizo la carga por categorías para mantener el orden.
+        Anota las imágenes del manifiesto (config.RUTA_MANIFIESTO). Cada entrada
+        dice archivo, tamaño, grupo y prioridad; los grupos dicen si sus imágenes
+        quedan fijas en memoria o se pueden desalojar.
         """
-        # --- 1. ELEMENTOS DE INTERFAZ (UI) Y ESCENARIO ---
-        # El fondo debe coincidir con la resolución definida en config.ANCHO/ALTO.
-        self.cargar('fondo', "escenario.png", (config.ANCHO, config.ALTO))
-        self.cargar('caja_texto', "ui_caja_texto.png", (1100, 200))
-        self.cargar('menu_pausa', "ui_menu_pausa.png", (400, 450))
-        self.cargar('cursor', "ui_cursor.png", (30, 30))
-        
-        # Reutilizo la misma imagen del fondo para el menú principal por ahora.
-        self.assets["fondo_menu"] = self.assets['fondo']
-
-        # --- 2. PERSONAJES ---
-        # Cargo los sprites de los soldados y el jefe.
-        self.cargar('jugador1', "soldado1.png", (300, 300))
-        self.cargar('jugador2', "soldado2.png", (300, 300))
-        self.cargar('boss_idle', "boss_idle.png", (300, 300))
-        self.cargar('boss_atacando', "boss_atacando.png", (300, 300))
-        self.cargar('boss_dano', "boss_dano.png", (300, 300))
-        
-        # --- SPRITES DE DAÑO / DERROTA ---
-        # Estas imágenes se muestran cuando la vida llega a 0 o reciben un golpe fuerte.
-        self.cargar('jugador1_dano', "soldado1_dano.png", (300, 300))
-        self.cargar('jugador2_dano', "soldado2_dano.png", (300, 300)) 
-
-        # Imagen especial para la pantalla de victoria.
-        self.cargar('victoria_final', "victoria_final.png", (1000, 650)) # Ojo: Asegúrate que el nombre coincida con tu carpeta
-
-        #imagen especial para la pantalla de derrota.
-        self.cargar('game_over', 'game_over.png', (1000, 650))
-
-        # --- 3. ICONOS, PROYECTILES Y EFECTOS ---
-        # Iconos pequeños para las habilidades y efectos visuales.
-        self.cargar('proy_disparo', "icono_disparo.png", (64, 64))
-        self.cargar('proy_molotov', "icono_molotov.png", (64, 64))
-        self.cargar('proy_cuchillo', "icono_cuchillo.png", (64, 64))
-        self.cargar('proy_calavera', "icono_intimidar.png", (64, 64))
-        self.cargar('proy_grito', "icono_grito.png", (64, 64))
-        self.cargar('icono_escudo', "icono_escudo.png", (80, 80))
-        self.cargar('icono_curar', "icono_curar.png", (80, 80))
-
-        # Indicadores de estado (aparecen sobre la cabeza de los personajes).
-        self.cargar('est_aturdido', "estado_aturdido.png", (100, 100))
-        self.cargar('est_quemado', "estado_quemado.png", (100, 100))
-        self.cargar('est_sangrado', "estado_sangrado.png", (100, 100))
-
-        # --- 4. NUEVO: CARGA DE SONIDOS ---
+        with open(self.ruta_manifiesto, "r", encoding="utf-8") as archivo:
+            manifiesto = json.load(archivo)
+
+        grupos = manifiesto.get("grupos", {})
+        for imagen in manifiesto["imagenes"]:
+            tamano = imagen["tamano"]
+            # "pantalla" = la resolución de config.ANCHO/ALTO (el fondo debe coincidir).
+            tamano = (config.ANCHO, config.ALTO) if tamano == "pantalla" else tuple(tamano)
+            grupo = imagen.get("grupo", "batalla")
+            self.cargar(imagen["clave"], imagen["archivo"], tamano, grupo=grupo,
+                        prioridad=imagen.get("prioridad", 0),
+                        fija=grupos.get(grupo, {}).get("fijo", True))
+
+        # Claves que reutilizan otra imagen (ej. el fondo del menú es el del escenario).
+        for clave, destino in manifiesto.get("alias", {}).items():
+            self.assets.alias[clave] = destino
+
+    def cargar_sonidos(self):
         # Cargamos el efecto de sonido "Start". 
         # La música de fondo no se carga aquí, se hace stream en el main.
         self.cargar_sonido('sfx_start', config.RUTA_SFX_START)
 
-    def cargar(self, nombre_clave, nombre_archivo, tamano):
+    def cargar(self, nombre_clave, nombre_archivo, tamano, grupo="batalla", prioridad=0, fija=True):
+        """
+        Anota una imagen en el inventario. Se lee del disco la primera vez que
+        alguien la pide (o cuando el precargador llega a ella).
+        """
+        self.origenes[nombre_clave] = (nombre_archivo, tamano)
+        self.grupos[nombre_clave] = grupo
+        self.prioridades[nombre_clave] = prioridad
+        decodificar = lambda: self._decodificar(nombre_clave, nombre_archivo, tamano)
+        self.assets.diferir(nombre_clave,
+                            lambda crudo=None: self._terminar(nombre_clave, nombre_archivo, tamano,
+                                                              crudo if crudo is not None else decodificar()),
+                            fija, decodificador=decodificar)
+
+    def _cargar_ahora(self, nombre_clave, nombre_archivo, tamano):
         """
-        Método 'seguro' de carga de IMÁGENES.
+        Método 'seguro' de carga de IMÁGENES (todo en el hilo que llama). Devuelve la superficie.
         """
+        return self._terminar(nombre_clave, nombre_archivo, tamano,
+                              self._decodificar(nombre_clave, nombre_archivo, tamano))
+
+    def _decodificar(self, nombre_clave, nombre_archivo, tamano):
+        """
+        Primera mitad de la carga: leer y decodificar. No usa la pantalla ni toca
+        superficies que otro hilo pueda estar dibujando, así que el Precargador la
+        corre de fondo. Devuelve un 'crudo' (tipo, dato, huella) para _terminar().
+        """
+        # Si el atlas la tiene (y está al día), no hace falta leer ni escalar nada.
+        pieza = self._pieza_atlas(nombre_clave, nombre_archivo, tamano)
+        if pieza is not None:
+            return ("atlas", pieza, None)
+
+        # Si ya se escaló en otro arranque, se leen los píxeles tal cual.
         ruta_completa = os.path.join(self.ruta_img, nombre_archivo)
-        
+        huella = None
+        if self.cache is not None:
+            datos, huella = self.cache.leer(ruta_completa, tamano)
+            if datos is not None:
+                return ("cache", datos, huella)
+
+        return self._decodificar_png(nombre_archivo, tamano, huella)
+
+    def _decodificar_png(self, nombre_archivo, tamano, huella):
+        """Lee y escala el PNG sobre una superficie nueva (sin convert_alpha todavía)."""
         try:
-            # Intentamos cargar y convertir la imagen (convert_alpha es vital para transparencias).
-            img = pygame.image.load(ruta_completa).convert_alpha()
-            # La escalamos al tamaño deseado y la guardamos en el diccionario.
-            self.assets[nombre_clave] = pygame.transform.scale(img, tamano)
+            ruta_completa = os.path.join(self.ruta_img, nombre_archivo)
+            img = pygame.transform.scale(pygame.image.load(ruta_completa), tamano)
+            return ("png", img, huella)
+        except Exception as e:
+            return ("faltante", e, huella)
+
+    def _terminar(self, nombre_clave, nombre_archivo, tamano, crudo):
+        """
+        Segunda mitad de la carga, SIEMPRE en el hilo principal: convert_alpha,
+        pieza del atlas, caché en disco y placeholder. Devuelve la superficie.
+        """
+        tipo, dato, huella = crudo
+
+        if tipo == "atlas":
+            self.procedencia[nombre_clave] = "atlas"
+            return self.paginas_atlas[dato["pagina"]].subsurface(pygame.Rect(dato["rect"]))
+
+        if tipo == "cache":
+            img = self.cache.convertir(dato, tamano)
+            if img is not None:
+                self.procedencia[nombre_clave] = "cache"
+                return img
+            # Los bytes no sirvieron: se decodifica el PNG aquí mismo.
+            tipo, dato, huella = self._decodificar_png(nombre_archivo, tamano, huella)
+        elif huella is not None:
+            self.cache.convertir(None, tamano)  # Cuenta el fallo de la caché.
+
+        try:
+            if tipo == "faltante":
+                raise dato
+            # convert_alpha es vital para transparencias (y necesita la ventana).
+            img = dato.convert_alpha()
+            if huella is not None:
+                self.cache.guardar(huella, img)
+            self.procedencia[nombre_clave] = "png"
+            return img
             
         except Exception as e:
             # Si algo sale mal, avisamos en la consola pero NO detenemos el juego.
@@ -138,7 +543,9 @@ class AlmacenRecursos:
             # Generamos un cuadrado magenta de reemplazo.
             surf = pygame.Surface(tamano)
             surf.fill((255, 0, 255)) # RGB: Magenta brillante
-            self.assets[nombre_clave] = surf
+            self.faltantes.add(nombre_clave)
+            self.procedencia[nombre_clave] = "faltante"
+            return surf
 
     # --- NUEVO MÉTODO ---
     def cargar_sonido(self, nombre_clave, ruta_archivo):
@@ -154,4 +561,15 @@ class AlmacenRecursos:
         except Exception as e:
             print(f"[ERROR AUDIO] No se cargó '{ruta_archivo}': {e}")
             # Si falla, guardamos None para evitar errores al intentar reproducirlo
-            self.sonidos[nombre_clave] = None
\ No newline at end of file
+            self.sonidos[nombre_clave] = None
+
+
+if __name__ == "__main__":
+    # Carga todo el inventario y muestra cuánta memoria ocupa cada imagen.
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))  # convert_alpha() necesita una ventana.
+    almacen = AlmacenRecursos(perezosa=False)
+    almacen.imprimir_reporte_memoria()
+    pygame.quit()
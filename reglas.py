@@ -0,0 +1,284 @@
+import config
+from entidades import Boss
+from estructuras import ArbolAtaque
+
+"""
+REGLAS DEL COMBATE (SIN GRÁFICOS NI TEXTOS)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (MECÁNICAS):
+-----------------------------------------------------------------------------------------
+FUNCIÓN / LÓGICA        | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. QUIÉN LAS USA        | sistema_combate.py    | El juego arma mensajes y animaciones
+                        | simulador.py          | con lo que devuelven; el simulador
+                        |                       | solo cuenta. UNA regla, UN lugar.
+-----------------------------------------------------------------------------------------
+2. DAÑO POR TIEMPO      | efectos_pasivos()     | Quemadura, sangrado y aturdimiento
+   (Inicio de Turno)    | - DANO_QUEMADURA      | al empezar el turno.
+                        | - DANO_SANGRADO       |
+-----------------------------------------------------------------------------------------
+3. HABILIDADES          | resolver_habilidad()  | Curas, limpieza, motivación, escudo
+                        |                       | y ataques con el árbol de suerte.
+-----------------------------------------------------------------------------------------
+4. SISTEMA DE ESTRÉS    | aumento_estres()      | Estrés base 15 (25 si es crítico),
+   (Mecánica del Boss)  |                       | +10 si sufre, x2 si está Vulnerable,
+                        |                       | 5 fijo si está Enfurecido.
+-----------------------------------------------------------------------------------------
+5. TURNO DEL JEFE       | turno_jefe()          | Humor, buffs, estrategia (Prim),
+                        |                       | objetivo, daño, efectos y curas.
+                        |                       | - Los dados se inyectan: el juego y
+                        |                       |   el simulador usan sus propios flujos.
+-----------------------------------------------------------------------------------------
+"""
+
+DANO_QUEMADURA = 15
+DANO_SANGRADO = 10
+MULT_BUFF_ATAQUE = 1.3  # Daño extra del jefe mientras dura el boost de Molotov+.
+TURNOS_BOOST_JEFE = 3
+
+
+class ResultadoPasivo:
+    """Lo que pasó al inicio del turno (ver efectos_pasivos)."""
+    __slots__ = ("efecto", "dano", "perdida", "extinguido", "fin_motivacion", "pierde_turno")
+
+    def __init__(self):
+        self.efecto = None          # "FUEGO", "SANGRE", "ATURDIDO" o None.
+        self.dano = 0               # Daño del efecto (antes de escudos).
+        self.perdida = 0            # Vida realmente perdida.
+        self.extinguido = False     # Se apagó la quemadura.
+        self.fin_motivacion = False # Se terminó el buff de motivación.
+        self.pierde_turno = False
+
+
+# El caso más común (sin estado ni motivación) no crea nada: todos comparten este
+# resultado vacío. Es de solo lectura: nadie debe escribirle.
+SIN_EFECTOS = ResultadoPasivo()
+
+
+class ResultadoHabilidad:
+    """Lo que pasó al usar una habilidad (ver resolver_habilidad)."""
+    __slots__ = ("objetivo", "cantidad", "ataque", "mensaje_escudo", "perdida", "nuevo_estado", "animacion")
+
+    def __init__(self, objetivo, animacion):
+        self.objetivo = objetivo        # A quién le pasó (curado, golpeado, el propio atacante...).
+        self.animacion = animacion      # Tipo de Impacto para graficos.py.
+        self.cantidad = 0               # Vida curada.
+        self.ataque = None              # ResultadoAtaque del árbol (solo en ataques).
+        self.mensaje_escudo = None      # Lo que devolvió recibir_dano().
+        self.perdida = 0                # Vida realmente perdida por 'objetivo'.
+        self.nuevo_estado = None        # Estado nuevo del objetivo, si cambió.
+
+
+class ResultadoJefe:
+    """Lo que pasó en el turno del jefe (ver turno_jefe)."""
+    __slots__ = ("humor", "ataque_arriba", "defensa_arriba", "nodo", "objetivo", "dano",
+                 "mensaje_escudo", "perdida", "nuevo_estado", "cura")
+
+    def __init__(self, humor, nodo, objetivo):
+        self.humor = humor
+        self.nodo = nodo
+        self.objetivo = objetivo
+        self.ataque_arriba = False  # Buffs activos al empezar la acción (para el encabezado).
+        self.defensa_arriba = False
+        self.dano = None            # Daño del golpe (None = el nodo no pega).
+        self.mensaje_escudo = None
+        self.perdida = 0
+        self.nuevo_estado = None
+        self.cura = 0
+
+
+def danar(objetivo, cantidad):
+    """Aplica daño. Devuelve (mensaje de recibir_dano, vida realmente perdida)."""
+    vida_antes = objetivo.vida_actual
+    mensaje = objetivo.recibir_dano(cantidad)
+    return mensaje, vida_antes - objetivo.vida_actual
+
+
+def aplicar_estado(objetivo, grafo, evento):
+    """
+    Pregunta al grafo de efectos en qué estado queda 'objetivo' tras 'evento'.
+    Devuelve el estado nuevo si cambió (y arranca la quemadura), o None.
+    """
+    nuevo_estado = grafo.transicion(objetivo.estado_actual, evento)
+    if nuevo_estado == objetivo.estado_actual:
+        return None
+    objetivo.estado_actual = nuevo_estado
+    if nuevo_estado == "Quemado":
+        objetivo.turnos_quemado = config.DURACION_QUEMADO
+    return nuevo_estado
+
+
+ESTADOS_PASIVOS = frozenset(("Quemado", "Sangrado", "Aturdido"))
+
+
+def efectos_pasivos(personaje):
+    """Quemaduras, sangrados, aturdimiento y fin de la motivación al inicio del turno."""
+    estado = personaje.estado_actual
+    if personaje.turnos_motivado <= 0 and estado not in ESTADOS_PASIVOS:
+        return SIN_EFECTOS
+    resultado = ResultadoPasivo()
+
+    if estado == "Quemado":
+        resultado.efecto = "FUEGO"
+        resultado.dano = DANO_QUEMADURA
+        _, resultado.perdida = danar(personaje, DANO_QUEMADURA)
+        # El fuego se apaga solo después de X turnos.
+        if personaje.turnos_quemado > 0:
+            personaje.turnos_quemado -= 1
+        if personaje.turnos_quemado <= 0:
+            personaje.estado_actual = "Normal"
+            resultado.extinguido = True
+
+    elif estado == "Sangrado":
+        resultado.efecto = "SANGRE"
+        resultado.dano = DANO_SANGRADO
+        _, resultado.perdida = danar(personaje, DANO_SANGRADO)
+
+    elif estado == "Aturdido":
+        # El aturdimiento dura solo 1 turno.
+        resultado.efecto = "ATURDIDO"
+        personaje.estado_actual = "Normal"
+        resultado.pierde_turno = True
+
+    if personaje.turnos_motivado > 0:
+        personaje.turnos_motivado -= 1
+        resultado.fin_motivacion = personaje.turnos_motivado == 0
+
+    return resultado
+
+
+def aumento_estres(tipo_golpe, estado_defensor):
+    """Estrés que gana el jefe al recibir un golpe de tipo 'tipo_golpe'."""
+    aumento = 25 if tipo_golpe == "CRITICO" else 15
+    # Si el jefe ya está sufriendo, se estresa más.
+    if estado_defensor in ("Quemado", "Sangrado"):
+        aumento += 10  # El dolor físico constante aumenta la ansiedad.
+    elif estado_defensor == "Vulnerable":
+        aumento *= 2   # Si está vulnerable, el impacto emocional es doble.
+    elif estado_defensor == "Enfurecido":
+        aumento = 5    # En furia es más resistente al estrés externo (adrenalina).
+    return aumento
+
+
+def resolver_habilidad(atacante, defensor, habilidad, p1, p2, grafo, rng=None, tirar_arbol=None):
+    """
+    Aplica 'habilidad' y devuelve un ResultadoHabilidad. 'rng' es el dado del
+    árbol de ataque (por defecto, el flujo "arbol" de azar.py); 'tirar_arbol',
+    si se pasa, reemplaza la tirada entera: función(habilidad) -> ResultadoAtaque.
+    """
+    tipo = habilidad.tipo
+
+    if tipo == "CURACION":
+        # IA simple de curación: cura al que tenga menos vida.
+        objetivo = p1 if p1.vida_actual < p2.vida_actual else p2
+        resultado = ResultadoHabilidad(objetivo, "CURACION")
+        resultado.cantidad = abs(habilidad.dano)  # abs() por si el daño se definió negativo.
+        objetivo.curar(resultado.cantidad)
+        return resultado
+
+    if tipo == "LIMPIEZA":
+        resultado = ResultadoHabilidad(atacante, "NORMAL")
+        nuevo_estado = grafo.transicion(atacante.estado_actual, habilidad.codigo_efecto)
+        if nuevo_estado != atacante.estado_actual:
+            atacante.estado_actual = nuevo_estado
+            resultado.nuevo_estado = nuevo_estado
+            resultado.animacion = "CURACION"
+        return resultado
+
+    if tipo == "BUFF":
+        atacante.turnos_motivado = config.DURACION_MOTIVACION
+        return ResultadoHabilidad(atacante, "MOTIVACION")
+
+    if tipo == "DEFENSA":
+        atacante.agregar_capa_escudo(1)
+        return ResultadoHabilidad(atacante, "ESCUDO")
+
+    # --- ATAQUE: el árbol de suerte decide ---
+    if tirar_arbol is not None:
+        ataque = tirar_arbol(habilidad)
+    else:
+        ataque = ArbolAtaque.ejecutar_ataque(habilidad.dano, habilidad.arbol, rng)
+
+    if ataque.tipo == "TROPIEZO":
+        # Fallo crítico: el atacante se hiere a sí mismo.
+        resultado = ResultadoHabilidad(atacante, "SANGRE")
+        resultado.ataque = ataque
+        resultado.mensaje_escudo, resultado.perdida = danar(atacante, ataque.dano)
+        return resultado
+
+    resultado = ResultadoHabilidad(defensor, "FALLO")
+    resultado.ataque = ataque
+    if ataque.tipo == "FALLO":
+        return resultado
+
+    # ÉXITO O CRÍTICO
+    resultado.mensaje_escudo, resultado.perdida = danar(defensor, ataque.dano)
+    # Solo el jefe tiene estrés.
+    if isinstance(defensor, Boss):
+        defensor.aumentar_estres(aumento_estres(ataque.tipo, defensor.estado_actual))
+
+    resultado.nuevo_estado = aplicar_estado(defensor, grafo, habilidad.codigo_efecto)
+    # El overlay depende del estado en que quedó el defensor.
+    estado_final = defensor.estado_actual
+    resultado.animacion = ("FUEGO" if estado_final == "Quemado" else
+                           "SANGRE" if estado_final == "Sangrado" else
+                           "CRITICO" if estado_final == "Aturdido" else "NORMAL")
+    return resultado
+
+
+def turno_jefe(jefe, equipo, comportamiento, elegir_nodo, elegir_objetivo, grafo):
+    """
+    Resuelve la acción del jefe y devuelve un ResultadoJefe.
+
+    Args:
+        comportamiento: GrafoEstados (humor del jefe).
+        elegir_nodo: función(jefe) -> NodoEstrategia (ej. seleccionar_siguiente_ataque).
+        elegir_objetivo: función(candidatos) -> soldado (ej. rng.choice).
+        grafo: GrafoEfectos para los efectos secundarios del golpe.
+    """
+    # Humor: vida y estrés deciden si entra en Furia o se pone a la defensiva.
+    comportamiento.actualizar_estado(jefe)
+    bonus = comportamiento.obtener_bonificadores()
+
+    # ¿Viene "cebado" de un Molotov+? El boost se gasta un turno a la vez.
+    mult_extra_ataque = 1.0
+    if jefe.turnos_buff_ataque > 0:
+        mult_extra_ataque = MULT_BUFF_ATAQUE
+        jefe.turnos_buff_ataque -= 1
+    ataque_arriba = jefe.turnos_buff_ataque > 0
+    defensa_arriba = jefe.turnos_buff_defensa > 0
+
+    nodo = elegir_nodo(jefe)
+    dmg_base = jefe.ataque_base * bonus["ataque"] * mult_extra_ataque
+
+    # Víctima al azar entre los que sigan vivos (si viven todos, sin armar otra lista).
+    candidatos = equipo
+    for p in equipo:
+        if not p.esta_vivo():
+            candidatos = [p for p in equipo if p.esta_vivo()]
+            break
+    objetivo = elegir_objetivo(candidatos) if candidatos else equipo[0]
+
+    resultado = ResultadoJefe(comportamiento.estado_actual, nodo, objetivo)
+    resultado.ataque_arriba = ataque_arriba
+    resultado.defensa_arriba = defensa_arriba
+    efecto = nodo.efecto_tipo
+    valor = nodo.valor_efecto
+
+    if "dano" in efecto:
+        # El porcentaje de la habilidad se suma al daño base (Molotov pega más que Bala).
+        resultado.dano = int(dmg_base * (1.0 + valor))
+        resultado.mensaje_escudo, resultado.perdida = danar(objetivo, resultado.dano)
+        if nodo.efecto_estado:
+            resultado.nuevo_estado = aplicar_estado(objetivo, grafo, nodo.efecto_estado)
+
+    if "cura" in efecto:
+        resultado.cura = int(jefe.vida_max * valor)
+        jefe.curar(resultado.cura)
+
+    if nodo.boost == "ataque":
+        jefe.turnos_buff_ataque = TURNOS_BOOST_JEFE
+    if nodo.boost == "defensa":
+        jefe.turnos_buff_defensa = TURNOS_BOOST_JEFE
+
+    return resultado
@@ -0,0 +1,363 @@
+import bisect
+import time
+import config
+from azar import ServicioAzar, FLUJO_ARBOL, FLUJO_ESTRATEGIA, FLUJO_OBJETIVO, FLUJO_JUGADOR
+from entidades import Personaje, Habilidad, Boss
+import reglas
+from estructuras import ArbolAtaque, GrafoEfectos, GrafoEstados, GrafoEstrategia
+
+"""
+SIMULADOR DE COMBATE (MODO SIN VENTANA / BALANCEO)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (REGLAS SIMULADAS):
+-----------------------------------------------------------------------------------------
+CLASE / LÓGICA          | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. POLÍTICA DEL JUGADOR | politica_aleatoria()  | Decide qué habilidad usa el jugador.
+   (Quién aprieta 1..5) | - simulador.elegir()  | - Escribir otra función con la misma
+                        |                       |   firma y pasarla al SimuladorCombate.
+-----------------------------------------------------------------------------------------
+2. FLUJO DE TURNOS      | simular()             | Espejo del bucle de main.py:
+                        | - max_turnos          |   Jugador -> Jefe -> siguiente soldado.
+                        |                       | - Límite de seguridad contra empates.
+-----------------------------------------------------------------------------------------
+3. REGLAS DE COMBATE    | procesar_efectos...() | Llaman a reglas.py, igual que el juego
+                        | ejecutar_habilidad()  | (sistema_combate.py). Aquí solo se
+                        | turno_jefe()          | cuenta el daño; las reglas se cambian
+                        |                       | allá y valen para los dos.
+-----------------------------------------------------------------------------------------
+4. AZAR Y REPETICIÓN    | servicio_azar         | Un flujo con semilla por subsistema
+                        | simular(semilla)      | (azar.py): misma semilla = mismo
+                        |                       | combate, dado por dado.
+-----------------------------------------------------------------------------------------
+5. USO RÁPIDO           | python simulador.py   | Corre un lote y muestra la tasa de
+                        |                       | victoria y los combates por segundo.
+                        | _preparar_tablas()    | - Bucle caliente: resultados de cada
+                        | opciones_jugador()    |   hoja armados por habilidad y opciones
+                        |                       |   de cada (energía, motivado) en caché.
+                        |                       |   Si se agrega estado que cambie esas
+                        |                       |   opciones, hay que sumarlo a la clave.
+                        |                       | - Para lotes grandes, varios procesos
+                        |                       |   (barrido.py).
+-----------------------------------------------------------------------------------------
+"""
+
+class ResultadoSimulacion:
+    """
+    Contenedor con el resumen de un combate simulado.
+    """
+    def __init__(self, ganador, turnos, dano_causado, dano_recibido):
+        self.ganador = ganador              # "JUGADORES", "JEFE" o "EMPATE" (límite de turnos).
+        self.turnos = turnos                # Turnos jugados (cada jugador y cada jefe cuentan 1).
+        self.dano_causado = dano_causado    # Vida total que perdió el jefe.
+        self.dano_recibido = dano_recibido  # Vida total que perdieron los soldados.
+
+    @property
+    def gano(self):
+        return self.ganador == "JUGADORES"
+
+
+def politica_aleatoria(atacante, opciones, simulador):
+    """
+    Política por defecto: el jugador elige al azar entre las habilidades que puede pagar.
+    """
+    return simulador.elegir(opciones)
+
+
+class SimuladorCombate:
+    """
+    Resuelve combates completos sin pygame: sin ventana, sin pausas y sin prints.
+
+    Reutiliza las mismas entidades (Personaje/Boss) y los mismos grafos que el juego real.
+    Los objetos se crean una sola vez y se reinician entre combates, así cada combate
+    solo paga el costo de la lógica.
+    """
+    def __init__(self, nivel=0, politica=None, max_turnos=500, servicio_azar=None,
+                 vida_jefe=None, vida_jugadores=None):
+        """
+        'vida_jefe' y 'vida_jugadores' reemplazan las vidas de config.py solo en este
+        simulador (para probar variantes sin tocar el módulo config).
+        """
+        # Las trazas de estructuras.py salen por bitacora.py y están apagadas por
+        # defecto, así que aquí no se imprime ni se formatea nada.
+        self.datos_nivel = config.NIVELES[nivel]
+        self.politica = politica if politica else politica_aleatoria
+        self.max_turnos = max_turnos
+
+        # Cada simulador tiene su propio servicio de azar (no comparte dados con el juego
+        # ni con otros simuladores) y un flujo por cada punto de decisión.
+        self.azar = servicio_azar if servicio_azar is not None else ServicioAzar()
+        self.rng_arbol = self.azar.flujo(FLUJO_ARBOL)
+        self.rng_estrategia = self.azar.flujo(FLUJO_ESTRATEGIA)
+        self.rng_objetivo = self.azar.flujo(FLUJO_OBJETIVO)
+        self.rng_jugador = self.azar.flujo(FLUJO_JUGADOR)
+
+        # Estructuras de decisión (las mismas que usa main.py).
+        self.arbol = ArbolAtaque.compilado_base()
+        self.grafo_efectos = GrafoEfectos()
+        self.cerebro_comportamiento = GrafoEstados()
+        self.cerebro_estrategia = GrafoEstrategia(self.rng_estrategia)
+
+        # Entidades del combate.
+        vida_p1 = vida_jugadores if vida_jugadores is not None else config.P1_VIDA_MAX
+        vida_p2 = vida_jugadores if vida_jugadores is not None else config.P2_VIDA_MAX
+        vida_boss = vida_jefe if vida_jefe is not None else self.datos_nivel["boss_vida"]
+        self.p1 = Personaje(config.P1_NOMBRE, vida_p1, config.P1_ATAQUE, config.P1_ENERGIA_MAX, config.HABILIDADES_P1)
+        self.p2 = Personaje(config.P2_NOMBRE, vida_p2, config.P2_ATAQUE, config.P2_ENERGIA_MAX, config.HABILIDADES_P2)
+        self.jefe = Boss(self.datos_nivel["boss_nombre"], vida_boss, self.datos_nivel["boss_ataque"], 100, [])
+        self.equipo = [self.p1, self.p2]
+
+        # Cada soldado tiene su propio Golpe Táctico (tecla Q) con su ataque base como daño.
+        self.basicos = {}
+        for p in self.equipo:
+            basico = Habilidad(config.DATO_BASICO)
+            basico.dano = p.ataque_base
+            self.basicos[p] = basico
+
+        self.dano_causado = 0
+        self.dano_recibido = 0
+
+        # Tablas precalculadas del bucle caliente (ver _preparar_tablas y opciones_jugador).
+        self._arbol_tablas = None
+        self._ataques = {}   # habilidad -> (árbol, ResultadoAtaque de cada hoja)
+        self._opciones = {}  # (soldado, energía, motivado) -> habilidades que puede pagar
+
+    # ==========================================
+    # AZAR (PUNTOS DE DECISIÓN)
+    # ==========================================
+    def elegir(self, opciones, rng=None):
+        """
+        Elección uniforme. Todas las elecciones al azar del simulador pasan por aquí.
+        Por defecto usa el flujo del jugador (la política).
+        """
+        return (rng if rng is not None else self.rng_jugador).choice(opciones)
+
+    def elegir_ponderado(self, opciones, pesos_acumulados, rng=None):
+        """Elección con pesos ya acumulados (misma tirada que random.choices)."""
+        total = pesos_acumulados[-1]
+        dado = (rng if rng is not None else self.rng_estrategia).random()
+        return opciones[bisect.bisect(pesos_acumulados, dado * total, 0, len(opciones) - 1)]
+
+    def tirar_arbol(self, habilidad):
+        """
+        Tirada del árbol compilado de la habilidad (o del árbol por defecto). El
+        ResultadoAtaque de cada hoja ya está armado: la tirada solo elige cuál.
+        """
+        arbol, resultados = self._ataques[habilidad]
+        return resultados[arbol.indice(self.rng_arbol.random())]
+
+    def _preparar_tablas(self):
+        """
+        Arma, por habilidad, un ResultadoAtaque por hoja de su árbol (mismo daño que
+        ArbolAtaque.empaquetar). Se rehace solo si cambió el árbol por defecto.
+        """
+        self._arbol_tablas = self.arbol
+        self._ataques = {}
+        self._opciones = {}
+        for habilidad in list(self.basicos.values()) + self.p1.habilidades + self.p2.habilidades:
+            arbol = habilidad.arbol if habilidad.arbol is not None else self.arbol
+            self._ataques[habilidad] = (arbol, tuple(ArbolAtaque.empaquetar(hoja, habilidad.dano)
+                                                     for hoja in arbol.hojas))
+
+    def elegir_estrategia(self):
+        """
+        Igual que GrafoEstrategia.seleccionar_siguiente_ataque, pero la tirada pasa por
+        elegir_ponderado() para que todo el azar del simulador tenga un solo punto de entrada.
+        """
+        grafo = self.cerebro_estrategia
+        destinos, pesos_acumulados, _, _ = grafo.opciones_decision(self.jefe)
+        seleccion = self.elegir_ponderado(destinos, pesos_acumulados) if destinos else "A"
+        grafo.nodo_actual = seleccion
+        return grafo.nodos[seleccion]
+
+    # ==========================================
+    # CICLO DEL COMBATE
+    # ==========================================
+    def reiniciar(self):
+        """Deja a todos como al inicio de una partida nueva."""
+        for p in (self.p1, self.p2, self.jefe):
+            p.vida_actual = p.vida_max
+            p.energia_actual = p.energia_max
+            p.pila_escudo = []
+            p.turnos_quemado = 0
+            p.turnos_motivado = 0
+            p.estado_actual = "Normal"
+        # Se vuelve a pedir el árbol por si alguien cambió las probabilidades en config.
+        self.arbol = ArbolAtaque.compilado_base()
+        if self.arbol is not self._arbol_tablas:
+            self._preparar_tablas()
+        self.jefe.st = 0
+        self.jefe.turnos_buff_ataque = 0
+        self.jefe.turnos_buff_defensa = 0
+        self.cerebro_comportamiento.estado_actual = "NORMAL"
+        self.cerebro_estrategia.nodo_actual = "A"
+        self.dano_causado = 0
+        self.dano_recibido = 0
+
+    def simular(self, semilla=None):
+        """
+        Juega un combate completo y devuelve un ResultadoSimulacion.
+        El orden de turnos es el mismo que en main.py: un soldado, el jefe, el otro soldado...
+        Con 'semilla' se re-siembran todos los flujos: la misma semilla repite el combate.
+        """
+        if semilla is not None:
+            self.azar.sembrar(semilla)
+        self.reiniciar()
+        turno_jugador = True
+        indice_turno = 0
+        turnos = 0
+        ganador = None
+
+        while ganador is None:
+            if turnos >= self.max_turnos:
+                ganador = "EMPATE"
+                break
+            ganador, turno_jugador, indice_turno = self.jugar_paso(turno_jugador, indice_turno)
+            turnos += 1
+
+        return ResultadoSimulacion(ganador, turnos, self.dano_causado, self.dano_recibido)
+
+    def jugar_paso(self, turno_jugador, indice_turno):
+        """
+        Juega UN turno (de un soldado o del jefe) y deja listo el siguiente.
+
+        Returns:
+            (ganador o None, turno_jugador siguiente, indice_turno siguiente)
+        """
+        if turno_jugador:
+            # --- TURNO DEL JUGADOR ---
+            self.turno_jugador(self.equipo[indice_turno])
+            return self.verificar_fin(), False, indice_turno
+
+        # --- TURNO DEL JEFE ---
+        self.turno_jefe()
+        ganador = self.verificar_fin()
+        if ganador:
+            return ganador, False, indice_turno
+
+        # --- CAMBIO DE SOLDADO ---
+        # Igual que en main: alterno y, si el que toca está muerto, salto al compañero.
+        indice_turno = (indice_turno + 1) % 2
+        if not self.equipo[indice_turno].esta_vivo():
+            indice_turno = (indice_turno + 1) % 2
+        self.equipo[indice_turno].recuperar_energia_turno()
+        return None, True, indice_turno
+
+    def simular_lote(self, cantidad):
+        """
+        Juega 'cantidad' combates seguidos y devuelve un resumen en un diccionario.
+        """
+        victorias = 0
+        turnos_totales = 0
+        for _ in range(cantidad):
+            resultado = self.simular()
+            if resultado.gano: victorias += 1
+            turnos_totales += resultado.turnos
+
+        return {
+            "combates": cantidad,
+            "victorias": victorias,
+            "tasa_victoria": victorias / cantidad if cantidad else 0.0,
+            "turnos_promedio": turnos_totales / cantidad if cantidad else 0.0,
+        }
+
+    def verificar_fin(self):
+        """Mismo criterio que la sección B de main.py (la derrota tiene prioridad)."""
+        if self.p1.vida_actual <= 0 and self.p2.vida_actual <= 0:
+            return "JEFE"
+        if self.jefe.vida_actual <= 0:
+            return "JUGADORES"
+        return None
+
+    def _contar_perdida(self, objetivo, perdida):
+        """Lleva la cuenta de la vida realmente perdida por cada bando."""
+        if objetivo is self.jefe:
+            self.dano_causado += perdida
+        else:
+            self.dano_recibido += perdida
+
+    # ==========================================
+    # REGLAS (LAS DE reglas.py, SIN ANIMACIONES)
+    # ==========================================
+    def procesar_efectos_pasivos(self, personaje):
+        """
+        Quemaduras, sangrados y aturdimiento al inicio del turno.
+        Devuelve True si el personaje pierde el turno.
+        """
+        resultado = reglas.efectos_pasivos(personaje)
+        if resultado.perdida:
+            self._contar_perdida(personaje, resultado.perdida)
+        return resultado.pierde_turno
+
+    def opciones_jugador(self, atacante):
+        """
+        Habilidades que el soldado puede pagar ahora mismo (el Golpe Táctico siempre),
+        como tupla. Solo dependen de la energía y de si está motivado, así que cada
+        combinación se arma una vez y se reutiliza (las políticas no deben modificarla).
+        """
+        motivado = atacante.turnos_motivado > 0
+        clave = (atacante, atacante.energia_actual, motivado)
+        opciones = self._opciones.get(clave)
+        if opciones is None:
+            opciones = [self.basicos[atacante]]
+            for h in atacante.habilidades:
+                costo_real = h.costo // 2 if motivado else h.costo
+                if atacante.energia_actual >= costo_real:
+                    opciones.append(h)
+            opciones = self._opciones[clave] = tuple(opciones)
+        return opciones
+
+    def turno_jugador(self, atacante):
+        # Un soldado caído (por ejemplo, por su propia quemadura) simplemente pasa.
+        if atacante.vida_actual <= 0:
+            return
+        if self.procesar_efectos_pasivos(atacante):
+            return
+        if atacante.vida_actual <= 0:
+            return
+
+        habilidad = self.politica(atacante, self.opciones_jugador(atacante), self)
+        if atacante.gastar_energia(habilidad.costo):
+            self.ejecutar_habilidad(atacante, self.jefe, habilidad)
+
+    def ejecutar_habilidad(self, atacante, defensor, habilidad):
+        """Misma regla que ControladorCombate.ejecutar_habilidad (reglas.resolver_habilidad)."""
+        resultado = reglas.resolver_habilidad(atacante, defensor, habilidad, self.p1, self.p2,
+                                              self.grafo_efectos, tirar_arbol=self.tirar_arbol)
+        if resultado.perdida:
+            self._contar_perdida(resultado.objetivo, resultado.perdida)
+
+    # ==========================================
+    # TURNO DEL JEFE (MISMA REGLA QUE main.py, SECCIÓN D)
+    # ==========================================
+    def turno_jefe(self):
+        jefe = self.jefe
+        if self.procesar_efectos_pasivos(jefe):
+            return
+        # Si murió desangrado o quemado, main.py declara la victoria antes de que actúe.
+        if not jefe.esta_vivo():
+            return
+
+        resultado = reglas.turno_jefe(jefe, self.equipo, self.cerebro_comportamiento,
+                                      self._elegir_nodo, self._elegir_objetivo, self.grafo_efectos)
+        if resultado.perdida:
+            self._contar_perdida(resultado.objetivo, resultado.perdida)
+
+    def _elegir_nodo(self, jefe):
+        return self.elegir_estrategia()
+
+    def _elegir_objetivo(self, candidatos):
+        return self.elegir(candidatos, self.rng_objetivo)
+
+if __name__ == "__main__":
+    simulador = SimuladorCombate()
+    cantidad = 10000
+
+    inicio = time.perf_counter()
+    resumen = simulador.simular_lote(cantidad)
+    duracion = time.perf_counter() - inicio
+
+    print(f"Combates simulados: {resumen['combates']}")
+    print(f"Tasa de victoria:   {resumen['tasa_victoria'] * 100:.1f}%")
+    print(f"Turnos promedio:    {resumen['turnos_promedio']:.1f}")
+    print(f"Velocidad:          {cantidad / duracion:,.0f} combates/s")
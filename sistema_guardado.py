@@ -10,6 +10,7 @@ SECCIÓN / LÓGICA        | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
 -----------------------------------------------------------------------------------------
 1. ARCHIVO              | NOMBRE_ARCHIVO        | Define el nombre del fichero en disco.
                         |                       | (Por defecto: "partida_guardada.json").
+                        | SistemaGuardado(ruta) | - Otra ruta solo para esa instancia.
 -----------------------------------------------------------------------------------------
 2. ESTRUCTURA GENERAL   | guardar_partida()     | Crea el esqueleto del JSON.
    (El Diccionario)     | - "global": {...}     | - Si agregas variables globales (ej.
@@ -36,8 +37,9 @@ SECCIÓN / LÓGICA        | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
 NOMBRE_ARCHIVO = "partida_guardada.json"
 
 class SistemaGuardado:
-    def __init__(self):
-        pass
+    def __init__(self, ruta=NOMBRE_ARCHIVO):
+        # Ruta del archivo de guardado. Se puede cambiar (ej. un archivo temporal en pruebas).
+        self.ruta = ruta
 
     def guardar_partida(self, p1, p2, jefe, es_turno_jugador, indice_personaje_actual):
         """
@@ -55,7 +57,7 @@ class SistemaGuardado:
         }
 
         try:
-            with open(NOMBRE_ARCHIVO, "w") as archivo:
+            with open(self.ruta, "w") as archivo:
                 json.dump(datos_a_guardar, archivo, indent=4)
             print("Partida guardada exitosamente.")
             return True
@@ -67,11 +69,11 @@ class SistemaGuardado:
         """
         Lee el archivo JSON y devuelve el diccionario de datos.
         """
-        if not os.path.exists(NOMBRE_ARCHIVO):
+        if not os.path.exists(self.ruta):
             return None
         
         try:
-            with open(NOMBRE_ARCHIVO, "r") as archivo:
+            with open(self.ruta, "r") as archivo:
                 return json.load(archivo)
         except Exception as e:
             print(f"Error al cargar: {e}")
@@ -129,9 +131,9 @@ class SistemaGuardado:
         """
         Elimina el archivo de guardado si existe (para Game Over o Victoria).
         """
-        if os.path.exists(NOMBRE_ARCHIVO):
+        if os.path.exists(self.ruta):
             try:
-                os.remove(NOMBRE_ARCHIVO)
+                os.remove(self.ruta)
                 print("Archivo de guardado eliminado.")
             except Exception as e:
                 print(f"No se pudo borrar el archivo: {e}")
\ No newline at end of file
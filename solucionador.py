@@ -0,0 +1,282 @@
+import time
+from array import array
+import numpy as np
+from estructuras import ArbolAtaque
+from simulador import SimuladorCombate
+
+"""
+SOLUCIONADOR EXACTO (CADENA DE MARKOV DEL COMBATE)
+
+GUÍA RÁPIDA DE MODIFICACIÓN (ANÁLISIS DE DIFICULTAD):
+-----------------------------------------------------------------------------------------
+CLASE / LÓGICA          | MÉTODO / VARIABLE     | ACCIÓN / CÓMO MODIFICAR
+-----------------------------------------------------------------------------------------
+1. ESTADO DEL COMBATE   | clave_estado()        | Tupla plana con lo que leen las reglas:
+                        |                       | turno, vida, energía, estado, escudos,
+                        |                       | motivación, estrés, buffs, humor, nodo.
+                        |                       | - Lo que nunca cambia (energía,
+                        |                       |   motivación y escudos del jefe) queda
+                        |                       |   fuera y restaurar() lo repone.
+                        |                       | - Si agregas un atributo que cambie
+                        |                       |   las reglas, agrégalo aquí también.
+-----------------------------------------------------------------------------------------
+2. RAMAS DE UN TURNO    | SimuladorEnumerado    | Corre el MISMO jugar_paso() del
+   (Sin copiar reglas)  |                       | simulador, pero cada punto de azar
+                        |                       | recorre todas sus opciones.
+-----------------------------------------------------------------------------------------
+3. CADENA ABSORBENTE    | explorar()            | Numera los estados alcanzables y guarda
+                        | - max_estados         | las ramas en arreglos (origen, destino,
+                        |                       | probabilidad). Tope de memoria:
+                        |                       | MemoryError.
+                        | resolver()            | numpy itera v = b + P·v hasta que no
+                        | - tolerancia          | cambie: b es la probabilidad de ganar
+                        | - max_iteraciones     | en ese turno (o 1 para los turnos).
+                        |                       | Sin converger: RuntimeError.
+-----------------------------------------------------------------------------------------
+4. ALCANCE              | vida_jefe,            | SOLO variantes con vidas chicas. La
+   (Qué puede resolver) | vida_jugadores        | cadena crece con el producto de vidas,
+                        |                       | energías, estados, contadores, estrés,
+                        |                       | humor y nodo: el nivel real de
+                        |                       | NIVELES[0] no cabe y se mide con
+                        |                       | simulador.py (Monte Carlo).
+                        |                       | - Agrupar vida o energía en casillas
+                        |                       |   no sirve: repartir un valor entre
+                        |                       |   dos casillas abre más estados de los
+                        |                       |   que junta, y redondear sesga.
+-----------------------------------------------------------------------------------------
+"""
+
+class SimuladorEnumerado(SimuladorCombate):
+    """
+    Simulador que, en lugar de tirar dados, sigue un 'guion' de elecciones.
+
+    Cada vez que las reglas piden azar (elegir, elegir_ponderado, tirar_arbol) se toma
+    la siguiente opción del guion y se multiplica su probabilidad. Avanzando el guion
+    como un cuentakilómetros se recorren todas las ramas posibles de un turno.
+    """
+    # Tope de guiones por turno: un turno normal tiene unas decenas de ramas.
+    MAX_RAMAS = 100_000
+
+    def preparar_guion(self, guion):
+        self.guion = guion
+        self.aridades = []      # Cuántas opciones hubo en cada punto de decisión.
+        self.posicion = 0
+        self.probabilidad = 1.0
+
+    def _decidir(self, probabilidades):
+        """Devuelve el índice elegido por el guion (ignorando opciones imposibles)."""
+        posibles = [i for i, p in enumerate(probabilidades) if p > 0.0]
+        if self.posicion == len(self.guion):
+            self.guion.append(0)
+        k = posibles[self.guion[self.posicion]]
+        self.aridades.append(len(posibles))
+        self.posicion += 1
+        self.probabilidad *= probabilidades[k]
+        return k
+
+    def elegir(self, opciones, rng=None):
+        n = len(opciones)
+        return opciones[self._decidir([1.0 / n] * n)]
+
+    def elegir_ponderado(self, opciones, pesos_acumulados, rng=None):
+        total = pesos_acumulados[-1]
+        anterior = 0.0
+        probabilidades = []
+        for acumulado in pesos_acumulados:
+            probabilidades.append((acumulado - anterior) / total)
+            anterior = acumulado
+        return opciones[self._decidir(probabilidades)]
+
+    def tirar_arbol(self, habilidad):
+        arbol = habilidad.arbol if habilidad.arbol is not None else self.arbol
+        hoja = arbol.hojas[self._decidir(arbol.probabilidades)]
+        return ArbolAtaque.empaquetar(hoja, habilidad.dano)
+
+    # ==========================================
+    # FOTO DEL ESTADO
+    # ==========================================
+    def clave_estado(self, turno_jugador, indice_turno):
+        """
+        Tupla plana e inmutable (hasheable) con lo que leen las reglas:
+        (turno, índice, 6 campos de p1, 6 de p2, 6 del jefe, humor, nodo).
+        """
+        j = self.jefe
+        # El estrés solo sube y GrafoEstados solo mira si llegó a 80: desde ahí en
+        # adelante todos los valores se comportan igual, así que se agrupan en st_max.
+        st = j.st if j.st < 80 else j.st_max
+        # El jefe no tiene habilidades: su energía, motivación y escudos nunca cambian.
+        quemado = j.turnos_quemado if j.estado_actual == "Quemado" else 0
+        return ((turno_jugador, indice_turno)
+                + self._clave_personaje(self.p1)
+                + self._clave_personaje(self.p2)
+                + (j.vida_actual, j.estado_actual, quemado, st,
+                   j.turnos_buff_ataque, j.turnos_buff_defensa,
+                   self.cerebro_comportamiento.estado_actual,
+                   self.cerebro_estrategia.nodo_actual))
+
+    @staticmethod
+    def _clave_personaje(p):
+        # turnos_quemado solo se lee estando Quemado (y se reinicia al quemarse de
+        # nuevo): fuera de ese estado todos los valores son el mismo estado real.
+        quemado = p.turnos_quemado if p.estado_actual == "Quemado" else 0
+        return (p.vida_actual, p.energia_actual, p.estado_actual,
+                quemado, p.turnos_motivado, len(p.pila_escudo))
+
+    def restaurar(self, clave):
+        """Lo inverso de clave_estado(): deja las entidades exactamente en esa foto."""
+        self._restaurar_personaje(self.p1, clave[2:8])
+        self._restaurar_personaje(self.p2, clave[8:14])
+        j = self.jefe
+        (j.vida_actual, j.estado_actual, j.turnos_quemado, j.st,
+         j.turnos_buff_ataque, j.turnos_buff_defensa) = clave[14:20]
+        j.energia_actual = j.energia_max
+        j.turnos_motivado = 0
+        j.pila_escudo = []
+        self.cerebro_comportamiento.estado_actual = clave[20]
+        self.cerebro_estrategia.nodo_actual = clave[21]
+        return clave[0], clave[1]
+
+    @staticmethod
+    def _restaurar_personaje(p, c):
+        p.vida_actual, p.energia_actual, p.estado_actual, p.turnos_quemado, p.turnos_motivado, escudos = c
+        p.pila_escudo = ["Capa de Energía"] * escudos
+
+    def ramas(self, clave):
+        """
+        Todas las continuaciones de un turno desde 'clave'.
+        Devuelve una lista de (probabilidad, ganador o None, clave siguiente).
+        """
+        resultado = {}
+        guion = []
+        for _ in range(self.MAX_RAMAS):
+            turno_jugador, indice_turno = self.restaurar(clave)
+            self.preparar_guion(guion)
+            ganador, turno_sig, indice_sig = self.jugar_paso(turno_jugador, indice_turno)
+            destino = ganador if ganador else self.clave_estado(turno_sig, indice_sig)
+            resultado[destino] = resultado.get(destino, 0.0) + self.probabilidad
+
+            # Avanzamos el guion como un cuentakilómetros (la última decisión primero).
+            guion = guion[:self.posicion]
+            while guion and guion[-1] + 1 >= self.aridades[len(guion) - 1]:
+                guion.pop()
+            if not guion:
+                break
+            guion[-1] += 1
+        else:
+            raise RuntimeError(f"Más de {self.MAX_RAMAS} ramas en un solo turno; "
+                               "¿la política decide fuera de simulador.elegir()?")
+
+        return [(p, d if isinstance(d, str) else None, None if isinstance(d, str) else d)
+                for d, p in resultado.items()]
+
+
+class SolucionadorExacto:
+    """
+    Calcula la probabilidad exacta de ganar y los turnos esperados de un nivel,
+    tratando el combate como una cadena de Markov absorbente sobre sus estados
+    alcanzables (absorbentes: gana el equipo o gana el jefe).
+
+    Solo cabe con vidas reducidas ('vida_jefe' / 'vida_jugadores'): el nivel real
+    tiene demasiados estados y termina en MemoryError (ver GUÍA, punto 4).
+
+    La política de los jugadores debe decidir a través de simulador.elegir() (como
+    politica_aleatoria) para que sus opciones también se recorran como ramas.
+    """
+    def __init__(self, nivel=0, politica=None, tolerancia=1e-12, max_estados=2_000_000,
+                 max_iteraciones=10_000, vida_jefe=None, vida_jugadores=None):
+        self.simulador = SimuladorEnumerado(nivel, politica, vida_jefe=vida_jefe, vida_jugadores=vida_jugadores)
+        self.tolerancia = tolerancia
+        self.max_estados = max_estados
+        self.max_iteraciones = max_iteraciones
+        # Estados numerados (el inicial es el 0) y sus ramas en arreglos planos:
+        # la rama k va de origen[k] a destino[k] con probabilidad[k].
+        self.indices = {}
+        self.origen = array('q')
+        self.destino = array('q')
+        self.probabilidad = array('d')
+        self.victoria_directa = array('d')  # P(ganar en el próximo turno) de cada estado.
+
+    def explorar(self):
+        """Numera todos los estados alcanzables y guarda sus ramas. Devuelve cuántos son."""
+        sim = self.simulador
+        sim.reiniciar()
+        claves = [sim.clave_estado(True, 0)]
+        self.indices = {claves[0]: 0}
+        self.victoria_directa.append(0.0)
+
+        i = 0
+        while i < len(claves):
+            for p, ganador, destino in sim.ramas(claves[i]):
+                if destino is None:
+                    if ganador == "JUGADORES":
+                        self.victoria_directa[i] += p
+                    continue
+                j = self.indices.get(destino)
+                if j is None:
+                    j = self.indices[destino] = len(claves)
+                    claves.append(destino)
+                    self.victoria_directa.append(0.0)
+                self.origen.append(i)
+                self.destino.append(j)
+                self.probabilidad.append(p)
+            if len(claves) > self.max_estados:
+                raise MemoryError(f"Más de {self.max_estados} estados alcanzables; "
+                                  "prueba con un nivel más chico o sube max_estados.")
+            i += 1
+        return len(claves)
+
+    def resolver(self):
+        """
+        Devuelve un diccionario con 'prob_victoria', 'turnos_esperados', 'estados'
+        y 'pasadas'.
+
+        Con P (ramas entre estados) y b (victoria directa), la probabilidad de ganar
+        cumple v = b + P·v y los turnos esperados t = 1 + P·t. Se itera desde cero
+        con numpy hasta que ninguna de las dos cambie más que 'tolerancia' (como
+        mucho max_iteraciones veces; si no, RuntimeError).
+        """
+        n = self.explorar()
+        origen = np.frombuffer(self.origen, dtype=np.int64)
+        destino = np.frombuffer(self.destino, dtype=np.int64)
+        probabilidad = np.frombuffer(self.probabilidad, dtype=np.float64)
+        victoria_directa = np.frombuffer(self.victoria_directa, dtype=np.float64)
+
+        victoria = np.zeros(n)
+        turnos = np.zeros(n)
+        for pasadas in range(1, self.max_iteraciones + 1):
+            victoria_nueva = victoria_directa + np.bincount(origen, probabilidad * victoria[destino], n)
+            turnos_nuevos = 1.0 + np.bincount(origen, probabilidad * turnos[destino], n)
+            cambio = max(np.abs(victoria_nueva - victoria).max(), np.abs(turnos_nuevos - turnos).max())
+            victoria, turnos = victoria_nueva, turnos_nuevos
+            if cambio <= self.tolerancia:
+                break
+        else:
+            raise RuntimeError(f"No convergió en {self.max_iteraciones} pasadas "
+                               f"(último cambio {cambio:.3g}); sube max_iteraciones o la tolerancia.")
+
+        return {
+            "prob_victoria": float(victoria[0]),
+            "turnos_esperados": float(turnos[0]),
+            "estados": n,
+            "pasadas": pasadas,
+        }
+
+
+if __name__ == "__main__":
+    # El nivel completo no cabe en memoria (GUÍA, punto 4), así que la demo usa vidas
+    # reducidas. Con las mismas vidas, el simulador Monte Carlo debería dar casi lo mismo.
+    VIDA_REDUCIDA = 10
+
+    inicio = time.perf_counter()
+    solucion = SolucionadorExacto(vida_jefe=VIDA_REDUCIDA, vida_jugadores=VIDA_REDUCIDA).resolver()
+    duracion = time.perf_counter() - inicio
+
+    simulador = SimuladorCombate(vida_jefe=VIDA_REDUCIDA, vida_jugadores=VIDA_REDUCIDA)
+    print(f"Nivel: {simulador.jefe.nombre} (vidas reducidas a {VIDA_REDUCIDA})")
+    print(f"Estados alcanzables: {solucion['estados']:,} ({solucion['pasadas']} pasadas)")
+    print(f"P(victoria) exacta:  {solucion['prob_victoria'] * 100:.3f}%")
+    print(f"Turnos esperados:    {solucion['turnos_esperados']:.3f}")
+    print(f"Tiempo:              {duracion:.1f} s")
+
+    resumen = simulador.simular_lote(20000)
+    print(f"Monte Carlo (20000): {resumen['tasa_victoria'] * 100:.3f}% / {resumen['turnos_promedio']:.3f} turnos")
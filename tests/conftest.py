@@ -0,0 +1,25 @@
+import os
+
+# Sin ventana ni audio de verdad: las pruebas de dibujo corren en cualquier máquina.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+import config
+
+"""
+CONFIGURACIÓN COMÚN DE LAS PRUEBAS
+
+- pantalla: pygame iniciado y ventana "dummy" del tamaño del juego (convert y
+  convert_alpha la necesitan, GestorGrafico también las fuentes).
+"""
+
+
+@pytest.fixture(scope="session")
+def pantalla():
+    pygame.init()
+    superficie = pygame.display.set_mode((config.ANCHO, config.ALTO))
+    yield superficie
+    pygame.quit()
@@ -0,0 +1,120 @@
+import pytest
+
+import config
+from animaciones import Impacto, LineaTiempo, Pausa, Proyectil
+from entidades import Boss, Personaje
+
+"""
+PRUEBAS DE animaciones.py (COLA, VELOCIDAD Y FOTOS DE LA ESCENA)
+
+Correr con:  python -m pytest -q
+"""
+
+
+def combatientes():
+    p1 = Personaje(config.P1_NOMBRE, 100, config.P1_ATAQUE, 100, config.HABILIDADES_P1)
+    p2 = Personaje(config.P2_NOMBRE, 100, config.P2_ATAQUE, 100, config.HABILIDADES_P2)
+    jefe = Boss("Jefe", 100, 15, 100, [])
+    return p1, p2, jefe
+
+
+def test_lo_que_sobra_de_un_trabajo_pasa_al_siguiente():
+    linea = LineaTiempo()
+    primera, segunda = linea.agregar(Pausa(100)), linea.agregar(Pausa(100))
+    linea.avanzar(60)
+    assert linea.actual is primera and primera.transcurrido == 60
+    linea.avanzar(70)  # 40 terminan la primera y 30 van a la segunda.
+    assert linea.actual is segunda and segunda.transcurrido == 30
+    linea.avanzar(500)  # Un frame larguísimo no deja nada colgado.
+    assert not linea.ocupada
+
+
+def test_trabajos_de_duracion_cero_no_ocupan_un_frame():
+    linea = LineaTiempo()
+    linea.agregar(Pausa(50))
+    linea.agregar(Pausa(0))
+    linea.agregar(Pausa(0))
+    ultima = linea.agregar(Pausa(50))
+    linea.avanzar(50)
+    assert linea.actual is ultima and ultima.transcurrido == 0
+    assert len(linea.trabajos) == 1
+
+    solo_cero = LineaTiempo()
+    solo_cero.agregar(Pausa(0))
+    solo_cero.avanzar(0)
+    assert not solo_cero.ocupada
+
+
+@pytest.mark.parametrize("velocidad, dt, esperado", [(1.0, 40, 40), (2.0, 40, 80), (0.5, 40, 20)])
+def test_la_velocidad_escala_el_tiempo(velocidad, dt, esperado):
+    linea = LineaTiempo(velocidad)
+    proyectil = linea.agregar(Proyectil("log", (0, 0), (100, 0), "proy_disparo", duracion=400))
+    linea.avanzar(dt)
+    assert proyectil.transcurrido == esperado
+    assert proyectil.posicion() == (100 * esperado / 400, 0)
+
+
+def test_velocidad_cero_vacia_la_cola_y_no_encola():
+    linea = LineaTiempo()
+    linea.agregar(Pausa(100))
+    linea.cambiar_velocidad(0)
+    assert not linea.ocupada
+    linea.agregar(Pausa(100))
+    assert not linea.ocupada
+
+    linea.cambiar_velocidad(-1)  # Negativa también cuenta como instantánea.
+    assert linea.instantanea
+
+
+def test_ciclar_velocidad_recorre_la_lista_y_limpia_en_cero():
+    linea = LineaTiempo(1.0)
+    velocidades = [1.0, 2.0, 0]
+    linea.agregar(Pausa(100))
+    assert linea.ciclar_velocidad(velocidades) == 2.0 and linea.ocupada
+    assert linea.ciclar_velocidad(velocidades) == 0 and not linea.ocupada
+    assert linea.ciclar_velocidad(velocidades) == 1.0
+
+    fuera_de_lista = LineaTiempo(3.0)
+    assert fuera_de_lista.ciclar_velocidad(velocidades) == 1.0
+
+
+def test_impacto_apunta_a_la_copia_de_su_objetivo():
+    p1, p2, jefe = combatientes()
+    linea = LineaTiempo()
+    linea.observar(p1, p2, jefe)
+    impacto = linea.agregar(Impacto("¡Auch!", jefe, "FUEGO"))
+
+    assert impacto.objetivo is not jefe
+    assert impacto.objetivo is impacto.foto[2]
+    assert impacto.foto[0] is not p1 and impacto.foto[1] is not p2
+
+
+def test_la_foto_no_cambia_si_cambian_los_vivos():
+    p1, p2, jefe = combatientes()
+    linea = LineaTiempo()
+    linea.observar(p1, p2, jefe)
+    trabajo = linea.agregar(Pausa(100))
+
+    jefe.vida_actual -= 40
+    jefe.estado_actual = "Quemado"
+    p1.pila_escudo.append(10)
+    foto_p1, _, foto_jefe = trabajo.foto
+    assert foto_jefe.vida_actual == 100
+    assert foto_jefe.estado_actual != "Quemado"
+    assert foto_p1.pila_escudo == []
+
+
+def test_foto_previa_se_usa_en_lugar_de_la_actual():
+    p1, p2, jefe = combatientes()
+    linea = LineaTiempo()
+    linea.observar(p1, p2, jefe)
+    previa = linea.foto()
+    jefe.vida_actual = 10  # Las reglas se resolvieron entre la foto y el encolado.
+    impacto = linea.agregar(Impacto("log", jefe, "CRITICO"), foto=previa)
+    assert impacto.foto is previa[1]
+    assert impacto.objetivo.vida_actual == 100
+
+
+def test_sin_observar_se_dibujan_los_vivos():
+    linea = LineaTiempo()
+    assert linea.agregar(Pausa(10)).foto is None
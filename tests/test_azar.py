@@ -0,0 +1,75 @@
+import pytest
+
+import azar
+from azar import ServicioAzar, FLUJO_ARBOL, FLUJO_ESTRATEGIA, FLUJO_OBJETIVO, FLUJO_JUGADOR
+from estructuras import ArbolAtaque
+from simulador import SimuladorCombate
+
+"""
+PRUEBAS DE azar.py (MISMA SEMILLA = MISMO COMBATE)
+
+Correr con:  python -m pytest -q
+"""
+
+
+def tiradas(servicio, nombre, cantidad=20):
+    generador = servicio.flujo(nombre)
+    return [generador.random() for _ in range(cantidad)]
+
+
+def test_flujos_no_dependen_del_orden_en_que_se_piden():
+    uno = ServicioAzar(42)
+    otro = ServicioAzar(42)
+    a = tiradas(uno, FLUJO_ARBOL)
+    otro.flujo(FLUJO_JUGADOR).random()  # Pedir y gastar otro flujo antes no cambia nada.
+    assert tiradas(otro, FLUJO_ARBOL) == a
+    assert tiradas(uno, FLUJO_ESTRATEGIA) != a
+
+
+def test_sembrar_reinicia_los_flujos_ya_entregados():
+    servicio = ServicioAzar(7)
+    generador = servicio.flujo(FLUJO_OBJETIVO)
+    primeras = [generador.random() for _ in range(5)]
+    servicio.sembrar(7)
+    assert [generador.random() for _ in range(5)] == primeras
+
+
+def test_semilla_global_repite_las_tiradas_del_arbol():
+    azar.sembrar(123)
+    primera = [ArbolAtaque.ejecutar_ataque(20).tipo for _ in range(50)]
+    azar.sembrar(123)
+    assert [ArbolAtaque.ejecutar_ataque(20).tipo for _ in range(50)] == primera
+
+
+def traza_combate(simulador, semilla):
+    """Juega un combate turno a turno y anota la foto de cada paso."""
+    simulador.azar.sembrar(semilla)
+    simulador.reiniciar()
+    traza = []
+    turno_jugador, indice_turno, ganador = True, 0, None
+    while ganador is None and len(traza) < simulador.max_turnos:
+        ganador, turno_jugador, indice_turno = simulador.jugar_paso(turno_jugador, indice_turno)
+        traza.append(tuple(
+            (p.vida_actual, p.energia_actual, p.estado_actual, len(p.pila_escudo))
+            for p in (simulador.p1, simulador.p2, simulador.jefe)
+        ) + (simulador.jefe.st, simulador.cerebro_estrategia.nodo_actual, ganador))
+    return traza
+
+
+@pytest.mark.parametrize("semilla", [0, 1, 2024])
+def test_misma_semilla_repite_el_combate_paso_a_paso(semilla):
+    primera = traza_combate(SimuladorCombate(), semilla)
+    # Otro simulador, con otro combate jugado antes: la semilla manda.
+    otro = SimuladorCombate()
+    otro.simular(semilla + 1)
+    assert traza_combate(otro, semilla) == primera
+
+
+def test_simular_con_semilla_da_el_mismo_resultado():
+    simulador = SimuladorCombate()
+    resultados = [simulador.simular(s) for s in range(30)]
+    repetidos = [simulador.simular(s) for s in range(30)]
+    clave = lambda r: (r.ganador, r.turnos, r.dano_causado, r.dano_recibido)
+    assert [clave(r) for r in repetidos] == [clave(r) for r in resultados]
+    # Y semillas distintas no dan todas el mismo combate.
+    assert len({clave(r) for r in resultados}) > 1
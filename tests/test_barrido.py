@@ -0,0 +1,53 @@
+import pytest
+
+import config
+from barrido import _correr_bloque, _resolver_ruta, aplicar_ajustes, barrer, cuadricula
+
+"""
+PRUEBAS DE barrido.py (RUTAS DE AJUSTE Y REPARTO ENTRE NÚCLEOS)
+
+Correr con:  python -m pytest -q
+"""
+
+
+def test_ruta_por_id_por_nombre_y_por_indice():
+    molotov = next(h for h in config.HABILIDADES_P1 if h["id"] == "h_molotov")
+    assert _resolver_ruta("HABILIDADES_P1.h_molotov.dano") == (molotov, "dano")
+    assert _resolver_ruta(f"HABILIDADES_P1.{molotov['nombre']}.dano") == (molotov, "dano")
+    assert _resolver_ruta("NIVELES.0.boss_vida") == (config.NIVELES[0], "boss_vida")
+    assert _resolver_ruta("PROB_ACIERTO") == (config, "PROB_ACIERTO")
+
+
+@pytest.mark.parametrize("ruta", ["HABILIDADES_P1.h_inexistente.dano", "NIVELES.0.no_existe"])
+def test_ruta_que_no_existe_da_keyerror(ruta):
+    antes = config.NIVELES[0].copy()
+    with pytest.raises(KeyError):
+        aplicar_ajustes({ruta: 1})
+    assert config.NIVELES[0] == antes
+
+
+def test_config_vuelve_a_su_valor_tras_una_excepcion():
+    vida = config.NIVELES[0]["boss_vida"]
+    acierto = config.PROB_ACIERTO
+    # Una vida que no es un número revienta dentro del bloque, con config ya ajustado.
+    tarea = (0, {"PROB_ACIERTO": 0.5, "NIVELES.0.boss_vida": "mucha"}, 5, "s", 0)
+    with pytest.raises(TypeError):
+        _correr_bloque(tarea)
+    assert config.NIVELES[0]["boss_vida"] == vida
+    assert config.PROB_ACIERTO == acierto
+
+
+def test_ajuste_a_medias_no_deja_config_cambiado():
+    acierto = config.PROB_ACIERTO
+    with pytest.raises(KeyError):
+        aplicar_ajustes({"PROB_ACIERTO": 0.5, "NIVELES.0.no_existe": 1})
+    assert config.PROB_ACIERTO == acierto
+
+
+def test_resultados_no_dependen_de_los_procesos():
+    puntos = cuadricula(**{"NIVELES.0.boss_vida": [60, 100]})
+    uno = barrer(puntos, combates=120, procesos=1, bloque=50, semilla=3)
+    dos = barrer(puntos, combates=120, procesos=2, bloque=50, semilla=3)
+    assert uno == dos
+    assert [r["combates"] for r in uno] == [120, 120]
+    assert uno[0]["tasa_victoria"] >= uno[1]["tasa_victoria"]
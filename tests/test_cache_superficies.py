@@ -0,0 +1,86 @@
+import os
+
+import pygame
+import pytest
+
+import cache_superficies
+from cache_superficies import CacheSuperficies
+
+"""
+PRUEBAS DE cache_superficies.py (HUELLA, IDA Y VUELTA, ESCRITURA ATÓMICA)
+
+Correr con:  python -m pytest -q
+"""
+
+
+def imagen(ruta, color, tamano=(4, 3)):
+    superficie = pygame.Surface(tamano, pygame.SRCALPHA)
+    superficie.fill(color)
+    pygame.image.save(superficie, str(ruta))
+    return str(ruta)
+
+
+def test_huella_cambia_con_contenido_tamano_y_version(tmp_path, monkeypatch):
+    cache = CacheSuperficies(str(tmp_path / "cache"))
+    roja = imagen(tmp_path / "a.png", (255, 0, 0, 255))
+    otra_roja = imagen(tmp_path / "b.png", (255, 0, 0, 255))
+    azul = imagen(tmp_path / "c.png", (0, 0, 255, 255))
+
+    base = cache.huella(roja, (8, 8))
+    assert cache.huella(otra_roja, (8, 8)) == base  # Depende del contenido, no del nombre.
+    assert cache.huella(azul, (8, 8)) != base
+    assert cache.huella(roja, (8, 9)) != base
+    monkeypatch.setattr(cache_superficies, "VERSION_FORMATO", cache_superficies.VERSION_FORMATO + 1)
+    assert cache.huella(roja, (8, 8)) != base
+
+
+def test_guardar_y_leer_devuelve_los_mismos_pixeles(tmp_path, pantalla):
+    cache = CacheSuperficies(str(tmp_path / "cache"))
+    ruta = imagen(tmp_path / "a.png", (10, 20, 30, 128))
+    tamano = (5, 2)
+
+    datos, huella = cache.leer(ruta, tamano)
+    assert datos is None and huella is not None
+    original = pygame.Surface(tamano, pygame.SRCALPHA)
+    original.fill((10, 20, 30, 128))
+    original.set_at((0, 0), (1, 2, 3, 4))
+    cache.guardar(huella, original)
+
+    datos, otra_huella = cache.leer(ruta, tamano)
+    assert otra_huella == huella
+    assert datos == pygame.image.tobytes(original, "RGBA")
+    superficie = cache.convertir(datos, tamano)
+    assert pygame.image.tobytes(superficie, "RGBA") == datos
+    assert cache.estadisticas() == {"aciertos": 1, "fallos": 0}
+
+
+def test_archivo_de_otro_largo_es_un_fallo(tmp_path, pantalla):
+    cache = CacheSuperficies(str(tmp_path / "cache"))
+    ruta = imagen(tmp_path / "a.png", (0, 0, 0, 255))
+    _, huella = cache.leer(ruta, (4, 4))
+    os.makedirs(cache.ruta)
+    with open(os.path.join(cache.ruta, huella), "wb") as archivo:
+        archivo.write(b"\0" * 10)
+    superficie, _ = cache.cargar(ruta, (4, 4))
+    assert superficie is None
+    assert cache.estadisticas() == {"aciertos": 0, "fallos": 1}
+
+
+def test_escritura_cortada_no_deja_archivo_a_medias(tmp_path, monkeypatch):
+    cache = CacheSuperficies(str(tmp_path / "cache"))
+    ruta = imagen(tmp_path / "a.png", (0, 255, 0, 255))
+    _, huella = cache.leer(ruta, (4, 3))
+
+    def corte(origen, destino):
+        raise OSError("disco lleno")
+    monkeypatch.setattr(cache_superficies.os, "replace", corte)
+    cache.guardar(huella, pygame.Surface((4, 3), pygame.SRCALPHA))
+
+    # Solo quedó el temporal: el nombre definitivo no existe, así que no hay acierto falso.
+    assert not os.path.exists(os.path.join(cache.ruta, huella))
+    assert cache.leer(ruta, (4, 3))[0] is None
+
+    monkeypatch.undo()
+    cache.guardar(huella, pygame.Surface((4, 3), pygame.SRCALPHA))
+    assert os.listdir(cache.ruta) == [huella]  # El temporal se renombró.
+    assert cache.leer(ruta, (4, 3))[0] is not None
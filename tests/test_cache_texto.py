@@ -0,0 +1,54 @@
+import pygame
+
+from graficos import CacheTexto
+
+"""
+PRUEBAS DE graficos.CacheTexto (TEXTOS YA RENDERIZADOS, LRU)
+
+Correr con:  python -m pytest -q
+"""
+
+
+class FuenteFalsa:
+    """Cuenta cuántas veces se rasteriza de verdad; cada render es una superficie nueva."""
+    def __init__(self):
+        self.renders = []
+
+    def render(self, texto, antialias, color):
+        self.renders.append((texto, color))
+        return pygame.Surface((len(texto) + 1, 1))
+
+
+def test_mismo_texto_devuelve_la_misma_superficie():
+    fuente = FuenteFalsa()
+    cache = CacheTexto()
+    primera = cache.render(fuente, "Hola", (255, 255, 255))
+    assert cache.render(fuente, "Hola", (255, 255, 255)) is primera
+    assert fuente.renders == [("Hola", (255, 255, 255))]
+    assert cache.estadisticas()["aciertos"] == 1
+
+
+def test_la_clave_incluye_fuente_texto_y_color():
+    fuente, otra_fuente = FuenteFalsa(), FuenteFalsa()
+    cache = CacheTexto()
+    base = cache.render(fuente, "Hola", (0, 255, 0))
+    assert cache.render(fuente, "Hola", (255, 0, 0)) is not base
+    assert cache.render(fuente, "Chau", (0, 255, 0)) is not base
+    assert cache.render(otra_fuente, "Hola", (0, 255, 0)) is not base
+    assert len(cache.superficies) == 4
+
+
+def test_sale_la_usada_hace_mas_tiempo():
+    fuente = FuenteFalsa()
+    cache = CacheTexto(capacidad=2)
+    a = cache.render(fuente, "a", (0, 0, 0))
+    cache.render(fuente, "b", (0, 0, 0))
+    assert cache.render(fuente, "a", (0, 0, 0)) is a  # 'a' pasa a ser la más reciente.
+    cache.render(fuente, "c", (0, 0, 0))              # Desaloja 'b', no 'a'.
+
+    assert [clave[1] for clave in cache.superficies] == ["a", "c"]
+    assert cache.render(fuente, "a", (0, 0, 0)) is a
+    renders_antes = len(fuente.renders)
+    cache.render(fuente, "b", (0, 0, 0))
+    assert len(fuente.renders) == renders_antes + 1
+    assert len(cache.superficies) == 2
@@ -0,0 +1,165 @@
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+import config
+from entidades import Boss
+from estructuras import ArbolAtaque, ArbolCompilado, GrafoEfectos, GrafoEstrategia, datos_arbol_ataque
+
+"""
+PRUEBAS DE estructuras.py (ÁRBOL DE ATAQUE, GRAFOS DE EFECTOS Y ESTRATEGIA)
+
+Correr con:  python -m pytest -q
+"""
+
+ARBOL_TRES_RAMAS = {
+    "nombre": "Tipo de golpe", "ramas": [
+        (1, {"nombre": "Rasguño", "resultado": ("NORMAL", "Rasguño", 0.5)}),
+        (2, {"nombre": "Golpe", "resultado": ("NORMAL", "Golpe", 1.0)}),
+        (1, {"nombre": "Nada", "resultado": ("FALLO", "Nada", 0)}),
+    ],
+}
+
+
+def masa_tabla_alias(arbol):
+    """Probabilidad que la tabla de alias le da a cada hoja (sin tirar dados)."""
+    masa = [0.0] * arbol.n
+    for i in range(arbol.n):
+        masa[i] += arbol.umbral[i] / arbol.n
+        masa[arbol.alias[i]] += (1.0 - arbol.umbral[i]) / arbol.n
+    return masa
+
+
+@pytest.mark.parametrize("datos", [datos_arbol_ataque(), ARBOL_TRES_RAMAS])
+def test_tabla_alias_reparte_la_misma_probabilidad_que_el_arbol(datos):
+    arbol = ArbolCompilado(datos)
+    assert masa_tabla_alias(arbol) == pytest.approx(arbol.probabilidades, abs=1e-12)
+
+
+def test_probabilidades_del_arbol_por_defecto_son_el_producto_del_camino():
+    distribucion = ArbolCompilado(datos_arbol_ataque()).distribucion()
+    assert distribucion["Crítico"] == pytest.approx(config.PROB_ACIERTO * config.PROB_CRITICO)
+    assert distribucion["Nada"] == pytest.approx((1 - config.PROB_ACIERTO) * (1 - config.PROB_TROPIEZO))
+
+
+def test_sorteo_con_alias_sigue_la_distribucion():
+    arbol = ArbolCompilado(ARBOL_TRES_RAMAS)
+    rng = random.Random(1234)
+    tiradas = 200_000
+    conteo = Counter(arbol.nombres[arbol.indice(rng.random())] for _ in range(tiradas))
+    for nombre, prob in arbol.distribucion().items():
+        assert conteo[nombre] / tiradas == pytest.approx(prob, abs=0.005)
+
+
+def test_recorrer_baja_por_nodos_de_varias_ramas():
+    arbol = ArbolAtaque(ARBOL_TRES_RAMAS, rng=random.Random(99))
+    tiradas = 50_000
+    conteo = Counter(arbol.recorrer(arbol.raiz)[1] for _ in range(tiradas))
+    assert conteo["Rasguño"] / tiradas == pytest.approx(0.25, abs=0.01)
+    assert conteo["Golpe"] / tiradas == pytest.approx(0.50, abs=0.01)
+    assert conteo["Nada"] / tiradas == pytest.approx(0.25, abs=0.01)
+
+
+@pytest.mark.parametrize("ramas", [[], [(0, {"nombre": "Nada", "resultado": ("FALLO", "Nada", 0)})]])
+def test_nodo_sin_peso_avisa_con_su_nombre(ramas):
+    datos = {"nombre": "Golpe vacío", "ramas": ramas}
+    with pytest.raises(ValueError, match="Golpe vacío"):
+        ArbolCompilado(datos)
+    with pytest.raises(ValueError, match="Golpe vacío"):
+        ArbolAtaque(datos, rng=random.Random(0))
+
+
+def eleccion_sin_memoria(grafo, boss, rng):
+    """La selección de siempre: Prim, scores y random.choices, sin nada memorizado."""
+    origen = grafo.nodo_actual
+    aristas_optimas = {(u, v) for u, v, _ in grafo.aplicar_prim(origen, boss)}
+    destinos = []
+    scores = []
+    for dest, peso in grafo.nodos[origen].conexiones.items():
+        if grafo.nodo_es_elegible(dest, boss):
+            score = 1.0 / (peso + 0.1)
+            if (origen, dest) in aristas_optimas:
+                score *= 2.0
+            destinos.append(dest)
+            scores.append(score)
+    if not destinos:
+        return "A"
+    return rng.choices(destinos, weights=scores)[0]
+
+
+@pytest.mark.parametrize("semilla", [1, 2, 3])
+def test_seleccion_memorizada_coincide_con_random_choices(semilla):
+    jefe = Boss("Jefe", 100, 15, 100, [])
+    grafo = GrafoEstrategia(rng=random.Random(semilla))
+    rng_referencia = random.Random(semilla)
+    variaciones = random.Random(semilla + 100)
+
+    for _ in range(500):
+        # Vidas al azar para pasar por todas las máscaras (curas, costo de Molotov+).
+        jefe.vida_actual = variaciones.choice([1, 5, 10, 11, 50, 99, 100])
+        esperado = eleccion_sin_memoria(grafo, jefe, rng_referencia)
+        assert grafo.seleccionar_siguiente_ataque(jefe).codigo == esperado
+        assert grafo.nodo_actual == esperado
+
+
+def test_conectar_invalida_las_decisiones_memorizadas():
+    jefe = Boss("Jefe", 100, 15, 100, [])
+    grafo = GrafoEstrategia(rng=random.Random(0))
+    destinos, pesos_antes, _, _ = grafo.opciones_decision(jefe)
+    assert grafo._cache_decisiones
+
+    # Un destino nuevo y un peso distinto deben verse en la siguiente consulta.
+    grafo.conectar("A", {"E": 1, "B": 50})
+    assert not grafo._cache_decisiones
+    destinos_despues, pesos_despues, _, opciones = grafo.opciones_decision(jefe)
+    assert "E" in destinos_despues and "E" not in destinos
+    assert pesos_despues != pesos_antes
+    peso_b = next(op["peso"] for op in opciones if op["nodo"] == "B")
+    assert peso_b == 50
+
+
+def casos_grafo_efectos(grafo):
+    """Todos los pares (estado, evento), más eventos que no tienen arista en ningún lado."""
+    eventos = {ev for adyacentes in grafo.lista_adyacencia.values() for ev in adyacentes}
+    eventos |= {"fisico", "CRITICO", "motivacion"}
+    return [(estado, evento) for estado in grafo.lista_adyacencia for evento in sorted(eventos)]
+
+
+def test_tabla_transiciones_coincide_con_el_grafo_de_textos():
+    grafo = GrafoEfectos()
+    tabla = grafo.compilar()
+    for estado, evento in casos_grafo_efectos(grafo):
+        destino = tabla.transicion(tabla.id_estado[estado], tabla.codificar_evento(evento))
+        assert tabla.estados[destino] == grafo.transicion(estado, evento)
+
+
+def test_agregar_arista_recompila_la_tabla():
+    grafo = GrafoEfectos()
+    antes = grafo.compilar()
+    grafo.agregar_arista("Escudo", "fuego", "Quemado")
+    tabla = grafo.compilar()
+    assert tabla is not antes
+    assert tabla.estados[tabla.transicion(tabla.id_estado["Escudo"], tabla.codificar_evento("fuego"))] == "Quemado"
+
+
+def test_aplicar_lote_coincide_con_transiciones_sueltas():
+    grafo = GrafoEfectos()
+    tabla = grafo.compilar()
+    casos = casos_grafo_efectos(grafo)
+    estados = [tabla.id_estado[e] for e, _ in casos]
+    eventos = [tabla.codificar_evento(ev) for _, ev in casos]
+    esperado = [tabla.id_estado[grafo.transicion(e, ev)] for e, ev in casos]
+
+    assert tabla.aplicar_lote(estados, eventos) == esperado
+    assert tabla.aplicar_lote(np.array(estados), np.array(eventos)).tolist() == esperado
+
+
+@pytest.mark.parametrize("evento", [3, np.int64(3), np.int32(3), np.intp(3)])
+def test_aplicar_lote_acepta_un_solo_evento_entero(evento):
+    tabla = GrafoEfectos().compilar()
+    estados = list(range(len(tabla.estados)))
+    esperado = [tabla.transicion(e, 3) for e in estados]
+    assert tabla.aplicar_lote(estados, evento) == esperado
+    assert tabla.aplicar_lote(np.array(estados), evento).tolist() == esperado
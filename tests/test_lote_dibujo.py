@@ -0,0 +1,72 @@
+import pygame
+
+from lote_dibujo import LoteDibujo, CAPA_FONDO, CAPA_TEXTO, CAPA_EFECTOS
+
+"""
+PRUEBAS DE lote_dibujo.py (ORDEN DE CAPAS, RECORTE Y DESCARTE)
+
+Correr con:  python -m pytest -q
+"""
+
+ROJO = (255, 0, 0, 255)
+VERDE = (0, 255, 0, 255)
+AZUL = (0, 0, 255, 255)
+
+
+def cuadro(color, tamano=(10, 10)):
+    superficie = pygame.Surface(tamano)
+    superficie.fill(color)
+    return superficie
+
+
+def test_capa_mas_alta_queda_encima_aunque_se_agregue_antes():
+    destino = cuadro((0, 0, 0), (20, 20))
+    lote = LoteDibujo(destino)
+    lote.agregar(cuadro(ROJO), (0, 0), CAPA_EFECTOS)
+    lote.agregar(cuadro(AZUL), (0, 0), CAPA_FONDO)
+    assert lote.enviar() == 2
+    assert destino.get_at((5, 5)) == ROJO
+    assert lote.comandos == []
+
+
+def test_dentro_de_una_capa_se_respeta_el_orden():
+    destino = cuadro((0, 0, 0), (20, 20))
+    lote = LoteDibujo(destino)
+    lote.agregar(cuadro(ROJO), (0, 0), CAPA_TEXTO)
+    lote.agregar(cuadro(VERDE), (0, 0), CAPA_TEXTO)
+    lote.enviar()
+    assert destino.get_at((5, 5)) == VERDE
+
+
+def test_descarta_lo_que_no_toca_el_recorte():
+    destino = cuadro((0, 0, 0), (40, 40))
+    lote = LoteDibujo(destino)
+    lote.agregar(cuadro(ROJO), (0, 0))
+    lote.agregar(cuadro(VERDE), (25, 25))
+    # Área de origen: solo cuenta su tamaño (2x2), no el de la superficie entera.
+    lote.agregar(cuadro(AZUL), (12, 0), area=pygame.Rect(0, 0, 2, 2))
+
+    assert lote.enviar(recorte=(0, 0, 13, 13)) == 2
+    assert destino.get_at((5, 5)) == ROJO
+    assert destino.get_at((12, 0)) == AZUL
+    assert destino.get_at((13, 0)) == (0, 0, 0, 255)   # Fuera del recorte no se pinta.
+    assert destino.get_at((30, 30)) == (0, 0, 0, 255)
+    assert destino.get_clip() == destino.get_rect()    # El recorte no queda puesto.
+    assert lote.cerrar_frame() == {"envios": 1, "dibujos": 2, "descartados": 1}
+
+
+def test_sin_descarte_manda_todo():
+    destino = cuadro((0, 0, 0), (20, 20))
+    lote = LoteDibujo(destino)
+    lote.agregar(cuadro(ROJO), (0, 0))
+    lote.agregar(cuadro(VERDE), (100, 100))
+    assert lote.enviar(descartar=False) == 2
+    assert lote.cerrar_frame()["descartados"] == 0
+
+
+def test_nada_que_dibujar_no_cuenta_envio():
+    lote = LoteDibujo(cuadro((0, 0, 0), (20, 20)))
+    assert lote.enviar() == 0
+    lote.agregar(cuadro(ROJO), (50, 50))
+    assert lote.enviar() == 0
+    assert lote.cerrar_frame() == {"envios": 0, "dibujos": 0, "descartados": 1}
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from estructuras import ArbolAtaque, ArbolCompilado, datos_arbol_ataque
+from montecarlo import TIPOS_RESULTADO, muestrear_ataques, tablas_arbol
+
+"""
+PRUEBAS DE montecarlo.py (MUESTREO EN LOTE DEL ÁRBOL DE ATAQUE)
+
+Correr con:  python -m pytest -q
+"""
+
+ARBOL_TRES_RAMAS = {
+    "nombre": "Tipo de golpe", "ramas": [
+        (1, {"nombre": "Rasguño", "resultado": ("NORMAL", "Rasguño", 0.5)}),
+        (2, {"nombre": "Tropiezo", "resultado": ("TROPIEZO", "Tropiezo", 7)}),
+        (1, {"nombre": "Nada", "resultado": ("FALLO", "Nada", 0)}),
+    ],
+}
+
+
+def hojas_sorteadas(arbol, cantidad, semilla):
+    """Índice de hoja de cada tirada, con el mismo sorteo que muestrear_ataques."""
+    umbral, alias, _, _, _ = tablas_arbol(arbol)
+    u = np.random.default_rng(semilla).random(cantidad) * arbol.n
+    casilla = np.minimum(u.astype(np.intp), arbol.n - 1)
+    return np.where(u - casilla < umbral[casilla], casilla, alias[casilla])
+
+
+@pytest.mark.parametrize("datos", [datos_arbol_ataque(), ARBOL_TRES_RAMAS])
+def test_frecuencia_de_cada_hoja_sigue_las_probabilidades(datos):
+    arbol = ArbolCompilado(datos)
+    cantidad = 400_000
+    frecuencias = np.bincount(hojas_sorteadas(arbol, cantidad, 5), minlength=arbol.n) / cantidad
+    assert frecuencias == pytest.approx(arbol.probabilidades, abs=0.004)
+
+    # Y muestrear_ataques usa esas mismas hojas (mismo generador, mismos códigos).
+    codigos, _ = muestrear_ataques(20, cantidad, np.random.default_rng(5), arbol)
+    _, _, codigos_hoja, _, _ = tablas_arbol(arbol)
+    assert np.array_equal(codigos, codigos_hoja[hojas_sorteadas(arbol, cantidad, 5)])
+
+
+@pytest.mark.parametrize("datos", [datos_arbol_ataque(), ARBOL_TRES_RAMAS])
+@pytest.mark.parametrize("ataque", [0, 15, 33])
+def test_dano_coincide_con_empaquetar(datos, ataque):
+    arbol = ArbolCompilado(datos)
+    cantidad = 2_000
+    codigos, danos = muestrear_ataques(ataque, cantidad, np.random.default_rng(9), arbol)
+    hojas = hojas_sorteadas(arbol, cantidad, 9)
+    for codigo, dano, hoja in zip(codigos, danos, hojas):
+        esperado = ArbolAtaque.empaquetar(arbol.hojas[hoja], ataque)
+        assert TIPOS_RESULTADO[codigo] == esperado.tipo
+        assert dano == esperado.dano
+
+
+def test_tipo_de_hoja_desconocido_avisa():
+    arbol = ArbolCompilado({"nombre": "Raro", "ramas": [
+        (1, {"nombre": "Normal", "resultado": ("NORMAL", "ok", 1.0)}),
+        (1, {"nombre": "Veneno", "resultado": ("VENENO", "uy", 3)}),
+    ]})
+    with pytest.raises(ValueError, match="VENENO"):
+        muestrear_ataques(10, 5, np.random.default_rng(0), arbol)
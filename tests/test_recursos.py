@@ -0,0 +1,131 @@
+import pygame
+import pytest
+
+import config
+from recursos import RecursosPerezosos, bytes_superficie
+
+"""
+PRUEBAS DE recursos.py (PRESUPUESTO DE MEMORIA Y DESALOJO LRU)
+
+Correr con:  python -m pytest -q
+"""
+
+LADO = 8
+TAMANO = bytes_superficie(pygame.Surface((LADO, LADO)))
+
+
+def almacen(presupuesto_en_imagenes, fijas=(), desalojables=("a", "b", "c", "d")):
+    """Diccionario perezoso con superficies chicas; cada una ocupa TAMANO bytes."""
+    assets = RecursosPerezosos(int(presupuesto_en_imagenes * TAMANO))
+    for clave in fijas:
+        assets.diferir(clave, lambda crudo=None: pygame.Surface((LADO, LADO)), fija=True)
+    for clave in desalojables:
+        assets.diferir(clave, lambda crudo=None: pygame.Surface((LADO, LADO)), fija=False)
+    return assets
+
+
+def test_sale_la_usada_hace_mas_tiempo():
+    assets = almacen(2)
+    a = assets["a"]
+    assets["b"]
+    assert assets["a"] is a  # 'a' pasa a ser la más reciente.
+    assets["c"]              # Se pasa: sale 'b', no 'a'.
+
+    assert assets.cargada("a") and assets.cargada("c")
+    assert not assets.cargada("b")
+    assert list(assets.desalojables) == ["a", "c"]
+    assert assets.desalojos == 1
+    assert assets.bytes_totales() == 2 * TAMANO
+
+
+def test_lo_desalojado_se_vuelve_a_cargar_solo():
+    assets = almacen(1)
+    b = assets["b"]
+    assets["c"]
+    assert not assets.cargada("b")
+    otra_b = assets["b"]
+    assert otra_b is not b and assets.cargada("b")
+
+
+def test_las_fijas_nunca_salen():
+    assets = almacen(2, fijas=("f", "g"))
+    f, g = assets["f"], assets["g"]
+    assets["a"]
+    assets["b"]
+    assert assets["f"] is f and assets["g"] is g
+    assert not assets.cargada("a")  # La única que se podía desalojar.
+    assert assets.cargada("b")
+
+
+def test_la_recien_cargada_se_queda_aunque_no_quepa():
+    assets = almacen(0.5)
+    a = assets["a"]
+    assert assets.cargada("a")
+    assert assets.bytes_totales() > assets.presupuesto
+    assert assets["a"] is a
+    assert assets.desalojos == 0
+
+
+def test_sin_presupuesto_no_se_desaloja_nada():
+    assets = almacen(0)
+    for clave in "abcd":
+        assets[clave]
+    assert assets.desalojos == 0 and len(assets.desalojables) == 4
+
+
+def test_capas_derivadas_cuentan_y_se_encogen_al_final():
+    assets = almacen(3, fijas=("f",))
+    capas = {"velo": 2 * TAMANO}
+    llamadas = []
+
+    def encoger():
+        llamadas.append(list(assets.desalojables))
+        capas.clear()
+
+    assets.registrar_derivadas("capas", lambda: sum(capas.values()), encoger)
+    assets["f"]
+    assert assets.bytes_totales() == 3 * TAMANO and not llamadas
+    assets["a"]
+    # Primero se desaloja lo desalojable (aquí, nada más que la recién cargada),
+    # y solo entonces se encogen las capas.
+    assert llamadas == [["a"]]
+    assert assets.cargada("a") and assets.bytes_totales() == 2 * TAMANO
+
+
+def test_encoger_se_llama_una_vez_aunque_no_alcance():
+    assets = almacen(1, fijas=("f", "g"))
+    llamadas = []
+    assets.registrar_derivadas("capas", lambda: TAMANO, lambda: llamadas.append(1))
+    assets["f"]
+    assets["g"]
+    assets.ajustar()
+    assert assets.cargada("f") and assets.cargada("g")
+    assert len(llamadas) == 3  # Una por cada intento (f, g y ajustar), sin quedarse en bucle.
+
+
+def test_graficos_suelta_capas_que_no_se_usan(pantalla):
+    from entidades import Boss, Personaje
+    from graficos import GestorGrafico
+
+    motor = GestorGrafico(pantalla)
+    p1 = Personaje(config.P1_NOMBRE, 100, config.P1_ATAQUE, 100, config.HABILIDADES_P1)
+    p2 = Personaje(config.P2_NOMBRE, 100, config.P2_ATAQUE, 100, config.HABILIDADES_P2)
+    jefe = Boss("Jefe", 0, 15, 100, [])
+
+    motor.dibujar_menu()
+    motor.presentar()
+    motor.dibujar_menu_pausa(0, False)
+    motor.presentar()
+    motor.dibujar_interfaz(p1, p2, jefe, "log", sprite_p1_override=motor.assets["jugador1_dano"])
+    motor.dibujar_interfaz(p1, p2, jefe, "log")
+    motor.presentar()
+    motor.presentar()  # Un frame sin usar menú ni pausa.
+    assert {"menu", "pausa"} <= set(motor._capas_pantalla)
+    assert len(motor._capas_estaticas) == 2
+
+    # Presupuesto justo para lo que ya hay: armar la pantalla final obliga a encoger.
+    motor.assets.presupuesto = motor.assets.bytes_totales()
+    motor.dibujar_victoria(p1, p2, jefe)
+    assert set(motor._capas_pantalla) == {"victoria"}
+    assert len(motor._capas_estaticas) == 1
+    assert motor.assets.bytes_totales() <= motor.assets.presupuesto
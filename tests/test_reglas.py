@@ -0,0 +1,108 @@
+import pytest
+
+import config
+from animaciones import LineaTiempo
+from azar import ServicioAzar, FLUJO_ARBOL, FLUJO_ESTRATEGIA, FLUJO_OBJETIVO, FLUJO_JUGADOR
+from entidades import Personaje, Boss, Habilidad
+from estructuras import GrafoEfectos, GrafoEstados, GrafoEstrategia
+from simulador import SimuladorCombate
+from sistema_combate import ControladorCombate
+
+"""
+PRUEBAS DE reglas.py (EL JUEGO Y EL SIMULADOR JUEGAN LO MISMO)
+
+El juego (sistema_combate.ControladorCombate, como lo usa main.py) y el simulador
+llaman a las mismas reglas. Con la misma semilla, turno a turno, las dos partidas
+deben quedar en el mismo estado.
+
+Correr con:  python -m pytest -q
+"""
+
+
+def foto(p1, p2, jefe, nodo):
+    return tuple(
+        (p.vida_actual, p.energia_actual, p.estado_actual, p.turnos_quemado,
+         p.turnos_motivado, len(p.pila_escudo))
+        for p in (p1, p2, jefe)
+    ) + (jefe.st, jefe.turnos_buff_ataque, jefe.turnos_buff_defensa, nodo)
+
+
+def traza_simulador(semilla):
+    simulador = SimuladorCombate()
+    simulador.azar.sembrar(semilla)
+    simulador.reiniciar()
+    traza = []
+    turno_jugador, indice_turno, ganador = True, 0, None
+    while ganador is None and len(traza) < simulador.max_turnos:
+        ganador, turno_jugador, indice_turno = simulador.jugar_paso(turno_jugador, indice_turno)
+        traza.append(foto(simulador.p1, simulador.p2, simulador.jefe,
+                          simulador.cerebro_estrategia.nodo_actual))
+    return traza, ganador
+
+
+def traza_juego(semilla):
+    """
+    El mismo combate con las piezas de main.py: el ControladorCombate resuelve los
+    turnos y la política del simulador (elección uniforme) hace de jugador.
+    """
+    servicio = ServicioAzar(semilla)
+    rng_jugador = servicio.flujo(FLUJO_JUGADOR)
+    rng_objetivo = servicio.flujo(FLUJO_OBJETIVO)
+    datos_nivel = config.NIVELES[0]
+    p1 = Personaje(config.P1_NOMBRE, config.P1_VIDA_MAX, config.P1_ATAQUE, config.P1_ENERGIA_MAX, config.HABILIDADES_P1)
+    p2 = Personaje(config.P2_NOMBRE, config.P2_VIDA_MAX, config.P2_ATAQUE, config.P2_ENERGIA_MAX, config.HABILIDADES_P2)
+    jefe = Boss(datos_nivel["boss_nombre"], datos_nivel["boss_vida"], datos_nivel["boss_ataque"], 100, [])
+    equipo = [p1, p2]
+    atk_basico = Habilidad(config.DATO_BASICO)
+    cerebro_comportamiento = GrafoEstados()
+    cerebro_estrategia = GrafoEstrategia(servicio.flujo(FLUJO_ESTRATEGIA))
+    linea = LineaTiempo()
+    combate = ControladorCombate(GrafoEfectos(), None, rng=servicio.flujo(FLUJO_ARBOL), linea=linea)
+
+    traza = []
+    turno_jugador, indice_turno, ganador = True, 0, None
+    while ganador is None and len(traza) < 500:
+        if turno_jugador:
+            atacante = equipo[indice_turno]
+            if atacante.esta_vivo():
+                pierde_turno, _ = combate.procesar_efectos_pasivos(p1, p2, jefe, atacante)
+                if not pierde_turno and atacante.esta_vivo():
+                    # Tecla Q (el básico compartido con el daño del soldado) o una habilidad pagable.
+                    atk_basico.dano = atacante.ataque_base
+                    motivado = atacante.turnos_motivado > 0
+                    opciones = [atk_basico] + [
+                        h for h in atacante.habilidades
+                        if atacante.energia_actual >= (h.costo // 2 if motivado else h.costo)
+                    ]
+                    habilidad = rng_jugador.choice(opciones)
+                    if atacante.gastar_energia(habilidad.costo):
+                        combate.ejecutar_habilidad(atacante, jefe, habilidad, p1, p2, jefe)
+            turno_jugador = False
+        else:
+            pierde_turno, _ = combate.procesar_efectos_pasivos(p1, p2, jefe, jefe)
+            if not pierde_turno and jefe.esta_vivo():
+                combate.turno_jefe(jefe, equipo, cerebro_comportamiento, cerebro_estrategia, rng_objetivo)
+            if jefe.esta_vivo() and (p1.esta_vivo() or p2.esta_vivo()):
+                indice_turno = (indice_turno + 1) % 2
+                if not equipo[indice_turno].esta_vivo():
+                    indice_turno = (indice_turno + 1) % 2
+                equipo[indice_turno].recuperar_energia_turno()
+                turno_jugador = True
+
+        # Sección B de main.py: la derrota tiene prioridad.
+        if not p1.esta_vivo() and not p2.esta_vivo():
+            ganador = "JEFE"
+        elif jefe.vida_actual <= 0:
+            ganador = "JUGADORES"
+        traza.append(foto(p1, p2, jefe, cerebro_estrategia.nodo_actual))
+
+    # El controlador sí encoló animaciones: el combate pasó por sistema_combate.
+    assert linea.trabajos
+    return traza, ganador
+
+
+@pytest.mark.parametrize("semilla", [0, 7, 2024])
+def test_juego_y_simulador_quedan_igual_turno_a_turno(semilla):
+    traza, ganador = traza_juego(semilla)
+    assert traza_simulador(semilla) == (traza, ganador)
+    assert ganador in ("JUGADORES", "JEFE")
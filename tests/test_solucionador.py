@@ -0,0 +1,47 @@
+import pytest
+
+from simulador import SimuladorCombate
+from solucionador import SimuladorEnumerado, SolucionadorExacto
+
+"""
+PRUEBAS DE solucionador.py (CADENA DE MARKOV DEL COMBATE)
+
+Con vidas chicas la cadena se resuelve entera; el simulador Monte Carlo, con las
+mismas vidas, tiene que caer cerca (la tolerancia cubre el ruido del muestreo).
+
+Correr con:  python -m pytest -q
+"""
+
+VIDA_CHICA = 10
+
+
+def test_ramas_de_un_turno_suman_uno_y_restaurar_vuelve_a_la_foto():
+    sim = SimuladorEnumerado(vida_jefe=VIDA_CHICA, vida_jugadores=VIDA_CHICA)
+    sim.reiniciar()
+    clave = sim.clave_estado(True, 0)
+    ramas = sim.ramas(clave)
+    assert sum(p for p, _, _ in ramas) == pytest.approx(1.0)
+
+    for _, _, destino in ramas:
+        if destino is not None:
+            turno_jugador, indice_turno = sim.restaurar(destino)
+            assert sim.clave_estado(turno_jugador, indice_turno) == destino
+
+
+def test_resolver_coincide_con_simular_lote():
+    solucion = SolucionadorExacto(vida_jefe=VIDA_CHICA, vida_jugadores=VIDA_CHICA).resolver()
+    assert 0.0 < solucion["prob_victoria"] < 1.0
+
+    simulador = SimuladorCombate(vida_jefe=VIDA_CHICA, vida_jugadores=VIDA_CHICA)
+    simulador.azar.sembrar(11)
+    resumen = simulador.simular_lote(20000)
+    # Con 20000 combates el desvío de la tasa es ~0.003 y el de los turnos ~0.016
+    # (cada combate dura 3 ± 2.2 turnos): las tolerancias son unos 4 desvíos.
+    assert resumen["tasa_victoria"] == pytest.approx(solucion["prob_victoria"], abs=0.015)
+    assert resumen["turnos_promedio"] == pytest.approx(solucion["turnos_esperados"], abs=0.07)
+
+
+def test_sin_converger_avisa_en_vez_de_colgarse():
+    solucionador = SolucionadorExacto(vida_jefe=VIDA_CHICA, vida_jugadores=VIDA_CHICA, max_iteraciones=2)
+    with pytest.raises(RuntimeError):
+        solucionador.resolver()